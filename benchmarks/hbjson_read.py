@@ -0,0 +1,89 @@
+# coding=utf-8
+"""Benchmark the parsing of HBJSON files with each of the installed JSON backends.
+
+The Rooms of a test model are repeated to build larger HBJSON files, which are
+then parsed with the JSONStreamReader (as Model.from_hbjson does) using each
+JSON backend of honeybee.jsonutil. The time to load the Model from the file is
+also reported for the fastest backend and the json module since this includes
+the conversion of the parsed dictionaries to Python objects.
+
+Usage:
+
+.. code-block:: shell
+
+    python benchmarks/hbjson_read.py
+"""
+import os
+import io
+import json
+import time
+import tempfile
+
+from honeybee.hbjson import JSONStreamReader
+from honeybee.jsonutil import available_backends, set_json_backend
+from honeybee.model import Model
+
+MODEL_FILE = os.path.join(
+    os.path.dirname(__file__), '..', 'tests', 'json', 'model_with_adiabatic.hbjson')
+
+
+def write_test_file(copies, folder):
+    """Write a HBJSON with the Rooms of the test model repeated a number of times."""
+    with io.open(MODEL_FILE, encoding='utf-8') as inf:
+        data = json.load(inf)
+    rooms = data['rooms']
+    data['rooms'] = []
+    for i in range(copies):
+        for room in rooms:
+            room = dict(room)
+            room['identifier'] = '{}_{}'.format(room['identifier'], i)
+            data['rooms'].append(room)
+    file_path = os.path.join(folder, 'benchmark_{}.hbjson'.format(copies))
+    with io.open(file_path, 'w', encoding='utf-8') as outf:
+        outf.write(json.dumps(data, ensure_ascii=False))
+    return file_path, len(data['rooms'])
+
+
+def time_parse(file_path, repeat=5):
+    """Get the fastest time in seconds to parse the file with the stream reader."""
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        with io.open(file_path, encoding='utf-8') as inf:
+            reader = JSONStreamReader(inf)
+            for key, value in reader.members(('rooms',)):
+                if key == 'rooms':
+                    for _ in value:
+                        pass
+        times.append(time.time() - start)
+    return min(times)
+
+
+def time_load(file_path):
+    """Get the time in seconds to load a Model from the file."""
+    start = time.time()
+    Model.from_hbjson(file_path)
+    return time.time() - start
+
+
+if __name__ == '__main__':
+    backends = available_backends()
+    folder = tempfile.mkdtemp()
+    header = ['rooms', 'MB'] + ['{} (s)'.format(name) for name in backends]
+    print(''.join('{:>14}'.format(h) for h in header))
+    for copies in (1, 5, 20):
+        file_path, room_count = write_test_file(copies, folder)
+        row = [room_count, os.path.getsize(file_path) / 1e6]
+        for name in backends:
+            set_json_backend(name)
+            row.append(time_parse(file_path))
+        print('{:>14}{:>14.2f}'.format(*row[:2]) +
+              ''.join('{:>14.4f}'.format(t) for t in row[2:]))
+    print('\nModel.from_hbjson for {} rooms'.format(room_count))
+    for name in (backends[0], 'json'):
+        set_json_backend(name)
+        print('{:>14}{:>14.4f}'.format(name, time_load(file_path)))
+    set_json_backend()
+    for file_name in os.listdir(folder):
+        os.remove(os.path.join(folder, file_name))
+    os.rmdir(folder)
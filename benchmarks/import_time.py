@@ -0,0 +1,85 @@
+# coding=utf-8
+"""Benchmark the time to import honeybee with many packages on the Python path.
+
+Each import runs in a new interpreter with a temporary folder on the Python path
+that contains a number of dummy packages along with one dummy honeybee extension.
+The import with the cached extension index is compared to an import that scans
+the whole Python path and imports the extensions as was done before the index
+was added. The benchmark fails if the cached import is not faster than the scan
+or if the extension is imported before one of its attributes is used.
+
+Usage:
+
+.. code-block:: shell
+
+    python benchmarks/import_time.py
+"""
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+
+IMPORT_SCRIPT = '''
+import time
+import ladybug_geometry.geometry3d  # dependencies are not part of the benchmark
+import ladybug.color
+start = time.time()
+{}
+print(time.time() - start)
+'''
+CACHED = '''
+import sys
+import honeybee
+assert 'honeybee_dummy' not in sys.modules, 'Extension was imported eagerly.'
+'''
+SCAN = '''
+import pkgutil
+import importlib
+import honeybee
+for finder, name, ispkg in pkgutil.iter_modules():
+    if name.startswith('honeybee_') and name.count('_') == 1:
+        importlib.import_module(name)
+'''
+
+
+def make_packages(folder, count):
+    """Write a number of dummy packages and one dummy extension to a folder."""
+    for i in range(count):
+        pkg_folder = os.path.join(folder, 'package_{}'.format(i))
+        os.mkdir(pkg_folder)
+        open(os.path.join(pkg_folder, '__init__.py'), 'w').close()
+    with open(os.path.join(folder, 'honeybee_dummy.py'), 'w') as outf:
+        outf.write('import time\ntime.sleep(0.05)  # an extension with slow imports\n')
+
+
+def time_import(folder, home_folder, code, repeat=5):
+    """Get the fastest time in seconds to run the import code in a new interpreter."""
+    package_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join((folder, package_folder))
+    env['HOME'] = home_folder
+    times = []
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, '-c', IMPORT_SCRIPT.format(code)], env=env,
+            universal_newlines=True)
+        times.append(float(output.split()[-1]))
+    return min(times)
+
+
+if __name__ == '__main__':
+    print('{:>10} {:>16} {:>16}'.format('packages', 'cached (s)', 'scan (s)'))
+    for count in (100, 1000, 5000):
+        folder, home_folder = tempfile.mkdtemp(), tempfile.mkdtemp()
+        try:
+            make_packages(folder, count)
+            time_import(folder, home_folder, CACHED, 1)  # write the index
+            cached_time = time_import(folder, home_folder, CACHED)
+            scan_time = time_import(folder, home_folder, SCAN)
+        finally:
+            shutil.rmtree(folder)
+            shutil.rmtree(home_folder)
+        print('{:>10} {:16.4f} {:16.4f}'.format(count, cached_time, scan_time))
+        assert cached_time < scan_time, 'Importing honeybee with the cached ' \
+            'extension index is slower than scanning the Python path.'
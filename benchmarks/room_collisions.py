@@ -0,0 +1,59 @@
+# coding=utf-8
+"""Benchmark the scaling of Room.check_room_volume_collisions.
+
+The check is timed for square grids of box Rooms on a single floor with and
+without the sweep-and-prune broad phase. Without the broad phase, all pairs of
+Rooms are passed to the exact polygon test as was done before the broad
+phase was added.
+
+Usage:
+
+.. code-block:: shell
+
+    python benchmarks/room_collisions.py
+"""
+import time
+
+from ladybug_geometry.geometry3d import Point3D
+
+import honeybee.room as room_module
+from honeybee.room import Room
+
+
+def grid_rooms(count):
+    """Get a square grid of box Rooms with count Rooms along each side."""
+    return [Room.from_box('Room_{}_{}'.format(i, j), 5, 5, 3,
+                          origin=Point3D(i * 5, j * 5, 0))
+            for i in range(count) for j in range(count)]
+
+
+def all_pairs(rectangles, tolerance):
+    """Get all pairs of rectangles, which disables the broad phase."""
+    count = len(rectangles)
+    return [(i, j) for i in range(count) for j in range(i + 1, count)]
+
+
+def time_check(rooms, repeat=3):
+    """Get the fastest time in seconds to check the collisions of rooms."""
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        Room.check_room_volume_collisions(rooms, 0.01)
+        times.append(time.time() - start)
+    return min(times)
+
+
+if __name__ == '__main__':
+    broad_phase = room_module.overlapping_rectangle_pairs
+    print('{:>8} {:>16} {:>16}'.format('rooms', 'broad phase (s)', 'all pairs (s)'))
+    for count in (10, 20, 30, 40, 60):
+        rooms = grid_rooms(count)
+        room_module.overlapping_rectangle_pairs = broad_phase
+        sweep_time = time_check(rooms)
+        if count <= 30:  # all pairs gets too slow beyond this
+            room_module.overlapping_rectangle_pairs = all_pairs
+            pairs_time = '{:16.4f}'.format(time_check(rooms, 1))
+        else:
+            pairs_time = '{:>16}'.format('-')
+        print('{:>8} {:16.4f} {}'.format(len(rooms), sweep_time, pairs_time))
+    room_module.overlapping_rectangle_pairs = broad_phase
@@ -1,23 +1,115 @@
 """Honeybee core library."""
 import importlib
 import pkgutil
+import json
 import sys
+import os
 
-from honeybee.logutil import get_logger
+from honeybee.logutil import get_logger, _get_log_folder
 
 
 logger = get_logger(__name__)
 
-#  find and import honeybee extensions
+#  find honeybee extensions and import them the first time that they are needed
 #  this is a critical step to add additional functionalities to honeybee core library.
-extensions = {}
-for finder, name, ispkg in pkgutil.iter_modules():
-    if not name.startswith('honeybee_') or name.count('_') > 1:
-        continue
+#  the names of the extensions found in each folder of sys.path are cached in a file
+#  that is invalidated by the modification time of the folder, which changes whenever
+#  a package is installed into or removed from the folder.
+_extensions = {}
+_extensions_loaded = False
+_EXTENSION_CACHE_FILE = 'extension_index.json'
+
+
+def discover_extensions():
+    """Get a list with the module names of the installed honeybee extensions.
+
+    Each folder of sys.path is only scanned for extensions when it has been
+    modified since the last time that it was scanned. Otherwise, the names are
+    taken from a cached index in the honeybee log folder.
+    """
+    cache_path = os.path.join(_get_log_folder(), _EXTENSION_CACHE_FILE)
     try:
-        extensions[name] = importlib.import_module(name)
-    except Exception:
-        if (sys.version_info >= (3, 0)):
-            logger.exception('Failed to import {0}!'.format(name))
-    else:
-        logger.info('Successfully imported Honeybee plugin: {}'.format(name))
+        with open(cache_path) as inf:
+            cache = json.load(inf)
+    except Exception:  # no cache or it is corrupt
+        cache = {}
+
+    names, changed = [], False
+    for path in sys.path:
+        path = os.path.abspath(path or os.curdir)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:  # path does not exist
+            continue
+        cached = cache.get(path)
+        if cached is None or cached[0] != mtime:  # scan the folder for extensions
+            found = [name for _, name, _ in pkgutil.iter_modules([path])
+                     if name.startswith('honeybee_') and name.count('_') == 1]
+            cache[path], cached, changed = [mtime, found], [mtime, found], True
+        for name in cached[1]:
+            if name not in names:
+                names.append(name)
+
+    if changed:
+        try:
+            with open(cache_path, 'w') as outf:
+                json.dump(cache, outf)
+        except (IOError, OSError):  # the folder is not writable; scan next time
+            pass
+    return names
+
+
+def load_extensions():
+    """Import all of the installed honeybee extensions if they are not yet imported.
+
+    This is called automatically the first time that an attribute added by an
+    extension is requested (eg. Room.properties.energy or Model.to.idf) and
+    it only needs to be called directly before getting attributes from the
+    classes or modules of honeybee-core that extensions edit without any instance.
+
+    Returns:
+        True if the extensions were imported by this call. False if they were
+        already imported.
+    """
+    global _extensions_loaded
+    if _extensions_loaded:
+        return False
+    _extensions_loaded = True  # set first so that extensions can import honeybee
+    for name in discover_extensions():
+        try:
+            _extensions[name] = importlib.import_module(name)
+        except Exception:
+            if (sys.version_info >= (3, 0)):
+                logger.exception('Failed to import {0}!'.format(name))
+        else:
+            logger.info('Successfully imported Honeybee plugin: {}'.format(name))
+    return True
+
+
+def extension_getattr(module_name):
+    """Get a module __getattr__ function that imports the extensions when called.
+
+    This is used by the modules of honeybee-core that extensions edit such that
+    module attributes added by extensions are available without importing the
+    extensions first.
+
+    Args:
+        module_name: Text for the full name of the module (eg. honeybee.writer.model).
+    """
+    def __getattr__(name):
+        if not name.startswith('__') and load_extensions():
+            return getattr(sys.modules[module_name], name)
+        raise AttributeError(
+            'module \'{}\' has no attribute \'{}\''.format(module_name, name))
+    return __getattr__
+
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name == 'extensions':
+            load_extensions()
+            return _extensions
+        raise AttributeError('module \'honeybee\' has no attribute \'{}\''.format(name))
+else:  # module attributes cannot be lazy; import all extensions now
+    load_extensions()
+    extensions = _extensions
@@ -4,6 +4,7 @@ import math
 from ladybug_geometry.geometry3d.pointvector import Point3D
 
 from .typing import valid_string
+from .spatial import PlaneHashGrid
 
 
 class _Base(object):
@@ -20,6 +21,12 @@ class _Base(object):
         * user_data
     """
     __slots__ = ('_identifier', '_display_name', '_properties', '_user_data')
+    # counter that increases whenever child objects are added to or removed from
+    # any object, which is used to invalidate cached lists of child objects
+    _structure_revision = 0
+    # counter that increases whenever the geometry of any object is replaced,
+    # which is used to invalidate cached spatial indices of the objects
+    _geometry_revision = 0
 
     def __init__(self, identifier):
         """Initialize base object."""
@@ -106,6 +113,11 @@ class _Base(object):
         """Get a list of DisplayFace3D dictionaries for visualizing the object."""
         return []
 
+    @staticmethod
+    def _structure_changed():
+        """Note that child objects have been added to or removed from an object."""
+        _Base._structure_revision += 1
+
     def _changed_dict(self, other_object, tolerance):
         """Get a dictionary reporting changes between this object and another.
 
@@ -285,37 +297,46 @@ class _Base(object):
         """
         if len(faces) <= 1:
             return ([faces], [f.geometry.plane for f in faces])
-        grouped_faces, planes = [[faces[0]]], [faces[0].geometry.plane]
+        geos = [f.geometry for f in faces]
         if angle_tolerance is not None:
             ang_tol = math.radians(angle_tolerance)
-            for face in faces[1:]:
-                group_found = False
-                for face_group in grouped_faces:
-                    for oth_face in face_group:
-                        if face.geometry.plane.is_coplanar_tolerance(
-                                oth_face.geometry.plane, tolerance, ang_tol):
-                            face_group.append(face)
-                            group_found = True
-                            break
-                    if group_found:
-                        break
-                if not group_found:  # the face is not coplanar with any of the others
-                    grouped_faces.append([face])  # make a new group for the face
-                    planes.append(face.geometry.plane)
+            key_pts = [geo.plane.o for geo in geos]
+
+            def is_coplanar(geo, oth_geo):
+                return geo.plane.is_coplanar_tolerance(
+                    oth_geo.plane, tolerance, ang_tol)
         else:
-            for face in faces[1:]:
-                group_found = False
-                for face_group in grouped_faces:
-                    for oth_face in face_group:
-                        if face.geometry.is_coplanar(oth_face.geometry, tolerance):
-                            face_group.append(face)
-                            group_found = True
-                            break
-                    if group_found:
-                        break
-                if not group_found:  # the face is not coplanar with any of the others
-                    grouped_faces.append([face])  # make a new group for the face
-                    planes.append(face.geometry.plane)
+            # all vertices of the other geometry must lie within the tolerance of
+            # the plane, which limits the angle by the minimum width of the geometry
+            # (this is at least the area divided by the bounding box diagonal)
+            max_sin = 0
+            for geo in geos:
+                if geo.area <= 0:
+                    max_sin = 1
+                    break
+                diag = geo.min.distance_to_point(geo.max)
+                max_sin = max(max_sin, 2 * tolerance * diag / geo.area)
+            ang_tol = math.asin(min(max_sin, 1))
+            key_pts = [geo.vertices[0] for geo in geos]
+
+            def is_coplanar(geo, oth_geo):
+                return geo.is_coplanar(oth_geo, tolerance)
+
+        # use a hash grid of planes to only test the faces in nearby planes
+        plane_grid = PlaneHashGrid.from_points(key_pts, tolerance, ang_tol)
+        plane_grid.add(geos[0].plane.n, key_pts[0], (0, 0))
+        grouped_faces, planes = [[faces[0]]], [geos[0].plane]
+        for i in range(1, len(faces)):
+            geo = geos[i]
+            for group_i, oth_i in plane_grid.candidates(geo.plane.n, geo.plane.o):
+                if is_coplanar(geo, geos[oth_i]):
+                    grouped_faces[group_i].append(faces[i])
+                    break
+            else:  # the face is not coplanar with any of the others
+                group_i = len(grouped_faces)
+                grouped_faces.append([faces[i]])  # make a new group for the face
+                planes.append(geo.plane)
+            plane_grid.add(geo.plane.n, key_pts[i], (group_i, i))
         return grouped_faces, planes
 
     @staticmethod
@@ -388,3 +409,29 @@ class _Base(object):
 
     def __repr__(self):
         return 'Honeybee Base Object: %s' % self.display_name
+
+
+def _track_geometry(cls):
+    """Class decorator to note whenever the _geometry slot of a class is replaced.
+
+    The _geometry slot is replaced by a property that reads the slot directly
+    and increases the _geometry_revision of _Base whenever geometry that was
+    already set is replaced, such that spatial indices of the objects can be
+    invalidated without checking the geometry of every object. Setting the
+    geometry of a new object or a geometry that was None (eg. when the geometry
+    of a Room is computed from its Faces) does not change the revision since
+    this cannot change the geometry of an object that is already indexed.
+    """
+    slot = cls.__dict__['_geometry']
+
+    def _set_geometry(self, value):
+        try:
+            replaced = slot.__get__(self) is not None
+        except AttributeError:  # the geometry of a new object
+            replaced = False
+        slot.__set__(self, value)
+        if replaced:
+            _Base._geometry_revision += 1
+
+    cls._geometry = property(slot.__get__, _set_geometry)
+    return cls
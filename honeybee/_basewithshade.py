@@ -53,6 +53,7 @@ class _BaseWithShade(_Base):
         for shade in self._outdoor_shades:
             shade._parent = None
         self._outdoor_shades = []
+        self._structure_changed()
 
     def remove_indoor_shades(self):
         """Remove all indoor shades assigned to this object."""
@@ -60,6 +61,7 @@ class _BaseWithShade(_Base):
             shade._parent = None
             shade._is_indoor = False
         self._indoor_shades = []
+        self._structure_changed()
 
     def add_outdoor_shade(self, shade):
         """Add a Shade object to the outdoors of this object.
@@ -79,6 +81,7 @@ class _BaseWithShade(_Base):
         shade._parent = self
         shade._is_detached = False
         self._outdoor_shades.append(shade)
+        self._structure_changed()
 
     def add_indoor_shade(self, shade):
         """Add a Shade object to be added to the indoors of this object.
@@ -99,6 +102,7 @@ class _BaseWithShade(_Base):
         shade._is_detached = False
         shade._is_indoor = True
         self._indoor_shades.append(shade)
+        self._structure_changed()
 
     def add_outdoor_shades(self, shades):
         """Add a list of Shade objects to the outdoors of this object.
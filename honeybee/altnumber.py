@@ -1,4 +1,5 @@
 """Objects used as alternatives to various numerical properties."""
+from honeybee import extension_getattr as _extension_getattr
 
 
 class _AltNumber(object):
@@ -55,3 +56,6 @@ class Unassigned(_AltNumber):
 no_limit = NoLimit()
 autocalculate = Autocalculate()
 unassigned = Unassigned()
+
+# import the extensions the first time that an alternate number of an extension is used
+__getattr__ = _extension_getattr(__name__)
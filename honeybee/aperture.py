@@ -8,6 +8,7 @@ from ladybug_geometry.geometry2d import Vector2D
 from ladybug_geometry.geometry3d import Point3D, Face3D
 from ladybug.color import Color
 
+from ._base import _track_geometry
 from ._basewithshade import _BaseWithShade
 from .typing import clean_string
 from .search import get_attr_nested
@@ -18,6 +19,7 @@ from .shade import Shade
 import honeybee.writer.aperture as writer
 
 
+@_track_geometry
 class Aperture(_BaseWithShade):
     """A single planar Aperture in a Face.
 
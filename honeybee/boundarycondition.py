@@ -3,6 +3,7 @@ import re
 
 from .typing import float_in_range, tuple_with_length
 from .altnumber import autocalculate
+from . import load_extensions, extension_getattr
 
 
 class _BoundaryCondition(object):
@@ -319,6 +320,7 @@ class _BoundaryConditions(object):
 
     def _build_bc_name_dict(self):
         """Build a dictionary that can be used to lookup boundary conditions by name."""
+        load_extensions()
         attr = [atr for atr in dir(self) if not atr.startswith('_')]
         clean_attr = [re.sub(r'[\s_]', '', atr.lower()) for atr in attr]
         self._bc_name_dict = {}
@@ -332,8 +334,16 @@ class _BoundaryConditions(object):
     def __contains__(self, value):
         return isinstance(value, _BoundaryCondition)
 
+    def __getattr__(self, name):
+        # boundary conditions of extensions are added when the extensions are imported
+        if not name.startswith('__') and load_extensions():
+            return getattr(self, name)
+        raise AttributeError(
+            '\'_BoundaryConditions\' object has no attribute \'{}\''.format(name))
+
 
 boundary_conditions = _BoundaryConditions()
+__getattr__ = extension_getattr(__name__)
 
 
 def get_bc_from_position(positions, ground_depth=0):
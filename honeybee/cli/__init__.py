@@ -59,6 +59,7 @@ import sys
 import logging
 import json
 
+from honeybee import load_extensions
 from ..config import folders
 from honeybee.cli.setconfig import set_config
 from honeybee.cli.validate import validate
@@ -66,6 +67,8 @@ from honeybee.cli.compare import compare
 from honeybee.cli.create import create
 from honeybee.cli.edit import edit
 from honeybee.cli.lib import lib
+from honeybee.cli.batch import batch_cli
+from honeybee.cli.serve import serve_cli
 
 _logger = logging.getLogger(__name__)
 
@@ -112,6 +115,12 @@ main.add_command(compare)
 main.add_command(create)
 main.add_command(edit)
 main.add_command(lib)
+main.add_command(batch_cli, name='batch')
+main.add_command(serve_cli, name='serve')
+
+# import the extensions so that they add their command groups to main
+# this must happen on import since click looks up commands before main is run
+load_extensions()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,237 @@
+"""honeybee commands for running other commands over many model files."""
+import os
+import io
+import sys
+import glob
+import time
+import json
+import logging
+import click
+
+from honeybee.parallel import worker_count, parallel_map
+from honeybee.logutil import ErrorMessageHandler
+
+_logger = logging.getLogger(__name__)
+
+
+@click.command('batch', context_settings={'ignore_unknown_options': True})
+@click.argument('command', type=str)
+@click.argument('models', type=str)
+@click.argument('command-args', nargs=-1, type=click.UNPROCESSED)
+@click.option('--workers', '-w', help='An integer for the number of worker processes '
+              'over which the model files will be processed. Zero or a negative '
+              'number will use all available CPUs.', type=int, default=0,
+              show_default=True)
+@click.option('--output-folder', '-o', help='Folder into which the output of the '
+              'command for each model file will be written. Each output file will '
+              'have the same name as its model file.', type=click.Path(
+                  file_okay=False, dir_okay=True, resolve_path=True),
+              default='batch_output', show_default=True)
+@click.option('--output-extension', '-x', help='Optional text for the file extension '
+              'of the output files. By default, the outputs of edit commands will use '
+              '.hbjson and the outputs of all other commands will use .txt.',
+              type=str, default=None)
+@click.option('--summary-file', '-s', help='Optional file to output the JSON summary '
+              'of the batch with the timing and any failure of each model file. By '
+              'default, it will be written to batch_summary.json in the output folder.',
+              type=click.Path(file_okay=True, dir_okay=False, resolve_path=True),
+              default=None)
+def batch_cli(command, models, command_args, workers, output_folder,
+              output_extension, summary_file):
+    """Run a honeybee command over many model files using a pool of processes.
+
+    The interpreter start and the loading of honeybee extensions is only done
+    once for each worker process rather than once for each model file.
+
+    \b
+    Args:
+        command: Text for the honeybee command to be run for each model file
+            (eg. "validate model" or "edit solve-adjacency"). The model file
+            will be input as the first argument of the command. Commands with
+            an --output-file option will have it set to a file in the output folder.
+        models: A glob pattern for the model files (eg. "models/*.hbjson") or
+            the path to a manifest file. Manifest files can be a .txt file with
+            one model file path on each line or a JSON file containing an
+            array of model file paths. Relative paths in manifests are relative
+            to the folder of the manifest.
+        command_args: Any additional arguments or options to be passed to the
+            command for each model file (eg. --json). Place these after "--"
+            when they are options.
+    """
+    try:
+        summary = batch(command, models, command_args, workers, output_folder,
+                        output_extension, summary_file)
+    except Exception as e:
+        _logger.exception('Batch run failed.\n{}'.format(e))
+        sys.exit(1)
+    else:
+        sys.exit(0 if summary['failed'] == 0 else 1)
+
+
+def batch(command, models, command_args=(), workers=0, output_folder='batch_output',
+          output_extension=None, summary_file=None):
+    """Run a honeybee command over many model files using a pool of processes.
+
+    Args:
+        command: Text for the honeybee command to be run for each model file
+            (eg. "validate model" or "edit solve-adjacency").
+        models: A glob pattern for the model files or the path to a manifest
+            file (either .txt with one path per line or a JSON array of paths).
+            This can also be a list of model file paths.
+        command_args: A list of additional arguments to be passed to the command
+            for each model file. (Default: None).
+        workers: An integer for the number of worker processes. Zero or a negative
+            number will use all available CPUs. None will run all model files
+            in the current process. (Default: 0).
+        output_folder: Folder into which the output of the command for each
+            model file will be written. (Default: batch_output).
+        output_extension: Optional text for the file extension of the output
+            files. If None, the outputs of edit commands will use .hbjson
+            and the outputs of all other commands will use .txt. (Default: None).
+        summary_file: Optional path to a file where the summary will be written
+            as JSON. If None, it will be written to batch_summary.json in the
+            output_folder. (Default: None).
+
+    Returns:
+        A dictionary summarizing the batch, which is also written to the
+        summary_file. The "files" key contains a list with a dictionary for
+        each model file that notes the output_file, the exit_code, whether
+        it succeeded, the time it took in seconds and any error message.
+    """
+    # check the command and get the model files
+    command_path = command.split()
+    cmd = _find_command(command_path)
+    model_files = models if isinstance(models, (list, tuple)) \
+        else batch_model_files(models)
+    assert len(model_files) != 0, 'No model files were found for "{}".'.format(models)
+
+    # set up the output files
+    if not os.path.isdir(output_folder):
+        os.makedirs(output_folder)
+    has_output = any(param.name == 'output_file' for param in cmd.params)
+    if output_extension is None:
+        output_extension = '.hbjson' if command_path[0] == 'edit' else '.txt'
+    elif not output_extension.startswith('.'):
+        output_extension = '.{}'.format(output_extension)
+    output_files = _output_file_paths(model_files, output_folder, output_extension) \
+        if has_output else [None] * len(model_files)
+
+    # run the command for each of the model files
+    start = time.time()
+    command_args = list(command_args or ())
+    inputs = [(command_path, m_file, command_args, o_file)
+              for m_file, o_file in zip(model_files, output_files)]
+    results = parallel_map(_run_batch_command, inputs, workers)
+
+    # write the summary
+    failed = sum(1 for result in results if not result['success'])
+    summary = {
+        'command': command_path,
+        'command_args': command_args,
+        'workers': worker_count(workers),
+        'total_time': time.time() - start,
+        'succeeded': len(results) - failed,
+        'failed': failed,
+        'files': results
+    }
+    if summary_file is None:
+        summary_file = os.path.join(output_folder, 'batch_summary.json')
+    with open(summary_file, 'w') as outf:
+        json.dump(summary, outf, indent=4)
+    return summary
+
+
+def batch_model_files(models):
+    """Get a list of model file paths from a glob pattern or a manifest file.
+
+    Args:
+        models: A glob pattern for the model files or the path to a manifest
+            file. Manifest files can be a .txt file with one path on each line
+            or a JSON file containing an array of paths.
+    """
+    if os.path.isfile(models):
+        base_folder = os.path.dirname(os.path.abspath(models))
+        if models.lower().endswith('.txt'):  # text manifest
+            with io.open(models, encoding='utf-8') as inf:
+                paths = [line.strip() for line in inf
+                         if line.strip() and not line.strip().startswith('#')]
+        else:  # check the start of the file to see if it is a JSON manifest
+            with open(models, 'rb') as inf:
+                first_bytes = inf.read(64).lstrip()
+            if not first_bytes.startswith(b'['):  # a single model file
+                return [os.path.abspath(models)]
+            with io.open(models, encoding='utf-8') as inf:
+                paths = json.load(inf)
+        return [os.path.normpath(os.path.join(base_folder, path)) for path in paths]
+    return sorted(os.path.abspath(path) for path in glob.glob(models)
+                  if os.path.isfile(path))
+
+
+def _find_command(command_path):
+    """Get a click command of the honeybee CLI from a list of command names."""
+    from honeybee.cli import main
+    cmd, ctx = main, click.Context(main)
+    for name in command_path:
+        sub_cmd = cmd.get_command(ctx, name) \
+            if isinstance(cmd, click.Group) else None
+        if sub_cmd is None:
+            raise ValueError('"{}" is not a valid honeybee command.'.format(
+                ' '.join(command_path)))
+        cmd, ctx = sub_cmd, click.Context(sub_cmd, parent=ctx, info_name=name)
+    if isinstance(cmd, click.Group):
+        raise ValueError('"{}" is a group of commands and not a command.'.format(
+            ' '.join(command_path)))
+    return cmd
+
+
+def _output_file_paths(model_files, output_folder, extension):
+    """Get unique output file paths in a folder for a list of model files."""
+    output_files, used = [], set()
+    for model_file in model_files:
+        base = os.path.splitext(os.path.basename(model_file))[0]
+        name, count = base, 1
+        while name.lower() in used:  # model files with the same name
+            name = '{}_{}'.format(base, count)
+            count += 1
+        used.add(name.lower())
+        output_files.append(os.path.join(output_folder, name + extension))
+    return output_files
+
+
+def _run_batch_command(inputs):
+    """Run a honeybee command for a single model file.
+
+    This function is at the module level so that it can be used by process pools.
+
+    Args:
+        inputs: A tuple with four items. The first is a list with the names of
+            the honeybee command. The second is the path to the model file. The
+            third is a list of additional arguments for the command and the fourth
+            is the path to the output file (or None if the command has no output).
+    """
+    from honeybee.cli import main
+    command_path, model_file, command_args, output_file = inputs
+    args = command_path + [model_file] + command_args
+    if output_file is not None:
+        args.extend(['--output-file', output_file])
+    handler = ErrorMessageHandler()
+    logging.getLogger().addHandler(handler)
+    start, exit_code, error = time.time(), 0, None
+    try:
+        main.main(args=args, prog_name='honeybee', standalone_mode=False)
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception as e:
+        exit_code, error = 1, str(e)
+    finally:
+        logging.getLogger().removeHandler(handler)
+    if exit_code != 0 and error is None and handler.messages:
+        error = handler.messages[-1]
+    return {
+        'model_file': model_file,
+        'output_file': output_file,
+        'exit_code': exit_code,
+        'success': exit_code == 0,
+        'time': time.time() - start,
+        'error': error
+    }
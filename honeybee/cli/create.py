@@ -2,14 +2,8 @@
 import click
 import sys
 import logging
-import json
 
 from honeybee.model import Model
-from honeybee.boundarycondition import boundary_conditions as bcs
-try:
-    ad_bc = bcs.adiabatic
-except AttributeError:  # honeybee_energy is not loaded and adiabatic does not exist
-    ad_bc = None
 
 _logger = logging.getLogger(__name__)
 
@@ -58,7 +52,7 @@ def shoe_box(width, depth, height, orientation_angle, window_ratio, adiabatic,
             width, depth, height, orientation_angle, window_ratio,
             adiabatic, units, tolerance)
         # write the model out to the file or stdout
-        output_file.write(json.dumps(model.to_dict()))
+        model.dump_hbjson(output_file)
     except Exception as e:
         _logger.exception('Shoe box creation failed.\n{}'.format(e))
         sys.exit(1)
@@ -115,7 +109,7 @@ def rectangle_plan(width, length, floor_to_floor_height, perimeter_offset, story
             width, length, floor_to_floor_height, perimeter_offset, story_count,
             orientation_angle, outdoor_roof, ground_floor, units, tolerance)
         # write the model out to the file or stdout
-        output_file.write(json.dumps(model.to_dict()))
+        model.dump_hbjson(output_file)
     except Exception as e:
         _logger.exception('Rectangle plan model creation failed.\n{}'.format(e))
         sys.exit(1)
@@ -179,7 +173,7 @@ def l_shaped_plan(width_1, length_1, width_2, length_2, floor_to_floor_height,
             perimeter_offset, story_count, orientation_angle, outdoor_roof, ground_floor,
             units, tolerance)
         # write the model out to the file or stdout
-        output_file.write(json.dumps(model.to_dict()))
+        model.dump_hbjson(output_file)
     except Exception as e:
         _logger.exception('L Shaped plan model creation failed.\n{}'.format(e))
         sys.exit(1)
@@ -222,7 +216,7 @@ def create_from_sync(
     try:
         new_model = Model.from_sync_files(
             base_model_file, other_model_file, sync_instructions_file)
-        output_file.write(json.dumps(new_model.to_dict()))
+        new_model.dump_hbjson(output_file)
     except Exception as e:
         _logger.exception('Model from sync failed.\n{}'.format(e))
         sys.exit(1)
@@ -235,7 +229,8 @@ def create_from_sync(
     exists=True, file_okay=True, dir_okay=False, resolve_path=True))
 @click.option(
     '--other-model', '-m', help='The other Model to be merged into the base model.',
-    type=click.File('r'), multiple=True)
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, resolve_path=True),
+    multiple=True)
 @click.option(
     '--output-file', '-f', help='Optional file to output the Model JSON string'
     ' with solved adjacency. By default it will be printed out to stdout',
@@ -257,7 +252,7 @@ def merge_models(base_model, other_model, output_file):
             parsed_model.add_model(o_model)
 
         # write the new model out to the file or stdout
-        output_file.write(json.dumps(parsed_model.to_dict()))
+        parsed_model.dump_hbjson(output_file)
     except Exception as e:
         _logger.exception('Model merging failed.\n{}'.format(e))
         sys.exit(1)
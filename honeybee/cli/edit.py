@@ -8,14 +8,11 @@ from ladybug_geometry.geometry2d.pointvector import Vector2D
 from ladybug_geometry.geometry3d.pointvector import Vector3D
 
 from honeybee.model import Model
+from honeybee.hbjson import open_hbjson
+from honeybee import jsonutil
 from honeybee.units import parse_distance_string
 from honeybee.facetype import Wall
 from honeybee.boundarycondition import Outdoors
-from honeybee.boundarycondition import boundary_conditions as bcs
-try:
-    ad_bc = bcs.adiabatic
-except AttributeError:  # honeybee_energy is not loaded and adiabatic does not exist
-    ad_bc = None
 
 _logger = logging.getLogger(__name__)
 
@@ -32,10 +29,15 @@ def edit():
 @click.option('--scale/--do-not-scale', ' /-ns', help='Flag to note whether the model '
               'should be scaled as it is converted to the new units system.',
               default=True, show_default=True)
+@click.option('--workers', '-w', help='An optional integer for the number of worker '
+              'processes over which the Model objects will be loaded and the Rooms '
+              'will be intersected. Zero or a negative number will use all available '
+              'CPUs. By default, everything will run in a single process.',
+              type=int, default=None)
 @click.option('--output-file', '-f', help='Optional file to output the Model JSON string'
               ' with solved adjacency. By default it will be printed out to stdout',
               type=click.File('w'), default='-')
-def convert_units(model_file, units, scale, output_file):
+def convert_units(model_file, units, scale, workers, output_file):
     """Convert a Model to a given units system.
 
     \b
@@ -45,13 +47,13 @@ def convert_units(model_file, units, scale, output_file):
             Choose from (Meters, Millimeters, Feet, Inches, Centimeters).
     """
     try:
-        parsed_model = Model.from_file(model_file)
+        parsed_model = Model.from_file(model_file, workers=workers)
         if scale:
             parsed_model.convert_to_units(units)
         else:
             parsed_model.units = units
         # write the new model out to the file or stdout
-        output_file.write(json.dumps(parsed_model.to_dict()))
+        parsed_model.dump_hbjson(output_file)
     except Exception as e:
         _logger.exception('Model unit conversion failed.\n{}'.format(e))
         sys.exit(1)
@@ -80,11 +82,15 @@ def convert_units(model_file, units, scale, output_file):
 @click.option('--surface/--adiabatic', ' /-a', help='Flag to note whether the '
               'adjacencies should be surface or adiabatic.',
               default=True, show_default=True)
+@click.option('--workers', '-w', help='An optional integer for the number of worker '
+              'processes over which the Model objects will be loaded. Zero or a '
+              'negative number will use all available CPUs. By default, the Model '
+              'will be loaded in a single process.', type=int, default=None)
 @click.option('--output-file', '-f', help='Optional file to output the Model JSON string'
               ' with solved adjacency. By default it will be printed out to stdout',
               type=click.File('w'), default='-')
 def solve_adjacency(model_file, no_merge, no_intersect, no_overwrite,
-                    wall, surface, output_file):
+                    wall, surface, workers, output_file):
     """Solve adjacency between Rooms of a Model file.
 
     \b
@@ -93,7 +99,7 @@ def solve_adjacency(model_file, no_merge, no_intersect, no_overwrite,
     """
     try:
         # serialize the Model to Python and check the tolerance
-        parsed_model = Model.from_file(model_file)
+        parsed_model = Model.from_file(model_file, workers=workers)
         assert parsed_model.tolerance != 0, \
             'Model must have a non-zero tolerance to use solve-adjacency.'
 
@@ -105,10 +111,10 @@ def solve_adjacency(model_file, no_merge, no_intersect, no_overwrite,
         adiabatic = not surface
         parsed_model.solve_adjacency(
             merge_coplanar, intersect, overwrite,
-            air_boundary=air_boundary, adiabatic=adiabatic)
+            air_boundary=air_boundary, adiabatic=adiabatic, workers=workers)
 
         # write the new model out to the file or stdout
-        output_file.write(json.dumps(parsed_model.to_dict()))
+        parsed_model.dump_hbjson(output_file)
     except Exception as e:
         _logger.exception('Model solve adjacency failed.\n{}'.format(e))
         sys.exit(1)
@@ -150,7 +156,7 @@ def windows_by_ratio(model_file, ratio, output_file):
                     face.apertures_by_ratio(ratio, tol)
 
         # write the new model out to the file or stdout
-        output_file.write(json.dumps(parsed_model.to_dict()))
+        parsed_model.dump_hbjson(output_file)
     except Exception as e:
         _logger.exception('Model windows by ratio failed.\n{}'.format(e))
         sys.exit(1)
@@ -227,7 +233,7 @@ def windows_by_ratio_rect(model_file, ratio, aperture_height, sill_height,
                         vertical_separation, tol)
 
         # write the new model out to the file or stdout
-        output_file.write(json.dumps(parsed_model.to_dict()))
+        parsed_model.dump_hbjson(output_file)
     except Exception as e:
         _logger.exception('Model windows by ratio rect failed.\n{}'.format(e))
         sys.exit(1)
@@ -269,7 +275,7 @@ def extruded_border(model_file, depth, outdoor, output_file):
                         ap.extruded_border(depth, indoor)
 
         # write the new model out to the file or stdout
-        output_file.write(json.dumps(parsed_model.to_dict()))
+        parsed_model.dump_hbjson(output_file)
     except Exception as e:
         _logger.exception('Model extruded border failed.\n{}'.format(e))
         sys.exit(1)
@@ -340,7 +346,7 @@ def overhang(model_file, depth, angle, vertical_offset, per_window, outdoor,
                 shd.move(m_vec)
 
         # write the new model out to the file or stdout
-        output_file.write(json.dumps(parsed_model.to_dict()))
+        parsed_model.dump_hbjson(output_file)
     except Exception as e:
         _logger.exception('Model overhang failed.\n{}'.format(e))
         sys.exit(1)
@@ -414,7 +420,7 @@ def louvers_by_count(model_file, louver_count, depth, angle, offset, horizontal,
                                               cont_vec, flip_start, indoor, tol)
 
         # write the new model out to the file or stdout
-        output_file.write(json.dumps(parsed_model.to_dict()))
+        parsed_model.dump_hbjson(output_file)
     except Exception as e:
         _logger.exception('Model louver generation failed.\n{}'.format(e))
         sys.exit(1)
@@ -496,7 +502,7 @@ def louvers_by_spacing(model_file, spacing, depth, angle, offset, horizontal,
                             indoor, tol, max_count)
 
         # write the new model out to the file or stdout
-        output_file.write(json.dumps(parsed_model.to_dict()))
+        parsed_model.dump_hbjson(output_file)
     except Exception as e:
         _logger.exception('Model louver generation failed.\n{}'.format(e))
         sys.exit(1)
@@ -531,12 +537,8 @@ def reset_resource_ids(model_file, by_name, output_file):
     """
     try:
         # load the model file and separately load up the resource objects
-        if sys.version_info < (3, 0):
-            with open(model_file) as inf:
-                data = json.load(inf)
-        else:
-            with open(model_file, encoding='utf-8') as inf:
-                data = json.load(inf)
+        with open_hbjson(model_file) as inf:
+            data = jsonutil.load(inf)
         model = Model.from_dict(data)
         # reset the identifiers of resources in the dictionary
         add_uuid = not by_name
@@ -0,0 +1,165 @@
+"""honeybee command for running a server that keeps the interpreter warm."""
+import os
+import sys
+import stat
+import signal
+import socket
+import logging
+import click
+
+from honeybee.client import default_socket_path, send_message, receive_message, \
+    check_socket_owner
+from honeybee.logutil import ErrorMessageHandler
+
+try:
+    import socketserver
+except ImportError:  # Python 2
+    import SocketServer as socketserver
+
+_logger = logging.getLogger(__name__)
+# commands that cannot be run through the server
+EXCLUDED_COMMANDS = ('serve', 'set-config')
+
+
+@click.command('serve')
+@click.option('--socket-path', '-s', help='Optional path to the Unix socket on which '
+              'the server will listen. By default, the HONEYBEE_SOCKET environment '
+              'variable is used if it is set. Otherwise, a file unique to the user '
+              'in the temporary folder is used.', type=str, default=None)
+def serve_cli(socket_path):
+    """Run a server that accepts honeybee CLI commands on a local Unix socket.
+
+    The server imports honeybee, its extensions and the configuration once such
+    that commands sent with the honeybee-client command do not pay this start up
+    cost. Each command runs in a process forked from the server so that
+    commands are isolated from one another and can run concurrently. The
+    server runs until it is interrupted.
+    """
+    try:
+        serve(socket_path)
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        _logger.exception('Honeybee server failed.\n{}'.format(e))
+        sys.exit(1)
+    sys.exit(0)
+
+
+def serve(socket_path=None, ready_callback=None):
+    """Run a server that accepts honeybee CLI commands on a local Unix socket.
+
+    Args:
+        socket_path: Optional path to the Unix socket on which the server will
+            listen. If None, the default_socket_path of honeybee.client is used.
+        ready_callback: An optional function that is called with the server
+            once it is listening, which is mostly useful for testing.
+    """
+    assert hasattr(socket, 'AF_UNIX') and hasattr(socketserver, 'ForkingMixIn'), \
+        'The honeybee server is only supported on operating systems with Unix ' \
+        'sockets and process forking.'
+    socket_path = socket_path or default_socket_path()
+    _remove_stale_socket(socket_path)
+
+    # do the slow imports and configuration once before any command is received
+    from honeybee import load_extensions
+    from honeybee.cli import main
+    from honeybee.config import folders
+    load_extensions()
+    folders.honeybee_schema_version_str  # load the versions of the packages
+
+    # only the current user can connect to the socket since it can run any command
+    old_umask = os.umask(0o177)
+    try:
+        server = _ForkingUnixServer(socket_path, _CommandHandler)
+    finally:
+        os.umask(old_umask)
+    os.chmod(socket_path, stat.S_IRUSR | stat.S_IWUSR)
+    server.cli_main = main
+    try:  # remove the socket file when the server is terminated
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    except ValueError:  # not running in the main thread
+        pass
+    try:
+        if ready_callback is not None:
+            ready_callback(server)
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+def _remove_stale_socket(socket_path):
+    """Remove a socket file left by a server that is no longer running.
+
+    An exception is raised if the file belongs to another user or is not a
+    socket since it should not be removed or replaced in these cases.
+    """
+    if not os.path.lexists(socket_path):
+        return
+    check_socket_owner(socket_path)
+    if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+        raise ValueError('"{}" exists and is not a socket.'.format(socket_path))
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except (OSError, socket.error):  # nothing is listening on the socket
+        os.remove(socket_path)
+    else:
+        raise ValueError(
+            'A honeybee server is already running on "{}".'.format(socket_path))
+    finally:
+        sock.close()
+
+
+if hasattr(socket, 'AF_UNIX') and hasattr(socketserver, 'ForkingMixIn'):
+    class _ForkingUnixServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+        """Unix socket server that handles each request in a forked process."""
+        cli_main = None
+else:  # Unix sockets are not available (eg. Windows)
+    _ForkingUnixServer = None
+
+
+class _CommandHandler(socketserver.BaseRequestHandler):
+    """Handle a request to run a honeybee CLI command in a forked process."""
+
+    def handle(self):
+        request = receive_message(self.request)
+        if request is None:
+            return
+        send_message(self.request, run_cli_command(
+            self.server.cli_main, request['args'], request.get('cwd')))
+
+
+def run_cli_command(cli_main, args, cwd=None):
+    """Run a honeybee CLI command in the current process and capture its result.
+
+    Args:
+        cli_main: The click group for the main honeybee command.
+        args: A list of text for the arguments of the honeybee command.
+        cwd: An optional directory from which the command will be run, which
+            is used to resolve relative file paths. Note that this changes the
+            working directory of the current process. (Default: None).
+
+    Returns:
+        A dictionary with the exit_code of the command, the output that it
+        printed and the last error message that it logged (or None).
+    """
+    from click.testing import CliRunner
+    if len(args) != 0 and args[0] in EXCLUDED_COMMANDS:
+        return {'exit_code': 1, 'output': '',
+                'error': 'The "{}" command cannot be run through the honeybee '
+                'server.'.format(args[0])}
+    if cwd is not None:
+        os.chdir(cwd)
+    handler = ErrorMessageHandler()
+    logging.getLogger().addHandler(handler)
+    try:
+        result = CliRunner().invoke(cli_main, args, prog_name='honeybee')
+    finally:
+        logging.getLogger().removeHandler(handler)
+    error = handler.messages[-1] if handler.messages else None
+    if error is None and result.exception is not None and \
+            not isinstance(result.exception, SystemExit):
+        error = str(result.exception)
+    return {'exit_code': result.exit_code, 'output': result.output, 'error': error}
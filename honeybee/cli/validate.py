@@ -5,6 +5,7 @@ import click
 
 from ladybug.commandutil import process_content_to_output
 from honeybee.model import Model
+from honeybee.validationcache import ValidationCache
 
 _logger = logging.getLogger(__name__)
 
@@ -43,11 +44,24 @@ def validate():
     '--room-overlaps', 'room_overlaps', flag_value='True',
     help='Deprecated flag used to check room collisions. '
     'Use `honeybee validate room-collisions` instead.')
+@click.option(
+    '--workers', '-w', help='An optional integer for the number of worker processes '
+    'over which the Model objects will be loaded and the checks of individual Rooms '
+    'will be run. The validation report is the same for any number of workers. '
+    'Zero or a negative number will use all available CPUs. By default, the Model '
+    'will be loaded and checked in a single process.', type=int, default=None)
+@click.option(
+    '--no-cache/--cache', ' /-c', help='Flag to note whether the results of the '
+    'checks for individual Rooms should be stored in a cache file next to the '
+    'model file (with a .hbvc extension). When the model is validated again, only '
+    'the Rooms that have changed since the last validation will be re-checked.',
+    default=True, show_default=True)
 @click.option(
     '--output-file', '-f', help='Optional file to output the full report '
     'of the validation. By default it will be printed out to stdout',
     type=click.File('w'), default='-')
-def validate_model_cli(model_file, extension, plain_text, room_overlaps, output_file):
+def validate_model_cli(model_file, extension, plain_text, room_overlaps, workers,
+                       no_cache, output_file):
     """Validate all properties of a Model file against Honeybee schema.
 
     This includes checking basic compliance with the 5 rules of honeybee geometry
@@ -77,7 +91,8 @@ def validate_model_cli(model_file, extension, plain_text, room_overlaps, output_
                   'Use `honeybee validate room-collisions` instead.')
             validate_room_collisions(model_file, json, output_file)
         else:
-            validate_model(model_file, extension, json, output_file)
+            validate_model(model_file, extension, json, output_file,
+                           workers=workers, cache=not no_cache)
     except Exception as e:
         _logger.exception('Model validation failed.\n{}'.format(e))
         sys.exit(1)
@@ -86,7 +101,7 @@ def validate_model_cli(model_file, extension, plain_text, room_overlaps, output_
 
 
 def validate_model(model_file, extension='Generic', json=False, output_file=None,
-                   plain_text=True):
+                   plain_text=True, workers=None, cache=False):
     """Validate all properties of a Model file against the Honeybee schema.
 
     This includes checking basic compliance with the 5 rules of honeybee geometry
@@ -116,8 +131,24 @@ def validate_model(model_file, extension='Generic', json=False, output_file=None
             formatted as a JSON object instead of plain text. (Default: False).
         output_file: Optional file to output the full report of the validation.
             If None, the string will simply be returned from this method.
+        workers: An optional integer for the number of worker processes over
+            which the Model objects will be loaded and the checks of individual
+            Rooms will be run. Zero or a negative number will use all available
+            CPUs. (Default: None).
+        cache: Boolean to note whether the results of the checks for individual
+            Rooms should be stored in a cache file next to the model file such
+            that only the Rooms that have changed are re-checked the next time
+            the model is validated. (Default: False).
     """
-    report = Model.validate(model_file, 'check_for_extension', [extension], json)
+    validation_cache = None
+    if cache:
+        cache_file = ValidationCache.cache_file_path(model_file)
+        validation_cache = ValidationCache.from_file(cache_file)
+    report = Model.validate(
+        model_file, 'check_for_extension', [extension], json, workers, validation_cache)
+    if validation_cache is not None:
+        validation_cache.prune()
+        validation_cache.to_file(cache_file)
     return process_content_to_output(report, output_file)
 
 
@@ -0,0 +1,140 @@
+# coding=utf-8
+"""Thin client for sending CLI commands to a running `honeybee serve` process.
+
+The client only uses the Python standard library such that it starts quickly.
+The arguments are forwarded to the server over a local Unix socket and the
+command runs in an interpreter that has already imported honeybee and all of
+its extensions. If no server is running, the command is run in the current
+process like the regular honeybee CLI.
+
+Usage:
+
+.. code-block:: shell
+
+    honeybee serve &
+    honeybee-client validate model ./model.hbjson --json
+"""
+import os
+import sys
+import json
+import socket
+import struct
+import tempfile
+
+SOCKET_ENV_VAR = 'HONEYBEE_SOCKET'
+_HEADER = struct.Struct('>I')
+
+
+def default_socket_path():
+    """Get the path to the socket used by the server when none is specified.
+
+    This is the value of the HONEYBEE_SOCKET environment variable if it is set.
+    Otherwise, it is a file in the temporary folder that is unique to the user.
+    """
+    env_path = os.environ.get(SOCKET_ENV_VAR)
+    if env_path:
+        return env_path
+    user_id = os.getuid() if hasattr(os, 'getuid') else 0
+    return os.path.join(tempfile.gettempdir(), 'honeybee-{}.sock'.format(user_id))
+
+
+def check_socket_owner(socket_path):
+    """Raise an exception if a socket file belongs to a different user.
+
+    A socket in a shared folder (eg. the temporary folder) could otherwise be
+    created by another user to receive the commands of this user or to run
+    the commands of another user with the permissions of this user.
+
+    Raises:
+        OSError (socket.error in Python 2) if the socket belongs to another user.
+    """
+    if hasattr(os, 'getuid') and os.lstat(socket_path).st_uid != os.getuid():
+        raise OSError(
+            'The socket "{}" belongs to another user.'.format(socket_path))
+
+
+def send_message(sock, message):
+    """Send a JSON-serializable message over a socket with a length prefix."""
+    data = json.dumps(message).encode('utf-8')
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+
+def receive_message(sock):
+    """Receive a length-prefixed JSON message from a socket.
+
+    Returns:
+        The decoded message or None if the socket was closed before a full
+        message was received.
+    """
+    header = _receive_bytes(sock, _HEADER.size)
+    if header is None:
+        return None
+    data = _receive_bytes(sock, _HEADER.unpack(header)[0])
+    return json.loads(data.decode('utf-8')) if data is not None else None
+
+
+def run_command(args, socket_path=None, timeout=None):
+    """Run a honeybee CLI command on a running server.
+
+    Args:
+        args: A list of text for the arguments of the honeybee command
+            (eg. ['validate', 'model', 'model.hbjson']).
+        socket_path: Path to the socket of the server. If None, the
+            default_socket_path will be used. (Default: None).
+        timeout: An optional number of seconds to wait for the command to
+            finish. None will wait indefinitely. (Default: None).
+
+    Returns:
+        A dictionary with the exit_code of the command, the output that it
+        printed and the last error message that it logged (or None).
+
+    Raises:
+        OSError (socket.error in Python 2) if no server is listening on the socket
+        or the socket belongs to another user.
+    """
+    socket_path = socket_path or default_socket_path()
+    check_socket_owner(socket_path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        send_message(sock, {'args': list(args), 'cwd': os.getcwd()})
+        response = receive_message(sock)
+    finally:
+        sock.close()
+    if response is None:
+        raise ValueError('The honeybee server closed the connection without a result.')
+    return response
+
+
+def main(args=None):
+    """Entry point of the honeybee-client command."""
+    args = sys.argv[1:] if args is None else args
+    try:
+        if not hasattr(socket, 'AF_UNIX'):  # Unix sockets are not available
+            raise OSError('Unix sockets are not supported.')
+        response = run_command(args)
+    except (OSError, socket.error):  # no server running; run in this process
+        from honeybee.cli import main as cli_main
+        return cli_main(args=args, prog_name='honeybee')
+    sys.stdout.write(response['output'])
+    sys.stdout.flush()
+    if response['exit_code'] != 0 and response.get('error'):
+        sys.stderr.write(response['error'] + '\n')
+    sys.exit(response['exit_code'])
+
+
+def _receive_bytes(sock, size):
+    """Receive an exact number of bytes from a socket or None if it was closed."""
+    chunks, remaining = [], size
+    while remaining > 0:
+        chunk = sock.recv(min(remaining, 65536))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
+if __name__ == '__main__':
+    main()
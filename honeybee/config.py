@@ -20,6 +20,13 @@ import subprocess
 import json
 import tempfile
 
+try:
+    from importlib import metadata as importlib_metadata
+except ImportError:  # Python < 3.8 or IronPython
+    importlib_metadata = None
+
+from .logutil import _get_log_folder
+
 
 class Folders(object):
     """Honeybee folders.
@@ -32,6 +39,11 @@ class Folders(object):
             are found. If True, no printing will occur upon initialization of this
             class. Default: True.
 
+    All of the properties are computed the first time that they are requested.
+    The versions of the installed packages are also cached in a file in the
+    honeybee log folder, which is re-computed whenever the config file or the
+    folder where the packages are installed is modified.
+
     Properties:
         * default_simulation_folder
         * honeybee_core_version
@@ -52,24 +64,29 @@ class Folders(object):
         # set the mute value
         self.mute = bool(mute)
 
-        # load paths from the config JSON file
-        self.config_file = config_file
+        # set the config JSON file to only be loaded if a path is requested
+        self._config_file = self._default_config_file(config_file)
+        self._config_loaded = False
+        self._default_simulation_folder = None
+        self._default_standards_folder = None
 
-        # set python version to only be retrieved if requested
+        # set the python and package versions to only be retrieved if requested
         self._python_version = None
         self._python_version_str = None
+        self._versions = None
 
-        # search for the version of honeybee-core and honeybee-schema
-        self._honeybee_core_version = self._find_honeybee_core_version()
-        self._honeybee_schema_version = self._find_honeybee_schema_version()
+        if not self.mute:  # load the paths now so that they are printed
+            self.config_file = config_file
 
     @property
     def default_simulation_folder(self):
         """Get or set the path to the default simulation folder."""
+        self._load_config()
         return self._default_simulation_folder
 
     @default_simulation_folder.setter
     def default_simulation_folder(self, path):
+        self._load_config()
         if not path:  # check the default location for simulations
             path = self._find_default_simulation_folder()
 
@@ -86,7 +103,7 @@ class Folders(object):
         This will be None if the version could not be sensed (it was not installed
         via pip).
         """
-        return self._honeybee_core_version
+        return self._package_versions['honeybee_core']
 
     @property
     def honeybee_core_version_str(self):
@@ -94,8 +111,8 @@ class Folders(object):
 
         This will be None if the version could not be sensed.
         """
-        if self._honeybee_core_version is not None:
-            return '.'.join([str(item) for item in self._honeybee_core_version])
+        if self.honeybee_core_version is not None:
+            return '.'.join([str(item) for item in self.honeybee_core_version])
         return None
 
     @property
@@ -106,7 +123,7 @@ class Folders(object):
         via pip) or if no honeybee-schema installation was found next to the
         honeybee-core installation.
         """
-        return self._honeybee_schema_version
+        return self._package_versions['honeybee_schema']
 
     @property
     def honeybee_schema_version_str(self):
@@ -114,8 +131,8 @@ class Folders(object):
 
         This will be None if the version could not be sensed.
         """
-        if self._honeybee_schema_version is not None:
-            return '.'.join([str(item) for item in self._honeybee_schema_version])
+        if self.honeybee_schema_version is not None:
+            return '.'.join([str(item) for item in self.honeybee_schema_version])
         return None
 
     @property
@@ -179,7 +196,7 @@ class Folders(object):
         installation was found.
         """
         if self._python_version_str is None and self.python_exe_path:
-            self._python_version_from_cli()
+            self._find_python_version()
         return self._python_version
 
     @property
@@ -190,17 +207,19 @@ class Folders(object):
         installation was found.
         """
         if self._python_version_str is None and self.python_exe_path:
-            self._python_version_from_cli()
+            self._find_python_version()
         return self._python_version_str
 
     @property
     def default_standards_folder(self):
         """Get or set the path to the default standards library used by extensions.
         """
+        self._load_config()
         return self._default_standards_folder
 
     @default_standards_folder.setter
     def default_standards_folder(self, path):
+        self._load_config()
         if not path:  # check the default locations of the template library
             path = self._find_default_standards_folder()
 
@@ -221,10 +240,46 @@ class Folders(object):
 
     @config_file.setter
     def config_file(self, cfg):
-        if cfg is None:
-            cfg = os.path.join(os.path.dirname(__file__), 'config.json')
+        cfg = self._default_config_file(cfg)
+        self._config_loaded = True
         self._load_from_file(cfg)
         self._config_file = cfg
+        self._versions = None  # versions are cached using the config file
+
+    @property
+    def _package_versions(self):
+        """Get a dictionary with the versions of honeybee-core and honeybee-schema.
+
+        The versions are taken from the cache file if neither the config file
+        nor the python_package_path has changed since they were cached.
+        """
+        if self._versions is None:
+            cache = self._read_cache()
+            try:
+                self._versions = {
+                    'honeybee_core': self._version_tuple(cache['honeybee_core']),
+                    'honeybee_schema': self._version_tuple(cache['honeybee_schema'])
+                }
+            except KeyError:  # the versions are not yet cached
+                self._versions = {
+                    'honeybee_core': self._find_honeybee_core_version(),
+                    'honeybee_schema': self._find_honeybee_schema_version()
+                }
+                self._write_cache(self._versions)
+        return self._versions
+
+    def _load_config(self):
+        """Load the paths from the config file if they have not yet been loaded."""
+        if not self._config_loaded:
+            self._config_loaded = True
+            self._load_from_file(self._config_file)
+
+    @staticmethod
+    def _default_config_file(cfg):
+        """Get the path to the config.json in this package if cfg is None."""
+        if cfg is None:
+            cfg = os.path.join(os.path.dirname(__file__), 'config.json')
+        return cfg
 
     def _load_from_file(self, file_path):
         """Set all of the the properties of this object from a config JSON file.
@@ -258,6 +313,28 @@ class Folders(object):
         self.default_simulation_folder = default_path["default_simulation_folder"]
         self.default_standards_folder = default_path["default_standards_folder"]
 
+    def _find_python_version(self):
+        """Set this object's Python version from the current or cached interpreter.
+
+        A call to a Python command is only made if the python_exe_path is not
+        the current interpreter and its version has not been cached.
+        """
+        py_exe = self.python_exe_path
+        if py_exe == sys.executable:
+            self._python_version_str = platform.python_version()
+        else:
+            cached = self._read_cache().get('python')
+            if cached is not None and cached[0] == py_exe:
+                self._python_version_str = cached[1]
+            else:
+                self._python_version_from_cli()
+                self._write_cache({'python': [py_exe, self._python_version_str]})
+        try:
+            self._python_version = \
+                tuple(int(i) for i in self._python_version_str.split('.'))
+        except Exception:
+            pass  # failed to parse the version into values
+
     def _python_version_from_cli(self):
         """Set this object's Python version by making a call to a Python command."""
         cmds = [self.python_exe_path, '--version']
@@ -328,7 +405,15 @@ class Folders(object):
         return self._find_package_version('honeybee_schema')
 
     def _find_package_version(self, package_name):
-        """Get a tuple of 3 integers for the version of a package."""
+        """Get a tuple of 3 integers for the version of a package.
+
+        Only packages that are installed in the python_package_path are found.
+        """
+        if importlib_metadata is not None:
+            for dist in importlib_metadata.distributions(
+                    name=package_name, path=[self.python_package_path]):
+                return self._version_tuple(dist.version)
+            return None
         hb_info_folder = None
         for item in os.listdir(self.python_package_path):
             if item.startswith(package_name + '-') and item.endswith('.dist-info'):
@@ -342,6 +427,49 @@ class Folders(object):
                 return tuple(int(d) for d in ver.split('.'))
         return None
 
+    @staticmethod
+    def _version_tuple(version):
+        """Get a tuple of integers from version text or a list (eg. "1.47.26")."""
+        if version is None or isinstance(version, list):
+            return tuple(version) if version is not None else None
+        ver = ''.join(s for s in version if (s.isdigit() or s == '.'))
+        try:
+            return tuple(int(d) for d in ver.split('.'))
+        except ValueError:  # not a valid version
+            return None
+
+    def _cache_key(self):
+        """Get a list that identifies the files used to find the cached versions."""
+        key = []
+        for path in (self._config_file, self.python_package_path):
+            try:
+                key.append([path, os.path.getmtime(path)])
+            except OSError:  # the path does not exist
+                key.append([path, None])
+        return key
+
+    def _read_cache(self):
+        """Get a dictionary of the cached versions if the cache is still valid."""
+        cache_file = os.path.join(_get_log_folder(), 'config_cache.json')
+        try:
+            with open(cache_file) as inf:
+                cache = json.load(inf)
+        except Exception:  # no cache or it is corrupt
+            return {}
+        return cache if cache.get('key') == self._cache_key() else {}
+
+    def _write_cache(self, values):
+        """Add values to the cache of versions, replacing it if it is not valid."""
+        cache = self._read_cache()
+        cache.update(values)
+        cache['key'] = self._cache_key()
+        cache_file = os.path.join(_get_log_folder(), 'config_cache.json')
+        try:
+            with open(cache_file, 'w') as outf:
+                json.dump(cache, outf)
+        except (IOError, OSError):  # the folder is not writable
+            pass
+
 
 """Object possesing all key folders within the configuration."""
 folders = Folders()
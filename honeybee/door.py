@@ -8,6 +8,7 @@ from ladybug_geometry.geometry2d import Vector2D
 from ladybug_geometry.geometry3d import Point3D, Face3D
 from ladybug.color import Color
 
+from ._base import _track_geometry
 from ._basewithshade import _BaseWithShade
 from .typing import clean_string
 from .search import get_attr_nested
@@ -17,6 +18,7 @@ from .shade import Shade
 import honeybee.writer.door as writer
 
 
+@_track_geometry
 class Door(_BaseWithShade):
     """A single planar Door in a Face.
 
@@ -8,6 +8,7 @@ from ladybug_geometry.geometry2d import Vector2D, Point2D, Polygon2D, Mesh2D
 from ladybug_geometry.geometry3d import Vector3D, Point3D, Plane, Face3D
 from ladybug.color import Color
 
+from ._base import _track_geometry
 from ._basewithshade import _BaseWithShade
 from .typing import clean_string, invalid_dict_error
 from .search import get_attr_nested
@@ -23,6 +24,7 @@ import honeybee.boundarycondition as hbc
 import honeybee.writer.face as writer
 
 
+@_track_geometry
 class Face(_BaseWithShade):
     """A single planar face.
 
@@ -581,13 +583,15 @@ class Face(_BaseWithShade):
             aperture._parent = None
         self._apertures = []
         self._punched_geometry = None  # reset so that it can be re-computed
+        self._structure_changed()
 
     def remove_doors(self):
         """Remove all doors from the face."""
-        for door in self._apertures:
+        for door in self._doors:
             door._parent = None
         self._doors = []
         self._punched_geometry = None  # reset so that it can be re-computed
+        self._structure_changed()
 
     def add_aperture(self, aperture):
         """Add an Aperture to this face.
@@ -609,6 +613,7 @@ class Face(_BaseWithShade):
             aperture._geometry = aperture._geometry.flip()
         self._apertures.append(aperture)
         self._punched_geometry = None  # reset so that it can be re-computed
+        self._structure_changed()
 
     def add_door(self, door):
         """Add a Door to this face.
@@ -630,6 +635,7 @@ class Face(_BaseWithShade):
             door._geometry = door._geometry.flip()
         self._doors.append(door)
         self._punched_geometry = None  # reset so that it can be re-computed
+        self._structure_changed()
 
     def add_sub_face(self, sub_face):
         """Add an Apertures or Doors to this face."""
@@ -1868,6 +1874,8 @@ class Face(_BaseWithShade):
                 del_dr_i.append(i)
         for del_i in reversed(del_dr_i):
             self._doors.pop(del_i)
+        if len(del_ap_i) != 0 or len(del_dr_i) != 0:
+            self._structure_changed()
 
     def is_geo_equivalent(self, face, tolerance=0.01):
         """Get a boolean for whether this object is geometrically equivalent to another.
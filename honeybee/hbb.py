@@ -0,0 +1,269 @@
+# coding=utf-8
+"""Utilities for reading and writing HBB files, a compact binary format for Models.
+
+An HBB file stores the same information as an HBJSON but in a layout that is
+smaller and faster to load:
+
+* The vertices of all geometry are stored in a single contiguous array of
+  little-endian float64 values. The geometry in the object table only notes
+  the index and count of its points in this array.
+* The Room, Face, Aperture, Door, Shade and ShadeMesh dictionaries (with their
+  identifiers, display names and other metadata) are stored in a zlib-compressed
+  JSON object table.
+* The boundary conditions and extension properties are stored as a table of
+  unique JSON blobs, which the object table references by index.
+* The closed Polyface3D of each Room is stored with its edge information such
+  that the Room geometry does not have to be solved again upon loading.
+
+The file starts with the MAGIC bytes, which can be used to sense the file type.
+"""
+import sys
+import json
+import zlib
+import struct
+from array import array
+
+from . import jsonutil
+
+MAGIC = b'HBB\x01'
+_SECTION = struct.Struct('<Q')
+_CHILD_KEYS = ('faces', 'apertures', 'doors', 'indoor_shades', 'outdoor_shades')
+_BLOB_KEYS = ('properties', 'boundary_condition')
+_OBJECT_KEYS = ('rooms', 'orphaned_faces', 'orphaned_apertures', 'orphaned_doors',
+                'orphaned_shades', 'shade_meshes')
+
+
+def is_hbb(first_bytes):
+    """Check whether the first bytes of a file note that it is an HBB file.
+
+    Args:
+        first_bytes: The bytes at the start of a file. At least 4 bytes should
+            be input for the check to be accurate.
+    """
+    return first_bytes[:len(MAGIC)] == MAGIC
+
+
+def dump_hbb(model_dict, file_obj, room_polyfaces=None):
+    """Write a Model dictionary to an HBB file.
+
+    Args:
+        model_dict: A dictionary representation of a Model object. Note that
+            this dictionary will be mutated.
+        file_obj: A file-like object opened in binary mode.
+        room_polyfaces: An optional list of Polyface3D dictionaries with edge
+            information that align with the rooms of the model_dict. These will
+            be used to re-create the Room geometry without solving it when the
+            HBB is loaded. (Default: None).
+    """
+    coords, blobs, blob_ids = array('d'), [], {}
+    writer = _Packer(coords, blobs, blob_ids)
+    writer.pack_blobs(model_dict)
+    for key in _OBJECT_KEYS:
+        objs = model_dict.get(key)
+        if objs is not None:
+            for obj_dict in objs:
+                writer.pack_object(obj_dict)
+    if room_polyfaces is not None and 'rooms' in model_dict:
+        assert len(room_polyfaces) == len(model_dict['rooms']), 'Number of room ' \
+            'polyfaces ({}) does not match the number of rooms ({}).'.format(
+                len(room_polyfaces), len(model_dict['rooms']))
+        for room_dict, poly_dict in zip(model_dict['rooms'], room_polyfaces):
+            if poly_dict is not None:
+                room_dict['geometry'] = writer.pack_polyface(poly_dict)
+
+    if sys.byteorder == 'big':
+        coords.byteswap()
+    sections = (
+        _array_bytes(coords),
+        zlib.compress(json.dumps(model_dict).encode('utf-8')),
+        zlib.compress(json.dumps(blobs).encode('utf-8'))
+    )
+    file_obj.write(MAGIC)
+    for section in sections:
+        file_obj.write(_SECTION.pack(len(section)))
+        file_obj.write(section)
+
+
+def load_hbb(file_obj):
+    """Read a Model dictionary from an HBB file.
+
+    Args:
+        file_obj: A file-like object opened in binary mode.
+
+    Returns:
+        A tuple with two items.
+
+        -   model_dict: A dictionary representation of a Model object.
+
+        -   room_polyfaces: A list of Polyface3D dictionaries with edge information
+            that align with the rooms of the model_dict. Items will be None for
+            Rooms that were written without their Polyface3D.
+    """
+    magic = file_obj.read(len(MAGIC))
+    if not is_hbb(magic):
+        raise ValueError('File is not a valid HBB file or was written with an '
+                         'unsupported version of the format.')
+    coord_bytes, obj_bytes, blob_bytes = \
+        (file_obj.read(_SECTION.unpack(file_obj.read(_SECTION.size))[0])
+         for _ in range(3))
+    coords = array('d')
+    _array_load(coords, coord_bytes)
+    if sys.byteorder == 'big':
+        coords.byteswap()
+    model_dict = jsonutil.loads(zlib.decompress(obj_bytes).decode('utf-8'))
+    blobs = jsonutil.loads(zlib.decompress(blob_bytes).decode('utf-8'))
+
+    it = iter(coords)
+    reader = _Unpacker(list(zip(it, it, it)), blobs)
+    room_polyfaces = []
+    for room_dict in model_dict.get('rooms') or ():
+        poly_dict = room_dict.pop('geometry', None)
+        room_polyfaces.append(
+            reader.unpack_polyface(poly_dict) if poly_dict is not None else None)
+    reader.unpack_blobs(model_dict)
+    for key in _OBJECT_KEYS:
+        objs = model_dict.get(key)
+        if objs is not None:
+            for obj_dict in objs:
+                reader.unpack_object(obj_dict)
+    return model_dict, room_polyfaces
+
+
+class _Packer(object):
+    """Replace the vertices and blobs of object dictionaries with references."""
+    __slots__ = ('coords', 'blobs', 'blob_ids')
+
+    def __init__(self, coords, blobs, blob_ids):
+        self.coords = coords
+        self.blobs = blobs
+        self.blob_ids = blob_ids
+
+    def pack_object(self, obj_dict):
+        """Pack the geometry and blobs of an object and all of its children."""
+        geo = obj_dict.get('geometry')
+        if geo is not None:
+            obj_dict['geometry'] = self.pack_mesh(geo) if geo['type'] == 'Mesh3D' \
+                else self.pack_face3d(geo)
+        self.pack_blobs(obj_dict)
+        for key in _CHILD_KEYS:
+            children = obj_dict.get(key)
+            if children is not None:
+                for child in children:
+                    self.pack_object(child)
+
+    def pack_blobs(self, obj_dict):
+        """Replace the properties and boundary condition with blob table indices."""
+        for key in _BLOB_KEYS:
+            value = obj_dict.get(key)
+            if value is not None:
+                blob = json.dumps(value, sort_keys=True)
+                try:
+                    obj_dict[key] = self.blob_ids[blob]
+                except KeyError:  # first time that the blob has been found
+                    obj_dict[key] = self.blob_ids[blob] = len(self.blobs)
+                    self.blobs.append(blob)
+
+    def pack_points(self, points):
+        """Add a list of points to the coordinates and return their [index, count]."""
+        start = len(self.coords) // 3
+        extend = self.coords.extend
+        for pt in points:
+            extend(pt)
+        return [start, len(points)]
+
+    def pack_face3d(self, geo):
+        """Pack a Face3D dictionary."""
+        packed = {'type': 'Face3D', 'boundary': self.pack_points(geo['boundary'])}
+        if geo.get('holes') is not None:
+            packed['holes'] = [self.pack_points(hole) for hole in geo['holes']]
+        plane = geo.get('plane')
+        if plane is not None:
+            packed['plane'] = self.pack_points((plane['n'], plane['o'], plane['x']))[0]
+        return packed
+
+    def pack_mesh(self, geo):
+        """Pack a Mesh3D dictionary."""
+        packed = dict(geo)
+        packed['vertices'] = self.pack_points(geo['vertices'])
+        return packed
+
+    def pack_polyface(self, geo):
+        """Pack a Polyface3D dictionary."""
+        packed = dict(geo)
+        packed['vertices'] = self.pack_points(geo['vertices'])
+        return packed
+
+
+class _Unpacker(object):
+    """Restore the vertices and blobs of object dictionaries from references."""
+    __slots__ = ('points', 'blobs')
+
+    def __init__(self, points, blobs):
+        self.points = points
+        self.blobs = blobs
+
+    def unpack_object(self, obj_dict):
+        """Unpack the geometry and blobs of an object and all of its children."""
+        geo = obj_dict.get('geometry')
+        if geo is not None:
+            obj_dict['geometry'] = self.unpack_mesh(geo) if geo['type'] == 'Mesh3D' \
+                else self.unpack_face3d(geo)
+        self.unpack_blobs(obj_dict)
+        for key in _CHILD_KEYS:
+            children = obj_dict.get(key)
+            if children is not None:
+                for child in children:
+                    self.unpack_object(child)
+
+    def unpack_blobs(self, obj_dict):
+        """Replace blob table indices with properties and boundary conditions."""
+        for key in _BLOB_KEYS:
+            value = obj_dict.get(key)
+            if value is not None:  # decode each time so that no dict is shared
+                obj_dict[key] = jsonutil.loads(self.blobs[value])
+
+    def unpack_points(self, ref):
+        """Get a list of points from an [index, count] reference."""
+        start, count = ref
+        return self.points[start:start + count]
+
+    def unpack_face3d(self, geo):
+        """Unpack a Face3D dictionary."""
+        unpacked = {'type': 'Face3D', 'boundary': self.unpack_points(geo['boundary'])}
+        if 'holes' in geo:
+            unpacked['holes'] = [self.unpack_points(hole) for hole in geo['holes']]
+        if 'plane' in geo:
+            n, o, x = self.unpack_points((geo['plane'], 3))
+            unpacked['plane'] = {'type': 'Plane', 'n': n, 'o': o, 'x': x}
+        return unpacked
+
+    def unpack_mesh(self, geo):
+        """Unpack a Mesh3D dictionary."""
+        geo['vertices'] = self.unpack_points(geo['vertices'])
+        return geo
+
+    def unpack_polyface(self, geo):
+        """Unpack a Polyface3D dictionary."""
+        geo['vertices'] = self.unpack_points(geo['vertices'])
+        edge_info = geo.get('edge_information')
+        if edge_info is not None:  # restore the immutable types of the edges
+            edge_info['edge_indices'] = \
+                tuple(tuple(edge) for edge in edge_info['edge_indices'])
+            edge_info['edge_types'] = tuple(edge_info['edge_types'])
+        return geo
+
+
+def _array_bytes(values):
+    """Get the bytes of an array in both Python 2 and 3."""
+    try:
+        return values.tobytes()
+    except AttributeError:  # Python 2
+        return values.tostring()
+
+
+def _array_load(values, data):
+    """Extend an array with the values in bytes in both Python 2 and 3."""
+    try:
+        values.frombytes(data)
+    except AttributeError:  # Python 2
+        values.fromstring(data)
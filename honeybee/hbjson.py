@@ -0,0 +1,378 @@
+# coding=utf-8
+"""Utilities for reading and writing HBJSON files.
+
+The readers here parse the large arrays of a Model JSON (eg. rooms, orphaned
+objects, shade_meshes) one item at a time such that each item can be converted
+to a Python object and its raw dictionary discarded before the next item is read.
+This keeps the peak memory of loading large HBJSON files close to the size of
+the final Model object. Likewise, the writers here serialize the items of these
+arrays one at a time such that the dictionary and JSON string of the whole
+Model never need to be held in memory.
+
+When a faster JSON backend is installed (see honeybee.jsonutil), the readers
+find the end of each JSON object in the text that has been read and parse it
+with the backend. Otherwise, or if the end of the object has not been read yet,
+the json module is used to parse each item.
+
+HBJSON files can also be compressed with gzip or zstd (eg. .hbjson.gz or
+.hbjson.zst files), in which case they are decompressed as they are parsed such
+that the uncompressed text is never held in memory. The compression of a file
+is sensed from its first bytes rather than its extension. Note that the
+zstandard package must be installed to read and write zstd files.
+"""
+import io
+import re
+import json
+import gzip
+
+from . import jsonutil
+
+try:
+    import zstandard
+except ImportError:  # zstandard is not installed
+    zstandard = None
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+COMPRESSION_EXTENSIONS = {'gzip': '.gz', 'zstd': '.zst'}
+_WHITESPACE = ' \t\n\r'
+_BACKEND_ERRORS = (ValueError, TypeError, OverflowError)
+# closing braces that could end an object or an object in an array of objects
+_CLOSING_BRACE = re.compile(r'\}')
+_ARRAY_ITEM_END = re.compile(r'\}(?=\s*(?:,\s*\{|\]))')
+_DELIMITERS = _WHITESPACE + ',:]}'
+
+
+class JSONStreamReader(object):
+    """Incrementally read the members of a top-level JSON object from a text file.
+
+    Args:
+        file_obj: A file-like object opened in text mode that is positioned
+            before the opening brace of a JSON object.
+        chunk_size: An integer for the number of characters to read from the
+            file at a time. (Default: 65536).
+
+    Usage:
+
+    .. code-block:: python
+
+        with io.open('model.hbjson', encoding='utf-8') as inf:
+            reader = JSONStreamReader(inf)
+            for key, value in reader.members(('rooms',)):
+                if key == 'rooms':
+                    for room_dict in value:
+                        print(room_dict['identifier'])
+    """
+    __slots__ = (
+        '_file', '_chunk_size', '_buffer', '_pos', '_eof', '_decoder', '_scan_end')
+
+    def __init__(self, file_obj, chunk_size=65536):
+        self._file = file_obj
+        self._chunk_size = chunk_size
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+        self._scan_end = 0  # objects starting before this index use the json module
+
+    def members(self, stream_keys=()):
+        """Yield a tuple of (key, value) for each member of the JSON object.
+
+        Args:
+            stream_keys: A list of keys in the JSON object with array values
+                that should be streamed. For these keys, the value yielded
+                will be an iterator over the items of the array rather than a
+                list. This iterator should be consumed before the next member
+                is requested and any items left un-consumed will be skipped.
+                If the JSON value of a streamed key is not an array, the
+                value will be returned as it is (eg. None for null).
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self._decode()
+            self._expect(':')
+            if key in stream_keys and self._peek() == '[':
+                items = self._array_items()
+                yield key, items
+                for _ in items:  # skip any items that were not consumed
+                    pass
+            else:
+                yield key, self._decode()
+            if self._next_delimiter('}'):
+                return
+
+    def _array_items(self):
+        """Yield each item of the JSON array at the current position."""
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self._decode(True)
+            if self._next_delimiter(']'):
+                return
+
+    def _decode(self, in_array=False):
+        """Decode the JSON value at the current position of the buffer.
+
+        Args:
+            in_array: Boolean to note whether the value is an item of an array.
+        """
+        if self._peek() == '{' and self._pos >= self._scan_end and \
+                jsonutil.json_backend() != 'json':
+            try:
+                return self._backend_decode(in_array)
+            except ValueError:  # the backend cannot parse it; use the json module
+                pass
+        read_size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                if not self._read(read_size):
+                    raise
+            else:  # make sure that numbers were not truncated by the chunk
+                if (end < len(self._buffer) and self._buffer[end] in _DELIMITERS) \
+                        or not self._read(read_size):
+                    self._pos = end
+                    return value
+            # double the read size to avoid re-parsing large values many times
+            read_size = max(read_size, len(self._buffer) - self._pos)
+
+    def _backend_decode(self, in_array=False):
+        """Decode the JSON object at the current position with the jsonutil backend.
+
+        The end of the object is found in the text that has been read (plus one
+        more chunk if needed) by matching the counts of opening and closing
+        braces. This can be wrong when strings contain braces but object text
+        that ends at the wrong brace is never valid JSON such that the backend
+        will fail to parse it.
+
+        Args:
+            in_array: Boolean to note whether the object is an item of an array,
+                in which case only the closing braces that are followed by
+                another object or the end of the array are checked first.
+
+        Raises:
+            ValueError if the end of the object could not be found or the
+            backend could not parse it (eg. because it contains NaN). In this
+            case, the object should be decoded with the json module. When the
+            end is not found, the objects that start in the text that was
+            scanned are also decoded with the json module since strings with
+            unbalanced braces (eg. in display names) would otherwise make each
+            of them scan the rest of the text.
+        """
+        patterns = (_ARRAY_ITEM_END, _CLOSING_BRACE) if in_array else (_CLOSING_BRACE,)
+        for attempt in range(2):  # read once more in case it ends in the next chunk
+            buf, start = self._buffer, self._pos
+            for pattern in patterns:
+                end = self._object_end(buf, start, pattern)
+                if end is not None:
+                    try:
+                        value = jsonutil.backend_loads(buf[start:end])
+                    except _BACKEND_ERRORS as e:
+                        raise ValueError(str(e))
+                    self._pos = end
+                    return value
+            if attempt or not self._read(max(self._chunk_size, len(buf) - start)):
+                break
+        self._scan_end = len(self._buffer)
+        raise ValueError('The end of the JSON object has not been read.')
+
+    @staticmethod
+    def _object_end(buf, start, pattern):
+        """Get the end of the JSON object that starts at an index of a buffer.
+
+        Args:
+            buf: Text for the buffer containing the object.
+            start: Index of the opening brace of the object.
+            pattern: A compiled regular expression for the closing braces to
+                be checked as the end of the object.
+
+        Returns:
+            The index after the first closing brace matching the pattern where
+            the count of opening braces since the start equals the count of
+            closing braces. None if there is no such brace in the buffer.
+        """
+        opens, closes, pos = 1, 0, start + 1
+        for match in pattern.finditer(buf, pos):
+            end = match.end()
+            opens += buf.count('{', pos, end)
+            closes += buf.count('}', pos, end)
+            pos = end
+            if opens == closes:
+                return end
+        return None
+
+    def _next_delimiter(self, closing):
+        """Consume a comma or closing bracket and return True if it was closing."""
+        char = self._peek()
+        self._pos += 1
+        if char == closing:
+            return True
+        if char != ',':
+            raise ValueError(
+                'Expected "," or "{}" in JSON but got "{}".'.format(closing, char))
+        return False
+
+    def _expect(self, char):
+        """Consume a given character from the buffer, skipping whitespace."""
+        found = self._peek()
+        if found != char:
+            raise ValueError('Expected "{}" in JSON but got "{}".'.format(char, found))
+        self._pos += 1
+
+    def _peek(self):
+        """Get the next non-whitespace character without consuming it."""
+        while True:
+            buf, pos = self._buffer, self._pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._read(self._chunk_size):
+                raise ValueError('Unexpected end of JSON file.')
+
+    def _read(self, size):
+        """Append characters from the file to the buffer, dropping consumed text.
+
+        Returns:
+            False if the end of the file has been reached. True otherwise.
+        """
+        if self._eof:
+            return False
+        text = self._file.read(size)
+        if not text:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + text
+        self._scan_end = max(self._scan_end - self._pos, 0)
+        self._pos = 0
+        return True
+
+
+def dump_json_members(members, file_obj, stream_keys=(), indent=None):
+    """Write a JSON object to a file from its members, streaming large arrays.
+
+    The text written is identical to that of json.dump for a dictionary with
+    the same members (in the same order) but the values of the stream_keys
+    are serialized one item at a time.
+
+    Args:
+        members: An iterable of (key, value) tuples for the members of the
+            JSON object. This can be a generator such that each value is only
+            created once the previous one has been written.
+        file_obj: A file-like object opened in text mode to which the JSON
+            will be written.
+        stream_keys: A list of keys in the members with values that should be
+            streamed. For these keys, the value should be an iterable of the
+            items of the array (eg. a generator of dictionaries).
+        indent: An optional positive integer or string to set the indentation
+            of the JSON, which matches the indent argument of json.dump. None
+            will write the most compact representation. (Default: None).
+    """
+    if indent is not None and not isinstance(indent, str):
+        indent = ' ' * indent
+    item_sep = ', ' if indent is None else ','
+
+    def newline(level):
+        return '' if indent is None else '\n' + indent * level
+
+    def dumps(value, level):
+        text = json.dumps(value, indent=indent)
+        return text if indent is None else text.replace('\n', newline(level))
+
+    written = False
+    for key, value in members:
+        file_obj.write(item_sep if written else '{')
+        file_obj.write(newline(1) + json.dumps(key) + ': ')
+        written = True
+        if key not in stream_keys:
+            file_obj.write(dumps(value, 1))
+            continue
+        items_written = False
+        for item in value:
+            file_obj.write(item_sep if items_written else '[')
+            file_obj.write(newline(2) + dumps(item, 2))
+            items_written = True
+        file_obj.write(newline(1) + ']' if items_written else '[]')
+    file_obj.write(newline(0) + '}' if written else '{}')
+
+
+def compression_type(first_bytes):
+    """Get the type of compression of a file from its first bytes.
+
+    Args:
+        first_bytes: The first bytes of a file, which should be at least 4
+            bytes long to sense all types of compression.
+
+    Returns:
+        Text for the type of compression (either gzip or zstd). None if the
+        file is not compressed.
+    """
+    if first_bytes.startswith(GZIP_MAGIC):
+        return 'gzip'
+    if first_bytes.startswith(ZSTD_MAGIC):
+        return 'zstd'
+    return None
+
+
+def open_hbjson(file_path, mode='r', compression=None):
+    """Open a HBJSON file as a text file object that is (de)compressed as a stream.
+
+    Args:
+        file_path: Path to a HBJSON file, which can be compressed with gzip or zstd.
+        mode: Text for the mode in which the file is opened. Choose from r to
+            read the file or w to write the file. (Default: r).
+        compression: Text for the type of compression used to write the file.
+            Choose from gzip or zstd. None will write an uncompressed file. This
+            input is ignored when reading since the compression is sensed from
+            the first bytes of the file. (Default: None).
+
+    Returns:
+        A file object opened in text mode with utf-8 encoding.
+    """
+    assert mode in ('r', 'w'), 'HBJSON file mode "{}" is not r or w.'.format(mode)
+    if mode == 'r':
+        with open(file_path, 'rb') as inf:
+            compression = compression_type(inf.read(len(ZSTD_MAGIC)))
+    elif compression is not None:
+        assert compression in COMPRESSION_EXTENSIONS, 'HBJSON compression "{}" ' \
+            'is not recognized. Choose from: {}.'.format(
+                compression, ', '.join(sorted(COMPRESSION_EXTENSIONS)))
+    if compression is None:
+        return io.open(file_path, encoding='utf-8') if mode == 'r' \
+            else open(file_path, 'w')
+    if compression == 'gzip':  # set mtime to 0 so that files are reproducible
+        stream = gzip.GzipFile(file_path, mode + 'b', mtime=0)
+        return io.TextIOWrapper(stream, encoding='utf-8')
+    assert zstandard is not None, 'The zstandard package must be installed ' \
+        'to read or write zstd compressed HBJSON files.'
+    return zstandard.open(file_path, mode + 't', encoding='utf-8')
+
+
+def strip_geometry(obj_dict):
+    """Remove the geometry from a honeybee object dictionary and its child objects.
+
+    This is useful for keeping only the identifiers and properties of objects
+    that have already been converted to Python, which are needed by extensions
+    to apply their properties to a Model.
+
+    Args:
+        obj_dict: A dictionary of a Room, Face, Aperture, Door, Shade or ShadeMesh.
+            Note that this dictionary will be mutated.
+    """
+    obj_dict.pop('geometry', None)
+    for key in ('faces', 'apertures', 'doors', 'indoor_shades', 'outdoor_shades'):
+        try:
+            children = obj_dict[key]
+        except KeyError:
+            continue
+        if children is not None:
+            for child in children:
+                strip_geometry(child)
+    return obj_dict
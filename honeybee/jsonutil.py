@@ -0,0 +1,128 @@
+# coding=utf-8
+"""Pluggable JSON backend used to parse honeybee JSON documents.
+
+A faster JSON library (orjson, simdjson or ujson) will be used to parse JSON
+text if one of them is installed and the standard library json module will be
+used otherwise. Any text that the fast library cannot parse (eg. the NaN and
+Infinity values that the json module writes for non-finite floats) is re-parsed
+with the json module such that all JSON written by honeybee can be read.
+
+Note that JSON text is always written with the json module since none of the
+fast libraries reproduce its formatting of floats (eg. orjson writes 1e-05 as
+0.00001 and ujson writes it as 1e-5), which would change the bytes of
+HBJSON files written by honeybee.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is not installed
+    orjson = None
+try:
+    import simdjson
+except ImportError:  # pysimdjson is not installed
+    simdjson = None
+try:
+    import ujson
+except ImportError:  # ujson is not installed
+    ujson = None
+
+# the JSON backends in order of preference along with their loads function
+BACKENDS = ('orjson', 'simdjson', 'ujson', 'json')
+_LOADS = {
+    'orjson': orjson.loads if orjson is not None else None,
+    'simdjson': simdjson.loads if simdjson is not None else None,
+    'ujson': ujson.loads if ujson is not None else None,
+    'json': json.loads
+}
+_backend = None
+
+
+def available_backends():
+    """Get a tuple with the names of the JSON backends that are installed."""
+    return tuple(name for name in BACKENDS if _LOADS[name] is not None)
+
+
+def json_backend():
+    """Get the name of the JSON backend currently used to parse JSON text."""
+    return _backend
+
+
+def set_json_backend(name=None):
+    """Set the JSON backend used to parse JSON text.
+
+    Args:
+        name: Text for the name of the JSON backend to be used. Choose from
+            orjson, simdjson, ujson or json. None will use the first installed
+            backend in this order of preference. (Default: None).
+
+    Returns:
+        The name of the JSON backend that was set.
+    """
+    global _backend
+    if name is None:
+        name = available_backends()[0]
+    assert name in BACKENDS, 'JSON backend "{}" is not recognized. Choose from: ' \
+        '{}.'.format(name, ', '.join(BACKENDS))
+    assert _LOADS[name] is not None, 'JSON backend "{}" is not installed.'.format(name)
+    _backend = name
+    return _backend
+
+
+def loads(text):
+    """Parse a JSON string into Python objects using the current backend.
+
+    Args:
+        text: A JSON string. This can also be bytes of UTF-8 encoded JSON.
+
+    Returns:
+        The Python object represented by the JSON.
+    """
+    if _backend != 'json':
+        try:
+            return _LOADS[_backend](text)
+        except (ValueError, TypeError, OverflowError):
+            pass  # text that only the json module can parse (eg. NaN)
+    if isinstance(text, bytes):
+        text = text.decode('utf-8')
+    return json.loads(text)
+
+
+def backend_loads(text):
+    """Parse a JSON string using only the current backend.
+
+    Unlike the loads function, the text is not re-parsed with the json module
+    if the backend cannot parse it, which is useful when the text is only a
+    guess at a complete JSON value.
+
+    Args:
+        text: A JSON string. This can also be bytes of UTF-8 encoded JSON.
+
+    Raises:
+        ValueError, TypeError or OverflowError if the backend cannot parse the text.
+    """
+    return _LOADS[_backend](text)
+
+
+def load(file_obj):
+    """Parse a JSON file object into Python objects using the current backend.
+
+    Args:
+        file_obj: A file-like object opened in text or binary mode.
+    """
+    return loads(file_obj.read())
+
+
+def dumps(obj, indent=None):
+    """Get a JSON string of Python objects with the formatting of json.dumps.
+
+    Args:
+        obj: A Python object that can be serialized to JSON (eg. a dictionary).
+        indent: An optional positive integer or string to set the indentation
+            of the JSON. None will write the most compact representation.
+            (Default: None).
+    """
+    return json.dumps(obj, indent=indent)
+
+
+set_json_backend()
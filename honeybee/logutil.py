@@ -77,3 +77,18 @@ def get_logger(name, filename='honeybee.log', file_log_level='DEBUG',
     logger.addHandler(stream_handler)
 
     return logger
+
+
+class ErrorMessageHandler(logging.Handler):
+    """Logging handler that keeps the messages of all errors that are logged.
+
+    This is useful for reporting the errors of commands that are run in the
+    current process (eg. by the batch and serve commands of the CLI).
+    """
+
+    def __init__(self):
+        logging.Handler.__init__(self, ERROR)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
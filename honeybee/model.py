@@ -14,7 +14,8 @@ except ImportError:  # wea are in cPython
     import pickle
 
 from ladybug_geometry.geometry2d import Polygon2D
-from ladybug_geometry.geometry3d import Vector3D, Plane, Face3D, Mesh3D, Polyface3D
+from ladybug_geometry.geometry3d import Point3D, Vector3D, LineSegment3D, Plane, \
+    Face3D, Mesh3D, Polyface3D
 from ladybug_geometry.bounding import overlapping_bounding_boxes
 from ladybug_geometry.interop.stl import STL
 
@@ -22,6 +23,15 @@ from ._base import _Base
 from .units import conversion_factor_to_meters, parse_distance_string, \
     UNITS, UNITS_TOLERANCES
 from .checkdup import check_duplicate_identifiers, check_duplicate_identifiers_parent
+from . import jsonutil
+from .hbjson import JSONStreamReader, dump_json_members, strip_geometry, \
+    compression_type, open_hbjson, COMPRESSION_EXTENSIONS
+from .hbb import MAGIC as HBB_MAGIC, is_hbb, dump_hbb, load_hbb
+from .spatial import grid_cell_size, grid_key, neighbor_keys, geometry_box, \
+    BoundingBoxTree, PlaneHashGrid
+from .parallel import worker_count, chunk_list, process_pool, parallel_map
+from .transform import is_available as batch_transform_available, BatchTransform, \
+    move_matrix, rotate_matrix, rotate_xy_matrix, reflect_matrix, scale_matrix
 from .properties import ModelProperties
 from .room import Room
 from .face import Face
@@ -36,10 +46,6 @@ from .boundarycondition import Outdoors, Surface
 from .facetype import AirBoundary, Wall, Floor, RoofCeiling, face_types
 import honeybee.writer.model as writer
 from honeybee.boundarycondition import boundary_conditions as bcs
-try:
-    ad_bc = bcs.adiabatic
-except AttributeError:  # honeybee_energy is not loaded and adiabatic does not exist
-    ad_bc = None
 
 
 class Model(_Base):
@@ -127,7 +133,8 @@ class Model(_Base):
     __slots__ = (
         '_rooms', '_orphaned_faces', '_orphaned_apertures', '_orphaned_doors',
         '_orphaned_shades', '_shade_meshes',
-        '_units', '_tolerance', '_angle_tolerance'
+        '_units', '_tolerance', '_angle_tolerance', '_object_cache',
+        '_check_results', '_face_index'
     )
 
     # dictionary mapping validation error codes to a corresponding check function
@@ -154,12 +161,32 @@ class Model(_Base):
     }
     UNITS = UNITS
     UNITS_TOLERANCES = UNITS_TOLERANCES
+    # keys of a Model dictionary for objects and a mapping to the class of each object
+    _OBJECT_KEYS = (
+        'rooms', 'orphaned_faces', 'orphaned_apertures', 'orphaned_doors',
+        'orphaned_shades', 'shade_meshes'
+    )
+    _OBJECT_CLASSES = {
+        'rooms': Room,
+        'orphaned_faces': Face,
+        'orphaned_apertures': Aperture,
+        'orphaned_doors': Door,
+        'orphaned_shades': Shade,
+        'shade_meshes': ShadeMesh
+    }
+    # types of objects that can be indexed with the spatial_index method
+    _SPATIAL_INDEX_TYPES = (
+        'Room', 'Face', 'Aperture', 'Door', 'SubFace', 'Shade', 'ShadeMesh'
+    )
 
     def __init__(self, identifier, rooms=None, orphaned_faces=None, orphaned_shades=None,
                  orphaned_apertures=None, orphaned_doors=None, shade_meshes=None,
                  units='Meters', tolerance=None, angle_tolerance=1.0):
         """A collection of Rooms, Faces, Apertures, and Doors for an entire model."""
         _Base.__init__(self, identifier)  # process the identifier
+        self._object_cache = None  # lazily-built lists and indices of objects
+        self._check_results = None  # results of checks that were run in parallel
+        self._face_index = None  # hash grid of Room Face centers for adjacency
 
         self.units = units
         self.tolerance = tolerance
@@ -175,7 +202,7 @@ class Model(_Base):
         self._properties = ModelProperties(self)
 
     @classmethod
-    def from_dict(cls, data, cleanup_irrational=False):
+    def from_dict(cls, data, cleanup_irrational=False, workers=None):
         """Initialize a Model from a dictionary.
 
         Args:
@@ -185,6 +212,10 @@ class Model(_Base):
                 serializing the model to Python. Typical cases that are removed
                 this way include Face3Ds with fewer than 3 vertices, Rooms that
                 have no Face geometry, etc. (Default: False).
+            workers: An optional integer for the number of worker processes
+                over which the Rooms and orphaned objects will be serialized.
+                Zero or a negative number will use all available CPUs. None will
+                serialize all objects in the current process. (Default: None).
         """
         # check the type of dictionary
         assert data['type'] == 'Model', 'Expected Model dictionary. ' \
@@ -203,116 +234,209 @@ class Model(_Base):
             cls.clean_irrational_geometry(data)
 
         # import all of the geometry
-        rooms = None  # import rooms
-        if 'rooms' in data and data['rooms'] is not None:
-            rooms = []
-            for r in data['rooms']:
-                try:
-                    rooms.append(Room.from_dict(r, tol))
-                except Exception as e:
-                    invalid_dict_error(r, e)
-        orphaned_faces = None  # import orphaned faces
-        if 'orphaned_faces' in data and data['orphaned_faces'] is not None:
-            orphaned_faces = []
-            for f in data['orphaned_faces']:
-                try:
-                    orphaned_faces.append(Face.from_dict(f))
-                except Exception as e:
-                    invalid_dict_error(f, e)
-        orphaned_apertures = None  # import orphaned apertures
-        if 'orphaned_apertures' in data and data['orphaned_apertures'] is not None:
-            orphaned_apertures = []
-            for a in data['orphaned_apertures']:
-                try:
-                    orphaned_apertures.append(Aperture.from_dict(a))
-                except Exception as e:
-                    invalid_dict_error(a, e)
-        orphaned_doors = None  # import orphaned doors
-        if 'orphaned_doors' in data and data['orphaned_doors'] is not None:
-            orphaned_doors = []
-            for d in data['orphaned_doors']:
-                try:
-                    orphaned_doors.append(Door.from_dict(d))
-                except Exception as e:
-                    invalid_dict_error(d, e)
-        orphaned_shades = None  # import orphaned shades
-        if 'orphaned_shades' in data and data['orphaned_shades'] is not None:
-            orphaned_shades = []
-            for s in data['orphaned_shades']:
-                try:
-                    orphaned_shades.append(Shade.from_dict(s))
-                except Exception as e:
-                    invalid_dict_error(s, e)
-        shade_meshes = None  # import shade meshes
-        if 'shade_meshes' in data and data['shade_meshes'] is not None:
-            shade_meshes = []
-            for sm in data['shade_meshes']:
-                try:
-                    shade_meshes.append(ShadeMesh.from_dict(sm))
-                except Exception as e:
-                    invalid_dict_error(sm, e)
-
-        # build the model object
-        model = Model(
-            data['identifier'], rooms, orphaned_faces, orphaned_shades,
-            orphaned_apertures, orphaned_doors, shade_meshes,
-            units, tol, angle_tol)
-        if 'display_name' in data and data['display_name'] is not None:
-            model.display_name = data['display_name']
-        if 'user_data' in data and data['user_data'] is not None:
-            model.user_data = data['user_data']
+        tasks, task_keys = [], []
+        w_count = worker_count(workers)
+        chunk_count = 4 * w_count if w_count > 1 else 1
+        for key in cls._OBJECT_KEYS:
+            if key in data and data[key] is not None:
+                args = (tol,) if key == 'rooms' else ()
+                for chunk in chunk_list(data[key], chunk_count):
+                    tasks.append((cls._OBJECT_CLASSES[key], chunk, args))
+                    task_keys.append(key)
+        objects = {}
+        for key, objs in zip(task_keys, parallel_map(_dicts_to_objects, tasks, workers)):
+            try:
+                objects[key].extend(objs)
+            except KeyError:  # first chunk of objects for the key
+                objects[key] = objs
 
-        # assign extension properties to the model
-        model.properties.apply_properties_from_dict(data)
-        return model
+        return cls._model_from_objects(data, objects, units, tol, angle_tol)
 
     @classmethod
-    def from_file(cls, hb_file, cleanup_irrational=False):
-        """Initialize a Model from a HBJSON or HBpkl file, auto-sensing the type.
+    def from_file(cls, hb_file, cleanup_irrational=False, workers=None):
+        """Initialize a Model from a HBJSON, HBB or HBpkl file, auto-sensing the type.
 
         Args:
-            hb_file: Path to either a HBJSON or HBpkl file.
+            hb_file: Path to either a HBJSON, HBB or HBpkl file. HBJSON files
+                compressed with gzip or zstd are also accepted.
             cleanup_irrational: Boolean to note whether common types of irrational
                 objects should be cleaned or removed from the dictionary before
                 serializing the model to Python. Typical cases that are removed
                 this way include Face3Ds with fewer than 3 vertices, Rooms that
                 have no Face geometry, etc. (Default: False).
+            workers: An optional integer for the number of worker processes
+                over which the Rooms and orphaned objects will be serialized.
+                Zero or a negative number will use all available CPUs. None will
+                serialize all objects in the current process. (Default: None).
         """
-        # sense the file type from the first character to avoid maxing memory with JSON
+        # sense the file type from the first bytes to avoid maxing memory with JSON
         # this is needed since queenbee overwrites all file extensions
+        with open(hb_file, 'rb') as inf:
+            first_bytes = inf.read(len(HBB_MAGIC))
+        if is_hbb(first_bytes):
+            return cls.from_hbb(hb_file, cleanup_irrational, workers)
+        if compression_type(first_bytes) is not None:
+            return cls.from_hbjson(hb_file, cleanup_irrational, workers)
+        # the JSON may start with a byte order mark that decodes to one character
         with io.open(hb_file, encoding='utf-8') as inf:
             first_char = inf.read(1)
             second_char = inf.read(1)
         is_json = True if first_char == '{' or second_char == '{' else False
         # load the file using either HBJSON pathway or HBpkl
         if is_json:
-            return cls.from_hbjson(hb_file, cleanup_irrational)
-        return cls.from_hbpkl(hb_file, cleanup_irrational)
+            return cls.from_hbjson(hb_file, cleanup_irrational, workers)
+        return cls.from_hbpkl(hb_file, cleanup_irrational, workers)
 
     @classmethod
-    def from_hbjson(cls, hbjson_file, cleanup_irrational=False):
+    def from_hbjson(cls, hbjson_file, cleanup_irrational=False, workers=None):
         """Initialize a Model from a HBJSON file.
 
         Args:
-            hbjson_file: Path to HBJSON file.
+            hbjson_file: Path to HBJSON file. This file can be compressed with
+                gzip or zstd, in which case it will be decompressed as it is read.
             cleanup_irrational: Boolean to note whether common types of irrational
                 objects should be cleaned or removed from the dictionary before
                 serializing the model to Python. Typical cases that are removed
                 this way include Face3Ds with fewer than 3 vertices, Rooms that
                 have no Face geometry, etc. (Default: False).
+            workers: An optional integer for the number of worker processes
+                over which the Rooms and orphaned objects will be serialized.
+                Zero or a negative number will use all available CPUs. None will
+                serialize all objects in the current process. (Default: None).
         """
         assert os.path.isfile(hbjson_file), 'Failed to find %s' % hbjson_file
-        with io.open(hbjson_file, encoding='utf-8') as inf:
+        with open_hbjson(hbjson_file) as inf:
             inf.read(1)
             second_char = inf.read(1)
-        with io.open(hbjson_file, encoding='utf-8') as inf:
+        with open_hbjson(hbjson_file) as inf:
             if second_char == '{':
                 inf.read(1)
-            data = json.load(inf)
-        return cls.from_dict(data, cleanup_irrational)
+            return cls._from_json_stream(inf, cleanup_irrational, workers)
+
+    @classmethod
+    def _from_json_stream(cls, json_file, cleanup_irrational=False, workers=None):
+        """Initialize a Model by streaming the objects of a Model JSON file.
+
+        Each Room, orphaned object and ShadeMesh is converted to Python as soon
+        as it is read from the file (or in small batches when using workers).
+        Only the identifiers and properties of these objects are kept (without
+        geometry) such that extensions can apply their properties to the Model
+        once all objects are loaded.
+
+        Args:
+            json_file: A file object opened in text mode and positioned before
+                the opening brace of the Model JSON.
+            cleanup_irrational: Boolean to note whether common types of irrational
+                objects should be cleaned or removed from the dictionary before
+                serializing the model to Python.
+            workers: An optional integer for the number of worker processes
+                over which the objects will be serialized. (Default: None).
+        """
+        data, objects, deferred_rooms = {}, {}, False
+        pool = process_pool(workers)
+        batch_size = 16 * worker_count(workers) if pool is not None else 1
+        try:
+            reader = JSONStreamReader(json_file)
+            for key, value in reader.members(cls._OBJECT_CLASSES):
+                if key not in cls._OBJECT_CLASSES or value is None:
+                    if key == 'type':
+                        assert value == 'Model', \
+                            'Expected Model dictionary. Got {}.'.format(value)
+                    data[key] = value
+                    continue
+                # determine whether the model tolerance is known for the rooms
+                obj_class, args = cls._OBJECT_CLASSES[key], ()
+                if key == 'rooms':
+                    if 'tolerance' in data and data['tolerance'] is not None:
+                        args = (data['tolerance'],)
+                    elif 'tolerance' in data and 'units' in data:
+                        args = (cls.UNITS_TOLERANCES[data['units'] or 'Meters'],)
+                    else:  # solve the room geometry once the tolerance is known
+                        deferred_rooms = True
+                # convert each batch of objects to Python and keep only properties
+                objs, obj_dicts, batch = [], [], []
+                for obj_dict in value:
+                    if cleanup_irrational:
+                        clean_dict = {key: [obj_dict]}
+                        cls.clean_irrational_geometry(clean_dict)
+                        if len(clean_dict[key]) == 0:
+                            continue
+                    batch.append(obj_dict)
+                    if len(batch) == batch_size:
+                        objs.extend(cls._batch_to_objects(obj_class, batch, args, pool))
+                        obj_dicts.extend(strip_geometry(b_dict) for b_dict in batch)
+                        batch = []
+                objs.extend(cls._batch_to_objects(obj_class, batch, args, pool))
+                obj_dicts.extend(strip_geometry(b_dict) for b_dict in batch)
+                objects[key], data[key] = objs, obj_dicts
+
+            # solve the room geometry if the tolerance was not known for the rooms
+            tol = cls.UNITS_TOLERANCES[data.get('units') or 'Meters'] \
+                if data.get('tolerance') is None else data['tolerance']
+            if deferred_rooms and tol != 0:
+                if pool is None:
+                    for room in objects['rooms']:
+                        room._solve_geometry(tol)
+                else:
+                    tasks = [(chunk, tol) for chunk in chunk_list(
+                        objects['rooms'], 4 * worker_count(workers))]
+                    results = parallel_map(_solve_room_geometry, tasks, pool=pool)
+                    objects['rooms'] = [room for rooms in results for room in rooms]
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        # import the units and tolerance values
+        units = 'Meters' if 'units' not in data or data['units'] is None \
+            else data['units']
+        tol = cls.UNITS_TOLERANCES[units] if 'tolerance' not in data or \
+            data['tolerance'] is None else data['tolerance']
+        angle_tol = 1.0 if 'angle_tolerance' not in data or \
+            data['angle_tolerance'] is None else data['angle_tolerance']
+
+        return cls._model_from_objects(data, objects, units, tol, angle_tol)
+
+    @classmethod
+    def _model_from_objects(cls, data, objects, units, tolerance, angle_tolerance):
+        """Build a Model from its objects and apply the properties of its dictionary.
+
+        Args:
+            data: A dictionary representation of the Model, which is used to assign
+                the identifier, display_name, user_data and extension properties.
+            objects: A dictionary with keys from the _OBJECT_KEYS and values
+                for the lists of Python objects under each key.
+            units: Text for the units system of the Model.
+            tolerance: The absolute tolerance of the Model.
+            angle_tolerance: The angle tolerance of the Model in degrees.
+        """
+        # build the model object
+        model = Model(
+            data['identifier'], objects.get('rooms'), objects.get('orphaned_faces'),
+            objects.get('orphaned_shades'), objects.get('orphaned_apertures'),
+            objects.get('orphaned_doors'), objects.get('shade_meshes'),
+            units, tolerance, angle_tolerance)
+        if 'display_name' in data and data['display_name'] is not None:
+            model.display_name = data['display_name']
+        if 'user_data' in data and data['user_data'] is not None:
+            model.user_data = data['user_data']
+
+        # assign extension properties to the model
+        model.properties.apply_properties_from_dict(data)
+        return model
+
+    @staticmethod
+    def _batch_to_objects(obj_class, obj_dicts, args=(), pool=None):
+        """Convert a batch of object dictionaries to Python using an optional pool."""
+        if pool is None or len(obj_dicts) < 2:
+            return _dicts_to_objects((obj_class, obj_dicts, args))
+        tasks = [(obj_class, chunk, args) for chunk in
+                 chunk_list(obj_dicts, len(obj_dicts) // 4 or 1)]
+        results = parallel_map(_dicts_to_objects, tasks, pool=pool)
+        return [obj for objs in results for obj in objs]
 
     @classmethod
-    def from_hbpkl(cls, hbpkl_file, cleanup_irrational=False):
+    def from_hbpkl(cls, hbpkl_file, cleanup_irrational=False, workers=None):
         """Initialize a Model from a HBpkl file.
 
         Args:
@@ -322,11 +446,72 @@ class Model(_Base):
                 serializing the model to Python. Typical cases that are removed
                 this way include Face3Ds with fewer than 3 vertices, Rooms that
                 have no Face geometry, etc. (Default: False).
+            workers: An optional integer for the number of worker processes
+                over which the Rooms and orphaned objects will be serialized.
+                Zero or a negative number will use all available CPUs. None will
+                serialize all objects in the current process. (Default: None).
         """
         assert os.path.isfile(hbpkl_file), 'Failed to find %s' % hbpkl_file
         with open(hbpkl_file, 'rb') as inf:
             data = pickle.load(inf)
-        return cls.from_dict(data, cleanup_irrational)
+        return cls.from_dict(data, cleanup_irrational, workers)
+
+    @classmethod
+    def from_hbb(cls, hbb_file, cleanup_irrational=False, workers=None):
+        """Initialize a Model from a HBB file.
+
+        The Room geometry stored in the HBB is used directly such that the closed
+        volume of each Room does not need to be solved again.
+
+        Args:
+            hbb_file: Path to HBB file.
+            cleanup_irrational: Boolean to note whether common types of irrational
+                objects should be cleaned or removed from the dictionary before
+                serializing the model to Python. Typical cases that are removed
+                this way include Face3Ds with fewer than 3 vertices, Rooms that
+                have no Face geometry, etc. Note that the Room geometry will be
+                solved again when this is True. (Default: False).
+            workers: An optional integer for the number of worker processes
+                over which the Rooms and orphaned objects will be serialized.
+                Zero or a negative number will use all available CPUs. None will
+                serialize all objects in the current process. (Default: None).
+        """
+        assert os.path.isfile(hbb_file), 'Failed to find %s' % hbb_file
+        with open(hbb_file, 'rb') as inf:
+            data, room_polyfaces = load_hbb(inf)
+        if cleanup_irrational:  # the stored room geometry may no longer align
+            return cls.from_dict(data, cleanup_irrational, workers)
+
+        # import the units and tolerance values
+        units = 'Meters' if 'units' not in data or data['units'] is None \
+            else data['units']
+        tol = cls.UNITS_TOLERANCES[units] if 'tolerance' not in data or \
+            data['tolerance'] is None else data['tolerance']
+        angle_tol = 1.0 if 'angle_tolerance' not in data or \
+            data['angle_tolerance'] is None else data['angle_tolerance']
+
+        # import all of the geometry
+        tasks, task_keys = [], []
+        w_count = worker_count(workers)
+        chunk_count = 4 * w_count if w_count > 1 else 1
+        for key in cls._OBJECT_KEYS:
+            if key in data and data[key] is not None:
+                if key == 'rooms':
+                    chunks = zip(chunk_list(data[key], chunk_count),
+                                 chunk_list(room_polyfaces, chunk_count))
+                    tasks.extend((Room, chunk, (polys, tol)) for chunk, polys in chunks)
+                else:
+                    tasks.extend((cls._OBJECT_CLASSES[key], chunk, ())
+                                 for chunk in chunk_list(data[key], chunk_count))
+                task_keys.extend([key] * (len(tasks) - len(task_keys)))
+        objects = {}
+        for key, objs in zip(task_keys, parallel_map(_hbb_dicts_to_objects, tasks,
+                                                     workers)):
+            try:
+                objects[key].extend(objs)
+            except KeyError:  # first chunk of objects for the key
+                objects[key] = objs
+        return cls._model_from_objects(data, objects, units, tol, angle_tol)
 
     @classmethod
     def from_stl(cls, file_path, geometry_to_faces=False, units='Meters',
@@ -473,10 +658,10 @@ class Model(_Base):
             'Failed to find %s' % sync_instructions_file
         if sys.version_info < (3, 0):
             with open(sync_instructions_file) as inf:
-                sync_instructions = json.load(inf)
+                sync_instructions = jsonutil.load(inf)
         else:
             with open(sync_instructions_file, encoding='utf-8') as inf:
-                sync_instructions = json.load(inf)
+                sync_instructions = jsonutil.load(inf)
         return cls.from_sync(base_model, other_model, sync_instructions)
 
     @classmethod
@@ -574,6 +759,8 @@ class Model(_Base):
         room.display_name = 'Shoe_Box_Room'
         front_face = room[1]
         front_face.apertures_by_ratio(window_ratio, tolerance)
+        # adiabatic is None if honeybee_energy is not installed
+        ad_bc = getattr(bcs, 'adiabatic', None)
         if adiabatic and ad_bc:
             room[0].boundary_condition = ad_bc  # make the floor adiabatic
             for face in room[2:]:  # make all other face adiabatic
@@ -747,78 +934,27 @@ class Model(_Base):
     @property
     def faces(self):
         """Get a list of all Face objects in the model."""
-        child_faces = [face for room in self._rooms for face in room._faces]
-        return child_faces + self._orphaned_faces
+        return self._cached_objects('faces')
 
     @property
     def apertures(self):
         """Get a list of all Aperture objects in the model."""
-        child_apertures = []
-        for room in self._rooms:
-            for face in room._faces:
-                child_apertures.extend(face._apertures)
-        for face in self._orphaned_faces:
-            child_apertures.extend(face._apertures)
-        return child_apertures + self._orphaned_apertures
+        return self._cached_objects('apertures')
 
     @property
     def doors(self):
         """Get a list of all Door objects in the model."""
-        child_doors = []
-        for room in self._rooms:
-            for face in room._faces:
-                child_doors.extend(face._doors)
-        for face in self._orphaned_faces:
-            child_doors.extend(face._doors)
-        return child_doors + self._orphaned_doors
+        return self._cached_objects('doors')
 
     @property
     def shades(self):
         """Get a list of all Shade objects in the model."""
-        child_shades = []
-        for room in self._rooms:
-            child_shades.extend(room.shades)
-            for face in room.faces:
-                child_shades.extend(face.shades)
-                for ap in face._apertures:
-                    child_shades.extend(ap.shades)
-                for dr in face._doors:
-                    child_shades.extend(dr.shades)
-        for face in self._orphaned_faces:
-            child_shades.extend(face.shades)
-            for ap in face._apertures:
-                child_shades.extend(ap.shades)
-            for dr in face._doors:
-                child_shades.extend(dr.shades)
-        for ap in self._orphaned_apertures:
-            child_shades.extend(ap.shades)
-        for dr in self._orphaned_doors:
-            child_shades.extend(dr.shades)
-        return child_shades + self._orphaned_shades
+        return self._cached_objects('shades')
 
     @property
     def indoor_shades(self):
         """Get a list of all indoor Shade objects in the model."""
-        child_shades = []
-        for room in self._rooms:
-            child_shades.extend(room._indoor_shades)
-            for face in room.faces:
-                child_shades.extend(face._indoor_shades)
-                for ap in face._apertures:
-                    child_shades.extend(ap._indoor_shades)
-                for dr in face._doors:
-                    child_shades.extend(dr._indoor_shades)
-        for face in self._orphaned_faces:
-            child_shades.extend(face._indoor_shades)
-            for ap in face._apertures:
-                child_shades.extend(ap._indoor_shades)
-            for dr in face._doors:
-                child_shades.extend(dr._indoor_shades)
-        for ap in self._orphaned_apertures:
-            child_shades.extend(ap._indoor_shades)
-        for dr in self._orphaned_doors:
-            child_shades.extend(dr._indoor_shades)
-        return child_shades
+        return self._cached_objects('indoor_shades')
 
     @property
     def outdoor_shades(self):
@@ -826,26 +962,7 @@ class Model(_Base):
 
         This includes all of the orphaned_shades.
         """
-        child_shades = []
-        for room in self._rooms:
-            child_shades.extend(room._outdoor_shades)
-            for face in room.faces:
-                child_shades.extend(face._outdoor_shades)
-                for ap in face._apertures:
-                    child_shades.extend(ap._outdoor_shades)
-                for dr in face._doors:
-                    child_shades.extend(dr._outdoor_shades)
-        for face in self._orphaned_faces:
-            child_shades.extend(face._outdoor_shades)
-            for ap in face._apertures:
-                child_shades.extend(ap._outdoor_shades)
-            for dr in face._doors:
-                child_shades.extend(dr._outdoor_shades)
-        for ap in self._orphaned_apertures:
-            child_shades.extend(ap._outdoor_shades)
-        for dr in self._orphaned_doors:
-            child_shades.extend(dr._outdoor_shades)
-        return child_shades + self._orphaned_shades
+        return self._cached_objects('outdoor_shades')
 
     @property
     def shade_meshes(self):
@@ -1120,18 +1237,30 @@ class Model(_Base):
 
         This is useful for matching these objects to others using identifiers.
         """
-        base = {r.identifier: r for r in self._rooms}
-        for f in self._orphaned_faces:
-            base[f.identifier] = f
-        for a in self._orphaned_apertures:
-            base[a.identifier] = a
-        for d in self._orphaned_doors:
-            base[d.identifier] = d
-        for s in self._orphaned_shades:
-            base[s.identifier] = s
-        for sm in self._shade_meshes:
-            base[sm.identifier] = sm
-        return base
+        cache = self._current_object_cache()
+        try:
+            base = cache['top_level']
+        except KeyError:  # dictionary has not yet been built
+            base = None
+        else:  # make sure that no identifiers have been changed since it was built
+            if not all(obj.identifier == obj_id for obj_id, obj in base.items()):
+                base = None
+        if base is None:
+            base = {r.identifier: r for r in self._rooms}
+            for f in self._orphaned_faces:
+                base[f.identifier] = f
+            for a in self._orphaned_apertures:
+                base[a.identifier] = a
+            for d in self._orphaned_doors:
+                base[d.identifier] = d
+            for s in self._orphaned_shades:
+                base[s.identifier] = s
+            for sm in self._shade_meshes:
+                base[sm.identifier] = sm
+            obj_count = sum(len(objs) for objs in self._top_level_lists())
+            if len(base) == obj_count:  # no duplicated identifiers; safe to cache
+                cache['top_level'] = base
+        return base.copy()
 
     @property
     def has_zones(self):
@@ -1171,10 +1300,22 @@ class Model(_Base):
         for door in other_model._orphaned_doors:
             self._orphaned_doors.append(door)
 
-    def add_room(self, obj):
-        """Add a Room object to the model."""
+    def add_room(self, obj, solve_adjacency=False):
+        """Add a Room object to the model.
+
+        Args:
+            obj: A Room object to be added to the model.
+            solve_adjacency: Boolean to note whether adjacencies should be solved
+                between the Room and the other Rooms of the model after it is
+                added. This only checks the Faces of other Rooms near the
+                Faces of the added Room, making it much faster than re-solving
+                adjacency across the whole model. See the solve_room_adjacency
+                method for more information. (Default: False).
+        """
         assert isinstance(obj, Room), 'Expected Room. Got {}.'.format(type(obj))
         self._rooms.append(obj)
+        if solve_adjacency:
+            self.solve_room_adjacency([obj])
 
     def add_face(self, obj):
         """Add an orphaned Face object without a parent to the model."""
@@ -1209,14 +1350,32 @@ class Model(_Base):
         assert isinstance(obj, ShadeMesh), 'Expected ShadeMesh. Got {}.'.format(type(obj))
         self._shade_meshes.append(obj)
 
-    def remove_rooms(self, room_ids=None):
+    def remove_rooms(self, room_ids=None, reset_adjacency=False):
         """Remove Rooms from the model.
 
         Args:
             room_ids: An optional list of Room identifiers to only remove certain rooms
                 from the model. If None, all Rooms will be removed. (Default: None).
+            reset_adjacency: Boolean to note whether the Surface boundary conditions
+                of the remaining Rooms that reference the removed Rooms should be
+                set to Outdoors, along with those of their Apertures and
+                Doors. (Default: False).
         """
-        self._rooms = self._remove_by_ids(self.rooms, room_ids)
+        kept_rooms = self._remove_by_ids(self.rooms, room_ids)
+        if reset_adjacency and len(kept_rooms) != 0:
+            kept_set = set(id(room) for room in kept_rooms)
+            removed_ids = set(room.identifier for room in self._rooms
+                              if id(room) not in kept_set)
+            for room in kept_rooms:
+                for face in room._faces:
+                    if not isinstance(face.boundary_condition, Surface):
+                        continue
+                    bc_objs = face.boundary_condition.boundary_condition_objects
+                    if bc_objs[-1] in removed_ids:
+                        face.boundary_condition = bcs.outdoors
+                        for sub_f in face._apertures + face._doors:
+                            sub_f.boundary_condition = bcs.outdoors
+        self._rooms = kept_rooms
 
     def remove_faces(self, face_ids=None):
         """Remove orphaned Faces from the model.
@@ -1338,10 +1497,21 @@ class Model(_Base):
         self.remove_shades()
         self.remove_assigned_shades()
 
-    def add_rooms(self, objs):
-        """Add a list of Room objects to the model."""
+    def add_rooms(self, objs, solve_adjacency=False):
+        """Add a list of Room objects to the model.
+
+        Args:
+            objs: A list of Room objects to be added to the model.
+            solve_adjacency: Boolean to note whether adjacencies should be solved
+                between the Rooms and the other Rooms of the model (including
+                one another) after they are added. See the solve_room_adjacency
+                method for more information. (Default: False).
+        """
+        objs = list(objs)
         for obj in objs:
             self.add_room(obj)
+        if solve_adjacency:
+            self.solve_room_adjacency(objs)
 
     def add_faces(self, objs):
         """Add a list of orphaned Face objects to the model."""
@@ -1370,113 +1540,36 @@ class Model(_Base):
 
     def rooms_by_identifier(self, identifiers):
         """Get a list of Room objects in the model given the Room identifiers."""
-        rooms, missing_ids = [], []
-        model_rooms = self._rooms
-        for obj_id in identifiers:
-            for room in model_rooms:
-                if room.identifier == obj_id:
-                    rooms.append(room)
-                    break
-            else:
-                missing_ids.append(obj_id)
-        if len(missing_ids) != 0:
-            all_objs = ' '.join(['"' + rid + '"' for rid in missing_ids])
-            raise ValueError(
-                'The following Rooms were not found in the model: {}'.format(all_objs)
-            )
-        return rooms
+        return self._objects_by_identifier(
+            'Room', identifiers, 'The following Rooms were not found in the model: {}')
 
     def faces_by_identifier(self, identifiers):
         """Get a list of Face objects in the model given the Face identifiers."""
-        faces, missing_ids = [], []
-        model_faces = self.faces
-        for obj_id in identifiers:
-            for face in model_faces:
-                if face.identifier == obj_id:
-                    faces.append(face)
-                    break
-            else:
-                missing_ids.append(obj_id)
-        if len(missing_ids) != 0:
-            all_objs = ' '.join(['"' + rid + '"' for rid in missing_ids])
-            raise ValueError(
-                'The following Faces were not found in the model: {}'.format(all_objs)
-            )
-        return faces
+        return self._objects_by_identifier(
+            'Face', identifiers, 'The following Faces were not found in the model: {}')
 
     def apertures_by_identifier(self, identifiers):
         """Get a list of Aperture objects in the model given the Aperture identifiers."""
-        apertures, missing_ids = [], []
-        model_apertures = self.apertures
-        for obj_id in identifiers:
-            for aperture in model_apertures:
-                if aperture.identifier == obj_id:
-                    apertures.append(aperture)
-                    break
-            else:
-                missing_ids.append(obj_id)
-        if len(missing_ids) != 0:
-            all_objs = ' '.join(['"' + rid + '"' for rid in missing_ids])
-            raise ValueError(
-                'The following Apertures were not found in the model:\n'
-                '{}'.format(all_objs)
-            )
-        return apertures
+        return self._objects_by_identifier(
+            'Aperture', identifiers,
+            'The following Apertures were not found in the model:\n{}')
 
     def doors_by_identifier(self, identifiers):
         """Get a list of Door objects in the model given the Door identifiers."""
-        doors, missing_ids = [], []
-        model_doors = self.doors
-        for obj_id in identifiers:
-            for door in model_doors:
-                if door.identifier == obj_id:
-                    doors.append(door)
-                    break
-            else:
-                missing_ids.append(obj_id)
-        if len(missing_ids) != 0:
-            all_objs = ' '.join(['"' + rid + '"' for rid in missing_ids])
-            raise ValueError(
-                'The following Doors were not found in the model: {}'.format(all_objs)
-            )
-        return doors
+        return self._objects_by_identifier(
+            'Door', identifiers, 'The following Doors were not found in the model: {}')
 
     def shades_by_identifier(self, identifiers):
         """Get a list of Shade objects in the model given the Shade identifiers."""
-        shades, missing_ids = [], []
-        model_shades = self.shades
-        for obj_id in identifiers:
-            for face in model_shades:
-                if face.identifier == obj_id:
-                    shades.append(face)
-                    break
-            else:
-                missing_ids.append(obj_id)
-        if len(missing_ids) != 0:
-            all_objs = ' '.join(['"' + rid + '"' for rid in missing_ids])
-            raise ValueError(
-                'The following Shades were not found in the model: {}'.format(all_objs)
-            )
-        return shades
+        return self._objects_by_identifier(
+            'Shade', identifiers, 'The following Shades were not found in the model: {}')
 
     def shade_meshes_by_identifier(self, identifiers):
         """Get a list of ShadeMesh objects in the model given the ShadeMesh identifiers.
         """
-        shades, missing_ids = [], []
-        model_shades = self._shade_meshes
-        for obj_id in identifiers:
-            for sm in model_shades:
-                if sm.identifier == obj_id:
-                    shades.append(sm)
-                    break
-            else:
-                missing_ids.append(obj_id)
-        if len(missing_ids) != 0:
-            a_os = ' '.join(['"' + rid + '"' for rid in missing_ids])
-            raise ValueError(
-                'The following ShadeMeshes were not found in the model: {}'.format(a_os)
-            )
-        return shades
+        return self._objects_by_identifier(
+            'ShadeMesh', identifiers,
+            'The following ShadeMeshes were not found in the model: {}')
 
     def classified_envelope_edges(self, tolerance=None, exclude_coplanar=True):
         """Get classified edges of this Model's envelope based on Faces they adjoin.
@@ -1583,21 +1676,23 @@ class Model(_Base):
         """Organize subface edges depending on whether they are frames or mullions."""
         sub_face_frames, sub_face_mullions = [], []
         # group the apertures by the plane in which they exist
-        coplanar_dict = {}
         sub_faces = [sf for sf in sub_faces
                      if isinstance(sf.boundary_condition, Outdoors)]
-        if len(sub_faces) != 0:
-            coplanar_dict = {sub_faces[0].geometry.plane: [sub_faces[0]]}
-            for sf in sub_faces[1:]:
-                for pln, f_list in coplanar_dict.items():
-                    if sf.geometry.plane.is_coplanar_tolerance(pln, tol, a_tol):
-                        f_list.append(sf)
-                        break
-                else:  # the first face with this type of plane
-                    coplanar_dict[sf.geometry.plane] = [sf]
+        sf_planes = [sf.geometry.plane for sf in sub_faces]
+        plane_grid = PlaneHashGrid.from_points([pl.o for pl in sf_planes], tol, a_tol)
+        group_planes, grouped_sfs = [], []
+        for sf, sf_pln in zip(sub_faces, sf_planes):
+            for group_i in plane_grid.candidates(sf_pln.n, sf_pln.o):
+                if sf_pln.is_coplanar_tolerance(group_planes[group_i], tol, a_tol):
+                    grouped_sfs[group_i].append(sf)
+                    break
+            else:  # the first face with this type of plane
+                plane_grid.add(sf_pln.n, sf_pln.o, len(group_planes))
+                group_planes.append(sf_pln)
+                grouped_sfs.append([sf])
 
         # for each group, intersect their edges and extract edges from a Polyface3D
-        for plane, sfs in coplanar_dict.items():
+        for plane, sfs in zip(group_planes, grouped_sfs):
             # intersect edges that are close enough to one another within thickness
             polygons = []
             for sf in sfs:
@@ -1643,9 +1738,10 @@ class Model(_Base):
             touching an Aperture or Door edge within the mullion_thickness.
         """
         tol = tolerance if tolerance is not None else self.tolerance
-        # loop through the rooms and evaluate the edge in terms of it
+        # loop through the rooms near the edge and evaluate the edge in terms of it
         rel_rooms = {}
-        for room in self.rooms:
+        room_tree = self.spatial_index('Room')
+        for room in room_tree.query_box(geometry_box(edge), tol):
             if overlapping_bounding_boxes(room.geometry, edge, tol):
                 for pt in room.geometry.vertices:
                     if edge.distance_to_point(pt) < tol:
@@ -1661,6 +1757,113 @@ class Model(_Base):
                                         break
         return list(rel_rooms.values())
 
+    def rooms_relevant_to_edges(self, edges, mullion_thickness=None, tolerance=None,
+                                workers=None):
+        """Get a list of Rooms in the model that are relevant to each of several edges.
+
+        This gives the same result as using the rooms_relevant_to_edge method with
+        each edge but the vertices of all Rooms (and their Apertures and Doors) are
+        indexed only once. So each edge is only compared to the vertices near it,
+        making this much faster for the thousands of edges that are typically
+        obtained from the classified edge methods.
+
+        Args:
+            edges: A list of ladybug-geometry LineSegment3D or Polyline3D for the
+                edges to be evaluated against the Model rooms.
+            mullion_thickness: The maximum difference that apertures can be from
+                the input edges for them to be associated with a given model room.
+                If None, the input edges will only be checked against the model's
+                room Faces and not the Apertures or Doors.
+            tolerance: The maximum difference between point values for them to be
+                considered equivalent. If None, the Model's tolerance will be used.
+            workers: An optional integer for the number of worker processes over
+                which the edges will be evaluated. Zero or a negative number will
+                use all available CPUs. None will evaluate all edges in the
+                current process. (Default: None).
+
+        Returns:
+            A list with one list of Honeybee Rooms for each input edge. Each
+            sub-list contains the Rooms that are relevant to the edge, either
+            touching a room Face edge within the tolerance or touching an
+            Aperture or Door edge within the mullion_thickness.
+        """
+        tol = tolerance if tolerance is not None else self.tolerance
+        # index the vertices of the rooms and their sub-faces
+        rooms = self._rooms
+        vertex_trees = [self._vertex_tree([rm.geometry.vertices for rm in rooms])]
+        if mullion_thickness is not None:
+            vertex_trees.append(self._vertex_tree(
+                [[pt for sf in rm.sub_faces for pt in sf.geometry.vertices]
+                 for rm in rooms]))
+
+        # evaluate the edges against the indexed vertices
+        edges = list(edges)
+        inputs = [(edge_chunk, vertex_trees, tol)
+                  for edge_chunk in chunk_list(edges, worker_count(workers))]
+        rel_rooms = []
+        for chunk_ids in parallel_map(_relevant_room_indices, inputs, workers):
+            for room_ids in chunk_ids:
+                edge_rooms = {}
+                for i in room_ids:
+                    edge_rooms[rooms[i].identifier] = rooms[i]
+                rel_rooms.append(list(edge_rooms.values()))
+        return rel_rooms
+
+    @staticmethod
+    def _vertex_tree(room_vertices):
+        """Get a BoundingBoxTree of points and a list of the Room index of each point.
+
+        Args:
+            room_vertices: A list with a list of Point3D for each Room.
+        """
+        boxes, vertex_rooms = [], []
+        for i, vertices in enumerate(room_vertices):
+            for pt in vertices:
+                boxes.append((pt.x, pt.y, pt.z, pt.x, pt.y, pt.z))
+                vertex_rooms.append(i)
+        return BoundingBoxTree(boxes), vertex_rooms
+
+    def spatial_index(self, obj_type='Room'):
+        """Get a BoundingBoxTree of the bounding boxes of a given type of Model object.
+
+        The tree is built the first time that it is requested and it is re-used
+        until objects of the type are added to or removed from the Model or
+        the geometry of any of the objects changes. It can be used to quickly
+        find the objects that overlap a box, the objects near a point or segment
+        and the pairs of objects with overlapping bounding boxes. Note that
+        the queries only evaluate the bounding boxes of the objects such
+        that they yield candidates for more precise geometric checks.
+
+        Args:
+            obj_type: Text for the type of object to be indexed. Choose from
+                Room, Face, Aperture, Door, SubFace (both Apertures and Doors),
+                Shade, ShadeMesh. (Default: Room).
+
+        Returns:
+            A BoundingBoxTree with the objects of the type as its objects, in the
+            same order as the Model property for the objects (eg. rooms, faces).
+        """
+        if obj_type not in self._SPATIAL_INDEX_TYPES:
+            raise ValueError(
+                'Object type "{}" is not recognized for the spatial index. Choose '
+                'from {}.'.format(obj_type, ', '.join(self._SPATIAL_INDEX_TYPES)))
+        # the object cache is discarded when objects are added or removed and
+        # the geometry revision changes when the geometry of any object is set
+        cache = self._current_object_cache()
+        try:
+            tree, geo_revision = cache[('spatial_index', obj_type)]
+        except KeyError:  # tree has not yet been built
+            tree = None
+        else:
+            if geo_revision != _Base._geometry_revision:
+                tree = None
+        if tree is None:
+            objs = self._spatial_index_objects(obj_type)
+            tree = BoundingBoxTree([geometry_box(obj.geometry) for obj in objs], objs)
+            # get the revision after the geometry in case Room geometry was computed
+            cache[('spatial_index', obj_type)] = (tree, _Base._geometry_revision)
+        return tree
+
     def assign_unique_names(self):
         """Ensure all display_names of objects in the model are unique.
 
@@ -1880,7 +2083,7 @@ class Model(_Base):
     def solve_adjacency(
             self, merge_coplanar=False, intersect=False, overwrite=False,
             remove_mismatched_sub_faces=True, air_boundary=False, adiabatic=False,
-            tolerance=None, angle_tolerance=None):
+            tolerance=None, angle_tolerance=None, spatial_hash=True, workers=None):
         """Solve adjacency between Rooms of the Model.
 
         Args:
@@ -1910,6 +2113,15 @@ class Model(_Base):
             angle_tolerance: The max angle difference in degrees where Face normals
                 are no longer considered coplanar. If None, the Model
                 angle_tolerance will be used. (Default: None).
+            spatial_hash: Boolean to note whether a hash grid of Face centers
+                should be used to find candidate adjacent Faces rather than
+                checking all Faces of all pairs of Rooms with overlapping
+                bounding boxes. The result is the same in both cases but the
+                hash grid is much faster for models with many Rooms. (Default: True).
+            workers: An optional integer for the number of worker processes over
+                which the intersection of the Rooms will be run. Zero or a negative
+                number will use all available CPUs. None will run the intersection
+                in the current process. (Default: None).
         """
         tol = tolerance if tolerance else self.tolerance
         ang_tol = angle_tolerance if angle_tolerance else self.angle_tolerance
@@ -1921,13 +2133,14 @@ class Model(_Base):
 
         # intersect adjacencies if requested
         if intersect:
-            Room.intersect_adjacency(self.rooms, tol, ang_tol)
+            Room.intersect_adjacency(self.rooms, tol, ang_tol, workers)
 
         # solve adjacency
         if not overwrite:  # only assign new adjacencies
-            adj_info = Room.solve_adjacency(self.rooms, tol, remove_mismatched_sub_faces)
+            adj_info = Room.solve_adjacency(
+                self.rooms, tol, remove_mismatched_sub_faces, spatial_hash)
         else:  # overwrite existing Surface BC
-            adj_faces = Room.find_adjacency(self.rooms, tol)
+            adj_faces = Room.find_adjacency(self.rooms, tol, spatial_hash)
             if remove_mismatched_sub_faces:
                 for face_pair in adj_faces:
                     try:
@@ -1948,12 +2161,95 @@ class Model(_Base):
                     face_pair[0].type = face_types.air_boundary
                     face_pair[1].type = face_types.air_boundary
 
-        # try to assign the adiabatic boundary condition
+        # try to assign the adiabatic boundary condition (if honeybee_energy exists)
+        ad_bc = getattr(bcs, 'adiabatic', None)
         if adiabatic and ad_bc:
             for face_pair in adj_info['adjacent_faces']:
                 face_pair[0].boundary_condition = ad_bc
                 face_pair[1].boundary_condition = ad_bc
 
+    def solve_room_adjacency(self, rooms, remove_mismatched_sub_faces=True,
+                             tolerance=None):
+        """Solve adjacency between a few Rooms and the other Rooms of the Model.
+
+        This is intended for interactive editing sessions where a handful of
+        Rooms are added to or replaced within a Model that already has its
+        adjacency solved. The Model keeps a hash grid of the centers of all Room
+        Faces between calls, which is only updated for the Rooms that have been
+        added, removed or changed since the last call. So the Faces of the input
+        Rooms are only compared to the nearby Faces of other Rooms rather than
+        re-solving adjacency across the whole Model.
+
+        Like the solve_adjacency method, this method does NOT overwrite existing
+        Surface boundary conditions and only adds new ones if Faces are found to
+        be adjacent with equivalent areas.
+
+        Args:
+            rooms: A list of Rooms in the Model for which adjacency will be solved.
+            remove_mismatched_sub_faces: Boolean to note whether any mis-matches
+                in sub-faces between adjacent rooms should simply result in
+                the sub-faces being removed rather than raising an
+                exception. (Default: True).
+            tolerance: The maximum difference between point values for them to be
+                considered equivalent. If None, the Model tolerance will be
+                used. (Default: None).
+
+        Returns:
+            A dictionary of information about the objects that had their adjacency
+            set, which has the same keys as the one returned from the
+            Room.solve_adjacency method.
+        """
+        tol = tolerance if tolerance else self.tolerance
+        index = self._current_face_index(tol)
+        grid, cell_size = index['grid'], index['cell_size']
+        room_order = {id(room): i for i, room in enumerate(self._rooms)}
+        adj_info = {'adjacent_faces': [], 'adjacent_apertures': [],
+                    'adjacent_doors': []}
+
+        for room in rooms:
+            try:
+                room_i = room_order[id(room)]
+            except KeyError:
+                raise ValueError(
+                    'Room "{}" is not in the Model.'.format(room.display_name))
+            for face_i, face in enumerate(room._faces):
+                if isinstance(face.boundary_condition, Surface):
+                    continue  # face already has an adjacency
+                # centered adjacent faces must have equivalent centers
+                center, candidates = face.geometry.center, []
+                for key in neighbor_keys(grid_key(center, cell_size)):
+                    for other_face, other_i in grid.get(key, ()):
+                        other_room = other_face._parent
+                        if other_room is room or \
+                                isinstance(other_face.boundary_condition, Surface):
+                            continue
+                        if center.is_equivalent(other_face.geometry.center, tol):
+                            candidates.append(
+                                (room_order[id(other_room)], other_i, other_face))
+                candidates.sort(key=lambda cand: cand[:2])
+                for other_room_i, other_i, other_face in candidates:
+                    if not face.geometry.is_centered_adjacent(
+                            other_face.geometry, tol):
+                        continue
+                    # match the order of faces in the Room.solve_adjacency method
+                    face_1, face_2 = (face, other_face) if room_i < other_room_i \
+                        else (other_face, face)
+                    if not remove_mismatched_sub_faces:
+                        face_info = face_1.set_adjacency(face_2)
+                    else:
+                        try:
+                            face_info = face_1.set_adjacency(face_2)
+                        except AssertionError:
+                            face_1.remove_sub_faces()
+                            face_2.remove_sub_faces()
+                            face_info = face_1.set_adjacency(face_2)
+                    adj_info['adjacent_faces'].append((face_1, face_2))
+                    adj_info['adjacent_apertures'].extend(
+                        face_info['adjacent_apertures'])
+                    adj_info['adjacent_doors'].extend(face_info['adjacent_doors'])
+                    break
+        return adj_info
+
     def move(self, moving_vec):
         """Move this Model along a vector.
 
@@ -1961,6 +2257,10 @@ class Model(_Base):
             moving_vec: A ladybug_geometry Vector3D with the direction and distance
                 to move the Model.
         """
+        if batch_transform_available():
+            transform = BatchTransform(move_matrix(moving_vec), 'move')
+            self._batch_transform(transform, 'move', moving_vec)
+            return
         for room in self._rooms:
             room.move(moving_vec)
         for face in self._orphaned_faces:
@@ -1984,6 +2284,11 @@ class Model(_Base):
             origin: A ladybug_geometry Point3D for the origin around which the
                 object will be rotated.
         """
+        if batch_transform_available():
+            matrix = rotate_matrix(axis, math.radians(angle), origin)
+            transform = BatchTransform(matrix, 'rotate')
+            self._batch_transform(transform, 'rotate', axis, angle, origin)
+            return
         for room in self._rooms:
             room.rotate(axis, angle, origin)
         for face in self._orphaned_faces:
@@ -2006,6 +2311,11 @@ class Model(_Base):
             origin: A ladybug_geometry Point3D for the origin around which the
                 object will be rotated.
         """
+        if batch_transform_available():
+            matrix = rotate_xy_matrix(math.radians(angle), origin)
+            transform = BatchTransform(matrix, 'rotate_xy')
+            self._batch_transform(transform, 'rotate_xy', angle, origin)
+            return
         for room in self._rooms:
             room.rotate_xy(angle, origin)
         for face in self._orphaned_faces:
@@ -2027,6 +2337,10 @@ class Model(_Base):
             plane: A ladybug_geometry Plane across which the object will
                 be reflected.
         """
+        if batch_transform_available():
+            transform = BatchTransform(reflect_matrix(plane.n, plane.o), 'reflect')
+            self._batch_transform(transform, 'reflect', plane)
+            return
         for room in self._rooms:
             room.reflect(plane)
         for face in self._orphaned_faces:
@@ -2053,6 +2367,10 @@ class Model(_Base):
             origin: A ladybug_geometry Point3D representing the origin from which
                 to scale. If None, it will be scaled from the World origin (0, 0, 0).
         """
+        if batch_transform_available():
+            transform = BatchTransform(scale_matrix(factor, origin), 'scale', factor)
+            self._batch_transform(transform, 'scale', factor, origin)
+            return
         for room in self._rooms:
             room.scale(factor, origin)
         for face in self._orphaned_faces:
@@ -2067,15 +2385,67 @@ class Model(_Base):
             shade_mesh.scale(factor, origin)
         self.properties.scale(factor, origin)
 
-    def generate_exterior_face_grid(
-            self, dimension, offset=0.1, face_type='Wall', punched_geometry=False):
-        """Get a gridded Mesh3D offset from the exterior Faces of this Model.
+    def _batch_transform(self, transform, method, *args):
+        """Transform all geometry of this Model with a BatchTransform.
 
-        This will be None if the Model has no exterior Faces.
+        The extension properties of each object are transformed afterwards by
+        calling the method of the properties with the same name as the transform.
 
         Args:
-            dimension: The dimension of the grid cells as a number.
-            offset: A number for how far to offset the grid from the base face.
+            transform: A BatchTransform object with no geometry added to it.
+            method: Text for the name of the transform method (eg. move, rotate).
+            args: The arguments of the transform method of the properties.
+        """
+        # gather all of the objects in the order that they are normally transformed
+        objs = []
+        for room in self._rooms:
+            for face in room._faces:
+                for sub_f in face._apertures + face._doors:
+                    objs.extend(sub_f._outdoor_shades + sub_f._indoor_shades)
+                    objs.append(sub_f)
+                objs.extend(face._outdoor_shades + face._indoor_shades)
+                objs.append(face)
+            objs.extend(room._outdoor_shades + room._indoor_shades)
+        for face in self._orphaned_faces:
+            for sub_f in face._apertures + face._doors:
+                objs.extend(sub_f._outdoor_shades + sub_f._indoor_shades)
+                objs.append(sub_f)
+            objs.extend(face._outdoor_shades + face._indoor_shades)
+            objs.append(face)
+        for sub_f in self._orphaned_apertures + self._orphaned_doors:
+            objs.extend(sub_f._outdoor_shades + sub_f._indoor_shades)
+            objs.append(sub_f)
+        objs.extend(self._orphaned_shades + self._shade_meshes)
+
+        # transform all of the geometry at once
+        for obj in objs:
+            transform.add(obj._geometry)
+        for room in self._rooms:
+            if room._geometry is not None:
+                transform.add(room._geometry)
+        transform.run()
+
+        # assign the new geometry and transform the extension properties
+        for obj in objs:
+            obj._geometry = transform.result(obj._geometry)
+            if isinstance(obj, Face):
+                obj._punched_geometry = None  # reset so that it can be re-computed
+            getattr(obj.properties, method)(*args)
+        for room in self._rooms:
+            if room._geometry is not None:
+                room._geometry = transform.result(room._geometry)
+            getattr(room.properties, method)(*args)
+        getattr(self.properties, method)(*args)
+
+    def generate_exterior_face_grid(
+            self, dimension, offset=0.1, face_type='Wall', punched_geometry=False):
+        """Get a gridded Mesh3D offset from the exterior Faces of this Model.
+
+        This will be None if the Model has no exterior Faces.
+
+        Args:
+            dimension: The dimension of the grid cells as a number.
+            offset: A number for how far to offset the grid from the base face.
                 Positive numbers indicate an offset towards the exterior. (Default
                 is 0.1, which will offset the grid to be 0.1 unit from the faces).
             face_type: Text to specify the type of face that will be used to
@@ -2580,8 +2950,8 @@ class Model(_Base):
             compare_dict['deleted_objects'] = deleted
         return compare_dict
 
-    def check_for_extension(self, extension_name='Generic',
-                            raise_exception=True, detailed=False):
+    def check_for_extension(self, extension_name='Generic', raise_exception=True,
+                            detailed=False, workers=None, validation_cache=None):
         """Check that the Model is valid for a specific Honeybee extension.
 
         This process will typically include both honeybee-core checks as well
@@ -2619,6 +2989,16 @@ class Model(_Base):
                 return a text string with all errors that were found. (Default: True).
             detailed: Boolean for whether the returned object is a detailed list of
                 dicts with error info or a string with a message. (Default: False).
+            workers: An optional integer for the number of worker processes over
+                which the checks of individual Rooms (eg. planarity, solidity)
+                will be run. The report is identical to running all checks in
+                the current process. Zero or a negative number will use all
+                available CPUs. None will run all checks in the current
+                process. (Default: None).
+            validation_cache: An optional ValidationCache object with the results
+                of previous checks of individual Rooms. Only the Rooms that are
+                not found in the cache will be checked and their results will be
+                added to the cache. (Default: None).
 
         Returns:
             A text string with all errors that were found or a list if detailed is True.
@@ -2629,7 +3009,8 @@ class Model(_Base):
         extension_name = extension_name.lower()
         if extension_name in ('all', 'generic'):
             all_ext_checks = extension_name == 'all'
-            return self.check_all(raise_exception, detailed, all_ext_checks)
+            return self.check_all(raise_exception, detailed, all_ext_checks,
+                                  workers, validation_cache)
         energy_extensions = ('energyplus', 'openstudio', 'designbuilder')
         if extension_name in energy_extensions:
             extension_name = 'energy'
@@ -2641,7 +3022,14 @@ class Model(_Base):
             'Model must have a non-zero tolerance in order to perform geometry checks.'
         assert self.angle_tolerance != 0, \
             'Model must have a non-zero angle_tolerance to perform geometry checks.'
-        msgs = self._properties._check_for_extension(extension_name, detailed)
+        e_tol = parse_distance_string('1cm', self.units)
+        self._check_results = self._room_check_results(
+            self.tolerance, self.angle_tolerance, e_tol, detailed,
+            workers, validation_cache)
+        try:
+            msgs = self._properties._check_for_extension(extension_name, detailed)
+        finally:
+            self._check_results = None
         if detailed:
             msgs = [m for m in msgs if isinstance(m, list)]
 
@@ -2697,7 +3085,8 @@ class Model(_Base):
         # run the check function
         return check_func(raise_exception=raise_exception, detailed=detailed)
 
-    def check_all(self, raise_exception=True, detailed=False, all_ext_checks=False):
+    def check_all(self, raise_exception=True, detailed=False, all_ext_checks=False,
+                  workers=None, validation_cache=None):
         """Check all of the aspects of the Model for validation errors.
 
         This includes basic properties like adjacency checks and all geometry checks.
@@ -2718,6 +3107,16 @@ class Model(_Base):
                 cases should be run (False). Examples of checks that are skipped
                 include DOE2's lack of support for courtyards and floor plates
                 with holes. (Default: False).
+            workers: An optional integer for the number of worker processes over
+                which the checks of individual Rooms (eg. planarity, solidity)
+                will be run. The Rooms are split into chunks for each process
+                and the report is identical to running all checks in the current
+                process. Zero or a negative number will use all available CPUs.
+                None will run all checks in the current process. (Default: None).
+            validation_cache: An optional ValidationCache object with the results
+                of previous checks of individual Rooms. Only the Rooms that are
+                not found in the cache will be checked and their results will be
+                added to the cache. (Default: None).
 
         Returns:
             A text string with all errors that were found or a list if detailed is True.
@@ -2734,7 +3133,25 @@ class Model(_Base):
         tol = self.tolerance
         ang_tol = self.angle_tolerance
         e_tol = parse_distance_string('1cm', self.units)
+        self._check_results = self._room_check_results(
+            tol, ang_tol, e_tol, detailed, workers, validation_cache)
+        try:
+            msgs = self._check_all_msgs(tol, ang_tol, e_tol, detailed, all_ext_checks)
+        finally:
+            self._check_results = None
+
+        # output a final report of errors or raise an exception
+        full_msgs = [msg for msg in msgs if msg]
+        if detailed:
+            return [m for msg in full_msgs for m in msg]
+        full_msg = '\n'.join(full_msgs)
+        if raise_exception and len(full_msgs) != 0:
+            raise ValueError(full_msg)
+        return full_msg
 
+    def _check_all_msgs(self, tol, ang_tol, e_tol, detailed, all_ext_checks):
+        """Get a list of the results of each of the checks run by check_all."""
+        msgs = []
         # perform checks for duplicate identifiers, which might mess with other checks
         msgs.append(self.check_all_duplicate_identifiers(False, detailed))
 
@@ -2760,15 +3177,7 @@ class Model(_Base):
         if detailed:
             ext_msgs = [m for m in ext_msgs if isinstance(m, list)]
         msgs.extend(ext_msgs)
-
-        # output a final report of errors or raise an exception
-        full_msgs = [msg for msg in msgs if msg]
-        if detailed:
-            return [m for msg in full_msgs for m in msg]
-        full_msg = '\n'.join(full_msgs)
-        if raise_exception and len(full_msgs) != 0:
-            raise ValueError(full_msg)
-        return full_msg
+        return msgs
 
     def check_all_duplicate_identifiers(self, raise_exception=True, detailed=False):
         """Check that there are no duplicate identifiers for any geometry objects.
@@ -2908,20 +3317,13 @@ class Model(_Base):
         """
         tolerance = self.tolerance if tolerance is None else tolerance
         detailed = False if raise_exception else detailed
-        msgs = []
-        for face in self.faces:
-            msgs.append(face.check_planar(tolerance, False, detailed))
-        for shd in self.shades:
-            msgs.append(shd.check_planar(tolerance, False, detailed))
-        for ap in self.apertures:
-            msgs.append(ap.check_planar(tolerance, False, detailed))
-        for dr in self.doors:
-            msgs.append(dr.check_planar(tolerance, False, detailed))
-        full_msgs = [msg for msg in msgs if msg]
-        if detailed:
-            return [m for msg in full_msgs for m in msg]
-        full_msg = '\n'.join(full_msgs)
-        if raise_exception and len(full_msgs) != 0:
+        result = self._precomputed_check(
+            ('check_planar', tolerance, detailed), raise_exception)
+        if result is not None:
+            return result
+        full_msg = self._merge_check_results(
+            self._check_planar_parts(tolerance, detailed), detailed)
+        if raise_exception and len(full_msg) != 0:
             raise ValueError(full_msg)
         return full_msg
 
@@ -2945,6 +3347,10 @@ class Model(_Base):
         """
         tolerance = self.tolerance if tolerance is None else tolerance
         detailed = False if raise_exception else detailed
+        result = self._precomputed_check(
+            ('check_self_intersecting', tolerance, detailed), raise_exception)
+        if result is not None:
+            return result
         msgs = []
         for room in self.rooms:
             msgs.append(room.check_self_intersecting(tolerance, False, detailed))
@@ -2982,6 +3388,10 @@ class Model(_Base):
         """
         tolerance = self.tolerance if tolerance is None else tolerance
         detailed = False if raise_exception else detailed
+        result = self._precomputed_check(
+            ('check_degenerate_rooms', tolerance, detailed), raise_exception)
+        if result is not None:
+            return result
         msgs = []
         for room in self._rooms:
             msg = room.check_degenerate(tolerance, False, detailed)
@@ -3022,6 +3432,11 @@ class Model(_Base):
         angle_tolerance = self.angle_tolerance \
             if angle_tolerance is None else angle_tolerance
         detailed = False if raise_exception else detailed
+        result = self._precomputed_check(
+            ('check_sub_faces_valid', tolerance, angle_tolerance, detailed),
+            raise_exception)
+        if result is not None:
+            return result
         msgs = []
         for rm in self._rooms:
             msg = rm.check_sub_faces_valid(tolerance, angle_tolerance, False, detailed)
@@ -3060,6 +3475,10 @@ class Model(_Base):
         """
         tolerance = self.tolerance if tolerance is None else tolerance
         detailed = False if raise_exception else detailed
+        result = self._precomputed_check(
+            ('check_sub_faces_overlapping', tolerance, detailed), raise_exception)
+        if result is not None:
+            return result
         msgs = []
         for rm in self._rooms:
             msg = rm.check_sub_faces_overlapping(tolerance, False, detailed)
@@ -3105,6 +3524,10 @@ class Model(_Base):
         """
         a_tol = self.angle_tolerance if angle_tolerance is None else angle_tolerance
         detailed = False if raise_exception else detailed
+        result = self._precomputed_check(
+            ('check_upside_down_faces', a_tol, detailed), raise_exception)
+        if result is not None:
+            return result
         msgs = []
         for rm in self._rooms:
             msg = rm.check_upside_down_faces(a_tol, False, detailed)
@@ -3138,6 +3561,10 @@ class Model(_Base):
         """
         tolerance = self.tolerance if tolerance is None else tolerance
         detailed = False if raise_exception else detailed
+        result = self._precomputed_check(
+            ('check_rooms_solid', tolerance, detailed), raise_exception)
+        if result is not None:
+            return result
         msgs = []
         for room in self._rooms:
             msg = room.check_solid(tolerance, raise_exception=False, detailed=detailed)
@@ -3499,7 +3926,8 @@ class Model(_Base):
         triangulated_apertures = []
         parents_to_edit = []
         all_apertures = self.apertures
-        adj_check = []  # confirms when interior apertures are triangulated by adjacency
+        ap_dict = None  # apertures by identifier, built when the first one is needed
+        adj_check = set()  # interior apertures already triangulated by adjacency
         for ap in all_apertures:
             if len(ap.geometry) <= 4:
                 pass
@@ -3515,11 +3943,11 @@ class Model(_Base):
                     parents_to_edit.append(parent_edit_info)
                 # coordinate new apertures with any adjacent apertures
                 if isinstance(ap.boundary_condition, Surface):
-                    bc_obj_identifier = ap.boundary_condition.boundary_condition_object
-                    for other_ap in all_apertures:
-                        if other_ap.identifier == bc_obj_identifier:
-                            adj_ap = other_ap
-                            break
+                    if ap_dict is None:
+                        ap_dict = {}
+                        for other_ap in all_apertures:
+                            ap_dict.setdefault(other_ap.identifier, other_ap)
+                    adj_ap = ap_dict[ap.boundary_condition.boundary_condition_object]
                     new_adj_ap_geo = [face.flip() for face in new_ap_geo]
                     new_adj_aps, edit_in = self._replace_aperture(adj_ap, new_adj_ap_geo)
                     for new_ap, new_adj_ap in zip(new_aps, new_adj_aps):
@@ -3527,7 +3955,7 @@ class Model(_Base):
                     triangulated_apertures.append(new_adj_aps)
                     if edit_in is not None:
                         parents_to_edit.append(edit_in)
-                    adj_check.append(adj_ap.identifier)
+                    adj_check.add(adj_ap.identifier)
         return triangulated_apertures, parents_to_edit
 
     def triangulated_doors(self):
@@ -3560,7 +3988,8 @@ class Model(_Base):
         triangulated_doors = []
         parents_to_edit = []
         all_doors = self.doors
-        adj_check = []  # confirms when interior doors are triangulated by adjacency
+        dr_dict = None  # doors by identifier, built when the first one is needed
+        adj_check = set()  # confirms when interior doors are triangulated by adjacency
         for dr in all_doors:
             if len(dr.geometry) <= 4:
                 pass
@@ -3576,11 +4005,11 @@ class Model(_Base):
                     parents_to_edit.append(parent_edit_info)
                 # coordinate new doors with any adjacent doors
                 if isinstance(dr.boundary_condition, Surface):
-                    bc_obj_identifier = dr.boundary_condition.boundary_condition_object
-                    for other_dr in all_doors:
-                        if other_dr.identifier == bc_obj_identifier:
-                            adj_dr = other_dr
-                            break
+                    if dr_dict is None:
+                        dr_dict = {}
+                        for other_dr in all_doors:
+                            dr_dict.setdefault(other_dr.identifier, other_dr)
+                    adj_dr = dr_dict[dr.boundary_condition.boundary_condition_object]
                     new_adj_dr_geo = [face.flip() for face in new_dr_geo]
                     new_adj_drs, edit_in = self._replace_door(adj_dr, new_adj_dr_geo)
                     for new_dr, new_adj_dr in zip(new_drs, new_adj_drs):
@@ -3588,9 +4017,120 @@ class Model(_Base):
                     triangulated_doors.append(new_adj_drs)
                     if edit_in is not None:
                         parents_to_edit.append(edit_in)
-                    adj_check.append(adj_dr.identifier)
+                    adj_check.add(adj_dr.identifier)
         return triangulated_doors, parents_to_edit
 
+    def _dict_members(self, included_prop=None, triangulate_sub_faces=False,
+                      include_plane=True):
+        """Yield a tuple of (key, value) for each item of the Model dictionary.
+
+        The members are yielded in the order of the to_dict method. For the
+        keys of the lists of top-level objects (eg. rooms, orphaned_faces), the
+        value is a generator that creates the object dictionaries one at a time.
+        See the to_dict method for a description of the arguments.
+        """
+        yield 'type', 'Model'
+        yield 'identifier', self.identifier
+        yield 'display_name', self.display_name
+        yield 'units', self.units
+        yield 'properties', self.properties.to_dict(included_prop)
+        if self._rooms != []:
+            face_edits = self._triangulated_face_edits() \
+                if triangulate_sub_faces else {}
+            yield 'rooms', self._room_dicts(included_prop, include_plane, face_edits)
+        for key in self._OBJECT_KEYS[1:]:
+            objs = getattr(self, '_' + key)
+            if objs != []:
+                if key == 'shade_meshes':
+                    yield key, (obj.to_dict(True, included_prop) for obj in objs)
+                else:
+                    yield key, (obj.to_dict(True, included_prop, include_plane)
+                                for obj in objs)
+        if self.tolerance != 0:
+            yield 'tolerance', self.tolerance
+        if self.angle_tolerance != 0:
+            yield 'angle_tolerance', self.angle_tolerance
+        if self.user_data is not None:
+            yield 'user_data', self.user_data
+        if folders.honeybee_schema_version is not None:
+            yield 'version', folders.honeybee_schema_version_str
+
+    def _room_dicts(self, included_prop, include_plane, face_edits):
+        """Yield the dictionary of each Room with any triangulated sub-faces patched in.
+
+        Args:
+            included_prop: List of properties to filter keys that must be included
+                in the output dictionaries.
+            include_plane: Boolean to note wether the planes of the Face3Ds should
+                be included in the output.
+            face_edits: A dictionary from the _triangulated_face_edits method,
+                which will be mutated as Rooms are yielded.
+        """
+        for room in self._rooms:
+            room_dict = room.to_dict(True, included_prop, include_plane)
+            if len(face_edits) != 0:
+                self._patch_room_sub_faces(room_dict, face_edits, included_prop)
+            yield room_dict
+
+    def _triangulated_face_edits(self):
+        """Get the triangulated sub-faces of the Model grouped by their parent Face.
+
+        Returns:
+            A dictionary with tuples of (Room identifier, Face identifier) as keys.
+            Each value is a list of tuples with three items: the key of the
+            sub-faces in the Face dictionary (either apertures or doors), the
+            identifier of the original sub-face and a list of the triangulated
+            sub-faces to replace it.
+        """
+        face_edits = {}
+        for sub_face_key, triangulate in (('apertures', self.triangulated_apertures),
+                                          ('doors', self.triangulated_doors)):
+            triangulated, parents_to_edit = triangulate()
+            for tri_objs, edit_infos in zip(triangulated, parents_to_edit):
+                if len(edit_infos) == 3:
+                    face_key = (edit_infos[2], edit_infos[1])
+                    edit = (sub_face_key, edit_infos[0], tri_objs)
+                    try:
+                        face_edits[face_key].append(edit)
+                    except KeyError:  # first sub-face to be edited in the face
+                        face_edits[face_key] = [edit]
+        return face_edits
+
+    @staticmethod
+    def _patch_room_sub_faces(room_dict, face_edits, included_prop):
+        """Replace sub-face dictionaries within a Room dictionary with triangulated ones.
+
+        The original sub-faces are removed and the triangulated ones are added
+        at the end of the list of sub-faces of each Face.
+
+        Args:
+            room_dict: A Room dictionary to be patched.
+            face_edits: A dictionary from the _triangulated_face_edits method. The
+                edits of the Faces in the Room will be removed from it.
+            included_prop: List of properties to filter keys that must be included
+                in the output sub-face dictionaries.
+        """
+        for face in room_dict['faces']:
+            try:
+                edits = face_edits.pop((room_dict['identifier'], face['identifier']))
+            except KeyError:  # no sub-faces to edit in the face
+                continue
+            for sub_face_key in ('apertures', 'doors'):
+                sf_edits = [edit[1:] for edit in edits if edit[0] == sub_face_key]
+                if len(sf_edits) == 0:
+                    continue
+                to_remove = set(sf_id for sf_id, _ in sf_edits)
+                new_sub_faces = []
+                for sf in face[sub_face_key]:
+                    if sf['identifier'] in to_remove:
+                        to_remove.remove(sf['identifier'])
+                    else:
+                        new_sub_faces.append(sf)
+                for _, tri_objs in sf_edits:
+                    new_sub_faces.extend(sf.to_dict(True, included_prop)
+                                         for sf in tri_objs)
+                face[sub_face_key] = new_sub_faces
+
     def _remove_sliver_geometries(self, face3ds):
         """Remove sliver geometries from a list of Face3Ds."""
         clean_face3ds = []
@@ -3774,78 +4314,40 @@ class Model(_Base):
                 X/Y axes of the planes but is not required and can be removed to
                 keep the dictionary smaller. (Default: True).
         """
-        # write all of the geometry objects and their properties
-        base = {'type': 'Model'}
-        base['identifier'] = self.identifier
-        base['display_name'] = self.display_name
-        base['units'] = self.units
-        base['properties'] = self.properties.to_dict(included_prop)
-        if self._rooms != []:
-            base['rooms'] = [r.to_dict(True, included_prop, include_plane)
-                             for r in self._rooms]
-        if self._orphaned_faces != []:
-            base['orphaned_faces'] = [f.to_dict(True, included_prop, include_plane)
-                                      for f in self._orphaned_faces]
-        if self._orphaned_apertures != []:
-            base['orphaned_apertures'] = [ap.to_dict(True, included_prop, include_plane)
-                                          for ap in self._orphaned_apertures]
-        if self._orphaned_doors != []:
-            base['orphaned_doors'] = [dr.to_dict(True, included_prop, include_plane)
-                                      for dr in self._orphaned_doors]
-        if self._orphaned_shades != []:
-            base['orphaned_shades'] = [shd.to_dict(True, included_prop, include_plane)
-                                       for shd in self._orphaned_shades]
-        if self._shade_meshes != []:
-            base['shade_meshes'] = [sm.to_dict(True, included_prop)
-                                    for sm in self._shade_meshes]
-        if self.tolerance != 0:
-            base['tolerance'] = self.tolerance
-        if self.angle_tolerance != 0:
-            base['angle_tolerance'] = self.angle_tolerance
+        base = {}
+        for key, value in self._dict_members(
+                included_prop, triangulate_sub_faces, include_plane):
+            base[key] = list(value) if key in self._OBJECT_KEYS else value
+        return base
 
-        # triangulate sub-faces if this was requested
-        if triangulate_sub_faces:
-            apertures, parents_to_edit = self.triangulated_apertures()
-            for tri_aps, edit_infos in zip(apertures, parents_to_edit):
-                if len(edit_infos) == 3:
-                    for room in base['rooms']:
-                        if room['identifier'] == edit_infos[2]:
-                            break
-                    for face in room['faces']:
-                        if face['identifier'] == edit_infos[1]:
-                            break
-                    for i, ap in enumerate(face['apertures']):
-                        if ap['identifier'] == edit_infos[0]:
-                            break
-                    del face['apertures'][i]
-                    face['apertures'].extend(
-                        [a.to_dict(True, included_prop) for a in tri_aps])
-            doors, parents_to_edit = self.triangulated_doors()
-            for tri_drs, edit_infos in zip(doors, parents_to_edit):
-                if len(edit_infos) == 3:
-                    for room in base['rooms']:
-                        if room['identifier'] == edit_infos[2]:
-                            break
-                    for face in room['faces']:
-                        if face['identifier'] == edit_infos[1]:
-                            break
-                    for i, ap in enumerate(face['doors']):
-                        if ap['identifier'] == edit_infos[0]:
-                            break
-                    del face['doors'][i]
-                    face['doors'].extend(
-                        [dr.to_dict(True, included_prop) for dr in tri_drs])
+    def dump_hbjson(self, file_obj, indent=None, included_prop=None,
+                    triangulate_sub_faces=False):
+        """Write this Model as HBJSON to a file-like object.
 
-        # write in the optional keys if they are not None
-        if self.user_data is not None:
-            base['user_data'] = self.user_data
-        if folders.honeybee_schema_version is not None:
-            base['version'] = folders.honeybee_schema_version_str
+        The Rooms and orphaned objects are converted to dictionaries and
+        written to the file one at a time such that the dictionary and the
+        JSON string of the whole Model are never held in memory. The text
+        written is the same as that of json.dump for the Model to_dict.
 
-        return base
+        Args:
+            file_obj: A file-like object opened in text mode to which the HBJSON
+                will be written (eg. an open file or sys.stdout).
+            indent: A positive integer to set the indentation used in the resulting
+                HBJSON. (Default: None).
+            included_prop: List of properties to filter keys that must be included in
+                output dictionary. For example ['energy'] will include 'energy' key if
+                available in properties to_dict. By default all the keys will be
+                included. To exclude all the keys from extensions use an empty list.
+            triangulate_sub_faces: Boolean to note whether sub-faces (including
+                Apertures and Doors) should be triangulated if they have more than
+                4 sides (True) or whether they should be left as they are (False).
+                See the to_dict method for more information. (Default: False).
+        """
+        members = self._dict_members(included_prop, triangulate_sub_faces)
+        dump_json_members(members, file_obj, self._OBJECT_KEYS, indent)
 
     def to_hbjson(self, name=None, folder=None, indent=None,
-                  included_prop=None, triangulate_sub_faces=False):
+                  included_prop=None, triangulate_sub_faces=False, compression=None):
         """Write Honeybee model to HBJSON.
 
         Args:
@@ -3868,21 +4370,24 @@ class Model(_Base):
                 setting this to True will only triangulate sub-faces with parent Faces
                 that also have parent Rooms since orphaned Apertures and Faces are
                 not relevant for energy simulation. (Default: False).
+            compression: Text for the type of compression to be used to write the
+                HBJSON. Choose from gzip or zstd, which will add a .gz or .zst
+                extension to the file name respectively. None will write an
+                uncompressed HBJSON. (Default: None).
         """
-        # create dictionary from the Honeybee Model
-        hb_dict = self.to_dict(included_prop=included_prop,
-                               triangulate_sub_faces=triangulate_sub_faces)
-
         # set up a name and folder for the HBJSON
         if name is None:
             name = self.identifier
+        ext = COMPRESSION_EXTENSIONS.get(compression, '')
+        if ext and name.lower().endswith(ext):
+            name = name[:-len(ext)]
         file_name = name if name.lower().endswith('.hbjson') or \
             name.lower().endswith('.json') else '{}.hbjson'.format(name)
         folder = folder if folder is not None else folders.default_simulation_folder
-        hb_file = os.path.join(folder, file_name)
+        hb_file = os.path.join(folder, file_name + ext)
         # write HBJSON
-        with open(hb_file, 'w') as fp:
-            json.dump(hb_dict, fp, indent=indent)
+        with open_hbjson(hb_file, 'w', compression) as fp:
+            self.dump_hbjson(fp, indent, included_prop, triangulate_sub_faces)
         return hb_file
 
     def to_hbpkl(self, name=None, folder=None, included_prop=None,
@@ -3924,6 +4429,52 @@ class Model(_Base):
             pickle.dump(hb_dict, fp)
         return hb_file
 
+    def to_hbb(self, name=None, folder=None, included_prop=None,
+               triangulate_sub_faces=False):
+        """Write Honeybee model to a compact binary file (HBB).
+
+        HBB files are smaller than HBJSON and faster to load since the geometry
+        vertices are stored as binary arrays and the closed volume of each Room
+        is stored such that it does not have to be solved again.
+
+        Args:
+            name: A text string for the name of the HBB file. If None, the model
+                identifier wil be used. (Default: None).
+            folder: A text string for the directory where the HBB file will be
+                written. If unspecified, the default simulation folder will be used.
+                This is usually at "C:\\Users\\USERNAME\\simulation."
+            included_prop: List of properties to filter keys that must be included in
+                output dictionary. For example ['energy'] will include 'energy' key if
+                available in properties to_dict. By default all the keys will be
+                included. To exclude all the keys from extensions use an empty list.
+            triangulate_sub_faces: Boolean to note whether sub-faces (including
+                Apertures and Doors) should be triangulated if they have more than
+                4 sides (True) or whether they should be left as they are (False).
+                This triangulation is necessary when exporting directly to EnergyPlus
+                since it cannot accept sub-faces with more than 4 vertices. Note that
+                setting this to True will only triangulate sub-faces with parent Faces
+                that also have parent Rooms since orphaned Apertures and Faces are
+                not relevant for energy simulation. (Default: False).
+        """
+        # create dictionary from the Honeybee Model
+        hb_dict = self.to_dict(included_prop=included_prop,
+                               triangulate_sub_faces=triangulate_sub_faces)
+        # the room geometry no longer matches the faces after triangulation
+        room_polyfaces = None if triangulate_sub_faces else \
+            [room.geometry.to_dict() for room in self._rooms]
+
+        # set up a name and folder for the HBB
+        if name is None:
+            name = self.identifier
+        file_name = name if name.lower().endswith('.hbb') \
+            else '{}.hbb'.format(name)
+        folder = folder if folder is not None else folders.default_simulation_folder
+        hb_file = os.path.join(folder, file_name)
+        # write the Model dictionary into a file
+        with open(hb_file, 'wb') as fp:
+            dump_hbb(hb_dict, fp, room_polyfaces)
+        return hb_file
+
     def to_stl(self, name=None, folder=None):
         """Write Honeybee model to an ASCII STL file.
 
@@ -3981,9 +4532,318 @@ class Model(_Base):
         return self._rooms + self._orphaned_faces + self._orphaned_shades + \
             self._orphaned_apertures + self._orphaned_doors + self._shade_meshes
 
+    def _collect_faces(self):
+        """Get a new list of all Face objects in the model."""
+        child_faces = [face for room in self._rooms for face in room._faces]
+        return child_faces + self._orphaned_faces
+
+    def _collect_apertures(self):
+        """Get a new list of all Aperture objects in the model."""
+        child_apertures = []
+        for room in self._rooms:
+            for face in room._faces:
+                child_apertures.extend(face._apertures)
+        for face in self._orphaned_faces:
+            child_apertures.extend(face._apertures)
+        return child_apertures + self._orphaned_apertures
+
+    def _collect_doors(self):
+        """Get a new list of all Door objects in the model."""
+        child_doors = []
+        for room in self._rooms:
+            for face in room._faces:
+                child_doors.extend(face._doors)
+        for face in self._orphaned_faces:
+            child_doors.extend(face._doors)
+        return child_doors + self._orphaned_doors
+
+    def _collect_shades(self):
+        """Get a new list of all Shade objects in the model."""
+        child_shades = []
+        for room in self._rooms:
+            child_shades.extend(room.shades)
+            for face in room._faces:
+                child_shades.extend(face.shades)
+                for ap in face._apertures:
+                    child_shades.extend(ap.shades)
+                for dr in face._doors:
+                    child_shades.extend(dr.shades)
+        for face in self._orphaned_faces:
+            child_shades.extend(face.shades)
+            for ap in face._apertures:
+                child_shades.extend(ap.shades)
+            for dr in face._doors:
+                child_shades.extend(dr.shades)
+        for ap in self._orphaned_apertures:
+            child_shades.extend(ap.shades)
+        for dr in self._orphaned_doors:
+            child_shades.extend(dr.shades)
+        return child_shades + self._orphaned_shades
+
+    def _collect_indoor_shades(self):
+        """Get a new list of all indoor Shade objects in the model."""
+        child_shades = []
+        for room in self._rooms:
+            child_shades.extend(room._indoor_shades)
+            for face in room._faces:
+                child_shades.extend(face._indoor_shades)
+                for ap in face._apertures:
+                    child_shades.extend(ap._indoor_shades)
+                for dr in face._doors:
+                    child_shades.extend(dr._indoor_shades)
+        for face in self._orphaned_faces:
+            child_shades.extend(face._indoor_shades)
+            for ap in face._apertures:
+                child_shades.extend(ap._indoor_shades)
+            for dr in face._doors:
+                child_shades.extend(dr._indoor_shades)
+        for ap in self._orphaned_apertures:
+            child_shades.extend(ap._indoor_shades)
+        for dr in self._orphaned_doors:
+            child_shades.extend(dr._indoor_shades)
+        return child_shades
+
+    def _collect_outdoor_shades(self):
+        """Get a new list of all outdoor Shade objects in the model."""
+        child_shades = []
+        for room in self._rooms:
+            child_shades.extend(room._outdoor_shades)
+            for face in room._faces:
+                child_shades.extend(face._outdoor_shades)
+                for ap in face._apertures:
+                    child_shades.extend(ap._outdoor_shades)
+                for dr in face._doors:
+                    child_shades.extend(dr._outdoor_shades)
+        for face in self._orphaned_faces:
+            child_shades.extend(face._outdoor_shades)
+            for ap in face._apertures:
+                child_shades.extend(ap._outdoor_shades)
+            for dr in face._doors:
+                child_shades.extend(dr._outdoor_shades)
+        for ap in self._orphaned_apertures:
+            child_shades.extend(ap._outdoor_shades)
+        for dr in self._orphaned_doors:
+            child_shades.extend(dr._outdoor_shades)
+        return child_shades + self._orphaned_shades
+
+    def _top_level_lists(self):
+        """Get a tuple of the lists of top-level objects in the Model."""
+        return (self._rooms, self._orphaned_faces, self._orphaned_apertures,
+                self._orphaned_doors, self._orphaned_shades, self._shade_meshes)
+
+    def _current_object_cache(self):
+        """Get the dictionary of cached object lists and identifier indices.
+
+        The cache is discarded whenever any list of top-level objects is replaced
+        or changes length, which covers all of the methods that add or remove
+        top-level objects. It is also discarded whenever child objects are added
+        to or removed from any Room, Face, Aperture or Door. Other changes to
+        child objects (eg. identifiers) are caught when the identifier indices
+        are used by the _objects_by_identifier method.
+        """
+        lists = self._top_level_lists()
+        cache = self._object_cache
+        if cache is not None:
+            if cache['revision'] != _Base._structure_revision:
+                cache = None
+            else:
+                for obj_list, (cached_list, list_len) in zip(lists, cache['lists']):
+                    if obj_list is not cached_list or len(obj_list) != list_len:
+                        cache = None
+                        break
+        if cache is None:
+            cache = {
+                'revision': _Base._structure_revision,
+                'lists': [(obj_list, len(obj_list)) for obj_list in lists]
+            }
+            self._object_cache = cache
+        return cache
+
+    def _current_face_index(self, tolerance):
+        """Get the hash grid of Room Face centers, updated to match the Model Rooms.
+
+        The grid is kept between calls and only the Rooms that have been added,
+        removed, or had their Faces replaced or transformed since the last call
+        are re-indexed. Changes to Faces are detected through the identity of
+        the Face objects and their (immutable) Face3D geometry.
+
+        Args:
+            tolerance: The tolerance at which the hash grid cells are sized.
+                The grid is rebuilt from scratch if this is different from
+                the tolerance of the last call.
+
+        Returns:
+            A dictionary with a cell_size key for the size of the hash grid cells
+            and a grid key for a dictionary with grid_key tuples as keys and
+            lists of (Face, index of the Face in its Room) tuples as values.
+        """
+        index = self._face_index
+        if index is None or index['tolerance'] != tolerance:
+            index = {'tolerance': tolerance, 'cell_size': grid_cell_size(tolerance),
+                     'grid': {}, 'rooms': {}}
+            self._face_index = index
+        grid, cell_size, indexed = index['grid'], index['cell_size'], index['rooms']
+
+        def unindex_faces(face_entries):
+            for face, _, key in face_entries:
+                cell = grid[key]
+                for i, (cell_face, _) in enumerate(cell):
+                    if cell_face is face:
+                        cell.pop(i)
+                        break
+                if len(cell) == 0:
+                    del grid[key]
+
+        # update the entries of any rooms that are new or have been changed
+        model_rooms = set()
+        for room in self._rooms:
+            room_key = id(room)
+            model_rooms.add(room_key)
+            try:
+                face_entries = indexed[room_key][1]
+            except KeyError:  # room has not yet been indexed
+                face_entries = None
+            else:
+                if len(face_entries) == len(room._faces) and \
+                        all(face is entry[0] and face._geometry is entry[1]
+                            for face, entry in zip(room._faces, face_entries)):
+                    continue  # room is unchanged since it was indexed
+                unindex_faces(face_entries)
+            face_entries = []
+            for i, face in enumerate(room._faces):
+                key = grid_key(face.geometry.center, cell_size)
+                try:
+                    grid[key].append((face, i))
+                except KeyError:  # first face in this cell
+                    grid[key] = [(face, i)]
+                face_entries.append((face, face._geometry, key))
+            # the room is stored so that its id cannot be reused while it is indexed
+            indexed[room_key] = (room, face_entries)
+
+        # remove the entries of any rooms that are no longer in the model
+        for room_key in [r_key for r_key in indexed if r_key not in model_rooms]:
+            unindex_faces(indexed.pop(room_key)[1])
+        return index
+
+    def _spatial_index_objects(self, obj_type):
+        """Get a list of the Model objects that can be indexed by spatial_index."""
+        if obj_type == 'Room':
+            return self._rooms
+        elif obj_type == 'Face':
+            return self.faces
+        elif obj_type == 'Aperture':
+            return self.apertures
+        elif obj_type == 'Door':
+            return self.doors
+        elif obj_type == 'SubFace':
+            return self.apertures + self.doors
+        elif obj_type == 'Shade':
+            return self.shades
+        return self._shade_meshes
+
+    def _cached_objects(self, obj_key):
+        """Get a new list of child objects in the model using the object cache.
+
+        Args:
+            obj_key: Text for the objects to get, which should match the name
+                of a _collect method (eg. faces, apertures, indoor_shades).
+        """
+        cache = self._current_object_cache()
+        try:
+            objs = cache[obj_key]
+        except KeyError:  # list has not yet been collected
+            objs = cache[obj_key] = getattr(self, '_collect_' + obj_key)()
+        return list(objs)
+
+    def _objects_by_identifier(self, obj_type, identifiers, error_msg):
+        """Get a list of objects in the model using the identifier index.
+
+        Args:
+            obj_type: Text for the type of object to get. Choose from Room, Face,
+                Aperture, Door, Shade, ShadeMesh.
+            identifiers: A list of identifiers for the objects to get.
+            error_msg: Text to be formatted with the missing identifiers and
+                used in the ValueError if any objects are not found.
+        """
+        cache = self._current_object_cache()
+        obj_index, rebuilt = cache.get(obj_type), False
+        if obj_index is None:
+            obj_index = cache[obj_type] = self._build_id_index(obj_type)
+            rebuilt = True
+        while True:
+            objs, missing_ids = [], []
+            for obj_id in identifiers:
+                try:
+                    obj, top_obj = obj_index[obj_id]
+                except KeyError:
+                    missing_ids.append(obj_id)
+                    continue
+                if obj.identifier != obj_id or \
+                        self._attached_top_object(obj) is not top_obj:
+                    missing_ids.append(obj_id)
+                    continue
+                objs.append(obj)
+            if len(missing_ids) == 0 or rebuilt:
+                break
+            # child objects or identifiers may have changed; rebuild and retry
+            obj_index = cache[obj_type] = self._build_id_index(obj_type)
+            rebuilt = True
+        if len(missing_ids) != 0:
+            all_objs = ' '.join(['"' + rid + '"' for rid in missing_ids])
+            raise ValueError(error_msg.format(all_objs))
+        return objs
+
+    def _build_id_index(self, obj_type):
+        """Build a dictionary of objects in the model of a given type by identifier.
+
+        Each object is stored alongside the top-level object that contains it
+        such that objects that are later removed from the Model can be detected.
+        Where identifiers are duplicated, the first object is used, matching
+        the order of the Model properties that list the objects.
+        """
+        if obj_type == 'Room':
+            objs = self._rooms
+        elif obj_type == 'Face':
+            objs = self.faces
+        elif obj_type == 'Aperture':
+            objs = self.apertures
+        elif obj_type == 'Door':
+            objs = self.doors
+        elif obj_type == 'Shade':
+            objs = self.shades
+        else:
+            objs = self._shade_meshes
+        obj_index = {}
+        for obj in objs:
+            if obj.identifier not in obj_index:
+                obj_index[obj.identifier] = (obj, self._attached_top_object(obj))
+        return obj_index
+
+    @staticmethod
+    def _attached_top_object(hb_obj):
+        """Get the top-level object that contains an object through its parents.
+
+        None will be returned if the object is no longer contained within one
+        of its parents (eg. because it was removed from its parent).
+        """
+        child, parent = hb_obj, getattr(hb_obj, '_parent', None)
+        while parent is not None and not isinstance(child, Room):
+            if isinstance(child, Shade):
+                siblings = parent._outdoor_shades + parent._indoor_shades
+            elif isinstance(child, Face):
+                siblings = parent._faces
+            elif isinstance(child, Aperture):
+                siblings = parent._apertures
+            else:
+                siblings = parent._doors
+            if not any(obj is child for obj in siblings):
+                return None
+            child, parent = parent, parent._parent
+        return child
+
     @staticmethod
     def validate(model, check_function='check_for_extension', check_args=None,
-                 json_output=False):
+                 json_output=False, workers=None, validation_cache=None):
         """Get a string of a validation report given a specific check_function.
 
         Args:
@@ -4000,15 +4860,24 @@ class Model(_Base):
                 will be used. (Default: None).
             json_output: Boolean to note whether the output validation report
                 should be formatted as a JSON object instead of plain text.
+            workers: An optional integer for the number of worker processes
+                over which the Model objects will be serialized if the input
+                model is a file path or JSON string. This will also be used
+                to run the Room checks of check_all and check_for_extension in
+                parallel. Zero or a negative number will use all available
+                CPUs. (Default: None).
+            validation_cache: An optional ValidationCache object to be used by
+                check_all and check_for_extension such that only Rooms that are
+                not in the cache are checked. (Default: None).
         """
         # process the input model if it's not already serialized
         report = ''
         if isinstance(model, str):
             try:
                 if model.startswith('{'):
-                    model = Model.from_dict(json.loads(model))
+                    model = Model.from_dict(jsonutil.loads(model), workers=workers)
                 elif os.path.isfile(model):
-                    model = Model.from_file(model)
+                    model = Model.from_file(model, workers=workers)
                 else:
                     report = 'Input Model for validation is not a Model object, ' \
                         'file path to a Model or a Model HBJSON string.'
@@ -4033,6 +4902,11 @@ class Model(_Base):
             # process the arguments and options
             args = [] if check_args is None else [] + list(check_args)
             kwargs = {'raise_exception': False}
+            if check_function in ('check_all', 'check_for_extension'):
+                if workers is not None:
+                    kwargs['workers'] = workers
+                if validation_cache is not None:
+                    kwargs['validation_cache'] = validation_cache
 
         # create the report
         if not json_output:  # create a plain text report
@@ -4182,6 +5056,119 @@ class Model(_Base):
         """
         return conversion_factor_to_meters(units)
 
+    def _check_planar_parts(self, tolerance, detailed):
+        """Get the check_planar results for the Faces, Shades, Apertures and Doors."""
+        parts = []
+        for objs in (self.faces, self.shades, self.apertures, self.doors):
+            msgs = [obj.check_planar(tolerance, False, detailed) for obj in objs]
+            parts.append(self._merge_check_results(msgs, detailed))
+        return parts
+
+    def _room_check_parts(self, tolerance, angle_tolerance, e_tol, detailed):
+        """Get a list of results for all checks that can be run Room by Room.
+
+        The results of these checks for a Model can be obtained by merging the
+        results from several Models that each contain a part of the Rooms.
+        Note that the results of check_planar are split into four parts for
+        the Faces, Shades, Apertures and Doors.
+        """
+        parts = self._check_planar_parts(tolerance, detailed)
+        parts.append(self.check_self_intersecting(tolerance, False, detailed))
+        parts.append(self.check_degenerate_rooms(e_tol, False, detailed))
+        parts.append(
+            self.check_sub_faces_valid(tolerance, angle_tolerance, False, detailed))
+        parts.append(self.check_sub_faces_overlapping(tolerance, False, detailed))
+        parts.append(self.check_upside_down_faces(angle_tolerance, False, detailed))
+        parts.append(self.check_rooms_solid(tolerance, None, False, detailed))
+        return parts
+
+    def _room_check_results(self, tolerance, angle_tolerance, e_tol, detailed,
+                            workers=None, validation_cache=None):
+        """Run all checks that can be run Room by Room using workers or a cache.
+
+        Returns:
+            A dictionary of check results to be used by _precomputed_check
+            with tuples of the check name and arguments as keys. None if the
+            checks should be run in the current process without a cache.
+        """
+        workers = worker_count(workers)
+        rooms = self._rooms
+        if validation_cache is None and (workers <= 1 or len(rooms) <= 1):
+            return None
+        # get any results of the Room checks that are already in the cache
+        if validation_cache is not None:
+            keys = [validation_cache.room_key(r, tolerance, angle_tolerance,
+                                              e_tol, detailed) for r in rooms]
+            room_parts = [validation_cache.get(key) for key in keys]
+        else:
+            room_parts = [None] * len(rooms)
+        # run the checks of the Rooms without results, using workers if requested
+        missing = [i for i, parts in enumerate(room_parts) if parts is None]
+        args = (self.units, tolerance, angle_tolerance, e_tol, detailed)
+        if workers > 1 and len(missing) > 1:
+            inputs = [(chunk,) + args for chunk in
+                      chunk_list([rooms[i] for i in missing], workers * 4)]
+            new_parts = [parts for chunk_parts in
+                         parallel_map(_room_check_parts, inputs, workers)
+                         for parts in chunk_parts]
+        elif len(missing) != 0:
+            new_parts = _room_check_parts(([rooms[i] for i in missing],) + args)
+        else:
+            new_parts = []
+        for i, parts in zip(missing, new_parts):
+            room_parts[i] = parts
+            if validation_cache is not None:
+                validation_cache.set(keys[i], parts)
+        # run the checks of the orphaned objects in the current process
+        orphan_model = Model(
+            self.identifier, None, self._orphaned_faces, self._orphaned_shades,
+            self._orphaned_apertures, self._orphaned_doors, None,
+            self.units, tolerance, angle_tolerance)
+        room_parts.append(
+            orphan_model._room_check_parts(tolerance, angle_tolerance, e_tol, detailed))
+        # merge the results of each check across all of the Rooms
+        parts = [self._merge_check_results(results, detailed)
+                 for results in zip(*room_parts)]
+        return {
+            ('check_planar', tolerance, detailed):
+                self._merge_check_results(parts[:4], detailed),
+            ('check_self_intersecting', tolerance, detailed): parts[4],
+            ('check_degenerate_rooms', e_tol, detailed): parts[5],
+            ('check_sub_faces_valid', tolerance, angle_tolerance, detailed): parts[6],
+            ('check_sub_faces_overlapping', tolerance, detailed): parts[7],
+            ('check_upside_down_faces', angle_tolerance, detailed): parts[8],
+            ('check_rooms_solid', tolerance, detailed): parts[9]
+        }
+
+    def _precomputed_check(self, check_key, raise_exception):
+        """Get the result of a check that was already run by _room_check_results.
+
+        Args:
+            check_key: A tuple with the name of the check method followed by
+                the values of its arguments.
+            raise_exception: Boolean to note whether a ValueError should be
+                raised if the precomputed check found errors.
+
+        Returns:
+            The result of the check or None if it has not been precomputed.
+        """
+        if self._check_results is None:
+            return None
+        try:
+            result = self._check_results[check_key]
+        except KeyError:  # check was run with different arguments
+            return None
+        if raise_exception and len(result) != 0:
+            raise ValueError(result)
+        return list(result) if isinstance(result, list) else result
+
+    @staticmethod
+    def _merge_check_results(results, detailed):
+        """Merge several results of a check method into a single result."""
+        if detailed:
+            return [m for msg in results if msg for m in msg]
+        return '\n'.join(msg for msg in results if msg)
+
     def _self_adj_check(self, obj_type, hb_obj, bc_ids, room_ids, bc_set, detailed):
         """Check that an adjacent object is referencing itself or its own room.
 
@@ -4296,3 +5283,120 @@ class Model(_Base):
 
     def __repr__(self):
         return 'Model: %s' % self.display_name
+
+
+def _dicts_to_objects(inputs):
+    """Convert a list of honeybee object dictionaries to Python objects.
+
+    This function is at the module level so that it can be used by process pools.
+
+    Args:
+        inputs: A tuple with three items. The first is the class of the objects
+            (eg. Room, Face, Shade). The second is a list of dictionaries for
+            the objects and the third is a tuple of extra arguments to be passed
+            to the from_dict method of the class.
+    """
+    obj_class, obj_dicts, args = inputs
+    objs = []
+    for obj_dict in obj_dicts:
+        try:
+            objs.append(obj_class.from_dict(obj_dict, *args))
+        except Exception as e:
+            invalid_dict_error(obj_dict, e)
+    return objs
+
+
+def _hbb_dicts_to_objects(inputs):
+    """Convert a list of honeybee object dictionaries from an HBB file to Python.
+
+    This function is at the module level so that it can be used by process pools.
+
+    Args:
+        inputs: A tuple with three items. The first is the class of the objects
+            (eg. Room, Face, Shade) and the second is a list of dictionaries for
+            the objects. For Rooms, the third is a tuple with a list of Polyface3D
+            dictionaries for the Room geometry and the tolerance to be used to
+            solve the geometry of Rooms without a Polyface3D. For all other
+            objects, the third item is an empty tuple.
+    """
+    obj_class, obj_dicts, args = inputs
+    if obj_class is not Room:
+        return _dicts_to_objects(inputs)
+    polyfaces, tolerance = args
+    rooms = _dicts_to_objects((Room, obj_dicts, ()))
+    for room, poly_dict in zip(rooms, polyfaces):
+        if poly_dict is not None:
+            room._geometry = Polyface3D.from_dict(poly_dict)
+        elif tolerance != 0:
+            room._solve_geometry(tolerance)
+    return rooms
+
+
+def _solve_room_geometry(inputs):
+    """Solve the closed volume of a list of Rooms given a tolerance.
+
+    This function is at the module level so that it can be used by process pools.
+
+    Args:
+        inputs: A tuple with two items. The first is a list of Rooms and the
+            second is the tolerance to be used to solve the Room geometry.
+    """
+    rooms, tolerance = inputs
+    for room in rooms:
+        room._solve_geometry(tolerance)
+    return rooms
+
+
+def _room_check_parts(inputs):
+    """Run all of the checks that can be run Room by Room on each of a list of Rooms.
+
+    This function is at the module level so that it can be used by process pools.
+
+    Args:
+        inputs: A tuple with a list of Rooms, the Model units, tolerance,
+            angle_tolerance, tolerance for degenerate Rooms and a boolean
+            for whether the results should be detailed.
+
+    Returns:
+        A list with the results of the Model._room_check_parts method for each Room.
+    """
+    rooms, units, tol, ang_tol, e_tol, detailed = inputs
+    room_parts = []
+    for room in rooms:
+        model = Model('Room', [room], units=units, tolerance=tol,
+                      angle_tolerance=ang_tol)
+        room_parts.append(model._room_check_parts(tol, ang_tol, e_tol, detailed))
+    return room_parts
+
+
+def _relevant_room_indices(inputs):
+    """Get the indices of the Rooms that are relevant to each of several edges.
+
+    This function is at the module level so that it can be used by process pools.
+
+    Args:
+        inputs: A tuple with three items. The first is a list of LineSegment3D
+            or Polyline3D for the edges. The second is a list of tuples with a
+            BoundingBoxTree of vertices and a list of the Room index of each
+            vertex. The third is the tolerance.
+
+    Returns:
+        A list with a sorted list of Room indices for each edge.
+    """
+    edges, vertex_trees, tolerance = inputs
+    edge_room_ids = []
+    for edge in edges:
+        room_ids = set()
+        for tree, vertex_rooms in vertex_trees:
+            if isinstance(edge, LineSegment3D):
+                near_ids = tree.query_segment(edge, tolerance)
+            else:
+                near_ids = tree.query_box(geometry_box(edge), tolerance)
+            for j in near_ids:
+                if vertex_rooms[j] not in room_ids:
+                    box = tree.boxes[j]
+                    if edge.distance_to_point(Point3D(box[0], box[1], box[2])) \
+                            < tolerance:
+                        room_ids.add(vertex_rooms[j])
+        edge_room_ids.append(sorted(room_ids))
+    return edge_room_ids
@@ -0,0 +1,105 @@
+# coding=utf-8
+"""Utilities for running honeybee operations over a pool of worker processes.
+
+Note that process pools are only available in cPython. In other environments
+(eg. IronPython), all of the functions here fall back to running in the
+current process.
+"""
+try:
+    import multiprocessing
+except ImportError:  # multiprocessing is not available (eg. IronPython)
+    multiprocessing = None
+
+
+def worker_count(workers):
+    """Get the number of worker processes to use from a user input.
+
+    Args:
+        workers: An integer for the number of worker processes to use. Zero or
+            a negative number will use all available CPUs. None will run in the
+            current process without a pool.
+
+    Returns:
+        An integer for the number of worker processes. A value of 1 indicates
+        that the work should be done in the current process.
+    """
+    if workers is None or multiprocessing is None:
+        return 1
+    if workers <= 0:
+        try:
+            return multiprocessing.cpu_count()
+        except NotImplementedError:  # CPU count cannot be determined
+            return 1
+    return int(workers)
+
+
+def chunk_list(items, chunk_count):
+    """Split a list into a number of contiguous chunks of similar length.
+
+    Args:
+        items: A list to be split into chunks.
+        chunk_count: An integer for the number of chunks. Fewer chunks will be
+            returned if there are fewer items than the chunk_count.
+
+    Returns:
+        A list of lists where each sub-list is a contiguous chunk of the items.
+        Concatenating the chunks gives the original list.
+    """
+    chunk_count = max(1, min(chunk_count, len(items)))
+    size, extra = divmod(len(items), chunk_count)
+    chunks, start = [], 0
+    for i in range(chunk_count):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def process_pool(workers=None):
+    """Get a pool of worker processes that can be re-used across several tasks.
+
+    Args:
+        workers: An integer for the number of worker processes to use. Zero or
+            a negative number will use all available CPUs. None will run all
+            work in the current process. (Default: None).
+
+    Returns:
+        A multiprocessing Pool or None if the work should be done in the current
+        process. Pools should be closed and joined once the work is done.
+    """
+    workers = worker_count(workers)
+    return multiprocessing.Pool(workers) if workers > 1 else None
+
+
+def parallel_map(function, inputs, workers=None, pool=None):
+    """Apply a function to each item of a list of inputs over a pool of processes.
+
+    The results are returned in the same order as the inputs. If only one
+    worker is requested or there is only one input, the function will run
+    in the current process.
+
+    Args:
+        function: A function to be applied to each input. This function must
+            be defined at the top level of a module so that it can be pickled.
+        inputs: A list of inputs to the function. Each input must be picklable.
+        workers: An integer for the number of worker processes to use. Zero or
+            a negative number will use all available CPUs. None will run all
+            work in the current process. (Default: None).
+        pool: An optional existing pool from the process_pool function, which
+            will be used instead of starting a new pool for the workers. (Default:
+            None).
+
+    Returns:
+        A list with the result of the function for each input.
+    """
+    if pool is not None and len(inputs) > 1:
+        return pool.map(function, inputs, chunksize=1)
+    workers = min(worker_count(workers), len(inputs))
+    if pool is not None or workers <= 1:
+        return [function(inp) for inp in inputs]
+    pool = multiprocessing.Pool(workers)
+    try:
+        return pool.map(function, inputs, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
@@ -5,9 +5,34 @@ These objects hold all attributes assigned by extensions like honeybee-radiance
 and honeybee-energy.  Note that these Property objects are not intended to exist
 on their own but should have a host object.
 """
+from honeybee import load_extensions
 
+# cache of the extension attribute names for each Properties class
+_EXTENSION_ATTRIBUTES = {}
 
-class _Properties(object):
+
+class _PropertiesMeta(type):
+    """Metaclass that clears the extension attribute cache when classes are edited.
+
+    Extensions register their attributes by setting them on the Properties classes
+    (eg. setattr(RoomProperties, 'energy', property(...))), which will invalidate
+    the cached attribute names of all Properties classes.
+    """
+
+    def __setattr__(cls, name, value):
+        type.__setattr__(cls, name, value)
+        _EXTENSION_ATTRIBUTES.clear()
+
+    def __delattr__(cls, name):
+        type.__delattr__(cls, name)
+        _EXTENSION_ATTRIBUTES.clear()
+
+
+# base class using the metaclass with a syntax that works in Python 2 and 3
+_PropertiesBase = _PropertiesMeta('_PropertiesBase', (object,), {})
+
+
+class _Properties(_PropertiesBase):
     """Base class for all Properties classes.
 
     Args:
@@ -28,10 +53,33 @@ class _Properties(object):
         """Get the object hosting these properties."""
         return self._host
 
+    def __getattr__(self, name):
+        # extensions are imported the first time that one of their attributes is used
+        if not name.startswith('_') and load_extensions():
+            return getattr(self, name)
+        raise AttributeError('\'{}\' object has no attribute \'{}\''.format(
+            self.__class__.__name__, name))
+
     @property
     def _extension_attributes(self):
-        return (atr for atr in dir(self) if not atr.startswith('_')
+        """Get a tuple of the names of the extension attributes on these properties.
+
+        The names are computed once for each Properties class and are re-computed
+        after an extension sets a new attribute on any Properties class.
+        """
+        cls = self.__class__
+        try:
+            attrs = _EXTENSION_ATTRIBUTES[cls]
+        except KeyError:  # first time that the class has been used
+            load_extensions()
+            attrs = _EXTENSION_ATTRIBUTES[cls] = tuple(
+                atr for atr in dir(cls) if not atr.startswith('_')
                 and atr not in self._exclude)
+        for atr in self.__dict__:  # rare case of attributes set on the instance
+            if not atr.startswith('_') and atr not in attrs:
+                return tuple(atr for atr in dir(self) if not atr.startswith('_')
+                             and atr not in self._exclude)
+        return attrs
 
     def move(self, moving_vec):
         """Apply a move transform to extension attributes.
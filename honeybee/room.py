@@ -12,6 +12,7 @@ from ladybug_geometry.bounding import overlapping_bounding_boxes
 from ladybug_geometry_polyskel.polysplit import perimeter_core_subpolygons
 
 import honeybee.writer.room as writer
+from ._base import _track_geometry
 from ._basewithshade import _BaseWithShade
 from .typing import float_in_range, int_in_range, clean_string, invalid_dict_error
 from .properties import RoomProperties
@@ -22,12 +23,12 @@ from .boundarycondition import get_bc_from_position, Outdoors, Ground, Surface,
     boundary_conditions
 from .orientation import angles_from_num_orient, orient_index
 from .search import get_attr_nested
-try:
-    ad_bc = boundary_conditions.adiabatic
-except AttributeError:  # honeybee_energy is not loaded and adiabatic does not exist
-    ad_bc = None
+from .spatial import equivalent_point_pairs, overlapping_rectangle_pairs, \
+    overlapping_box_pairs
+from .parallel import worker_count, chunk_list, parallel_map
 
 
+@_track_geometry
 class Room(_BaseWithShade):
     """A volume enclosed by faces, representing a single room or space.
 
@@ -102,29 +103,10 @@ class Room(_BaseWithShade):
                 'Expected honeybee Face. Got {}'.format(type(face))
             face._parent = self
 
-        if tolerance == 0:
-            self._faces = faces
-            self._geometry = None  # calculated later from faces or added by classmethods
-        else:
-            # try to get a closed volume between the faces
-            room_polyface = Polyface3D.from_faces(
-                tuple(face.geometry for face in faces), tolerance)
-            if not room_polyface.is_solid:
-                room_polyface = room_polyface.merge_overlapping_edges(tolerance)
-            # replace honeybee face geometry with versions that are facing outwards
-            if room_polyface.is_solid:
-                for i, correct_face3d in enumerate(room_polyface.faces):
-                    face = faces[i]
-                    norm_init = face._geometry.normal
-                    face._geometry = correct_face3d
-                    if face.has_sub_faces:  # flip sub-faces to align with parent Face
-                        if norm_init.angle(face._geometry.normal) > (math.pi / 2):
-                            for ap in face._apertures:
-                                ap._geometry = ap._geometry.flip()
-                            for dr in face._doors:
-                                dr._geometry = dr._geometry.flip()
-            self._faces = faces
-            self._geometry = room_polyface
+        self._faces = faces
+        self._geometry = None  # calculated later from faces or added by classmethods
+        if tolerance != 0:
+            self._solve_geometry(tolerance)
 
         self._multiplier = 1  # default value that can be overridden later
         self._zone = None  # default value that can be overridden later
@@ -1398,6 +1380,7 @@ class Room(_BaseWithShade):
             for i in reversed(i_to_remove):
                 new_faces.pop(i)
             self._faces = tuple(new_faces)
+            self._structure_changed()
         else:
             try:
                 for face in self._faces:
@@ -1463,6 +1446,7 @@ class Room(_BaseWithShade):
         for i in reversed(i_to_remove):
             new_faces.pop(i)
         self._faces = tuple(new_faces)
+        self._structure_changed()
         if self._geometry is not None:
             self._geometry = Polyface3D.from_faces(
                 tuple(face.geometry for face in self._faces), tolerance)
@@ -1566,6 +1550,7 @@ class Room(_BaseWithShade):
                             dr._geometry = dr._geometry.flip()
         # reset the faces and geometry of the room with the new faces
         self._faces = tuple(all_faces)
+        self._structure_changed()
         self._geometry = room_polyface
         return new_faces
 
@@ -1925,6 +1910,7 @@ class Room(_BaseWithShade):
             room_polyface = room_polyface.merge_overlapping_edges(tolerance)
         # reset the faces and geometry of the room with the new faces
         self._faces = tuple(new_faces)
+        self._structure_changed()
         self._geometry = room_polyface
         return removed_faces
 
@@ -2066,6 +2052,7 @@ class Room(_BaseWithShade):
                             dr._geometry = dr._geometry.flip()
         # reset the faces and geometry of the room with the new faces
         self._faces = tuple(all_faces)
+        self._structure_changed()
         self._geometry = room_polyface
         return new_faces
 
@@ -2097,38 +2084,86 @@ class Room(_BaseWithShade):
             the new Faces here can be used in operations like setting new Surface
             boundary conditions.
         """
+        # intersect the geometry of all of this room's faces
+        ang_tol = math.radians(angle_tolerance)
+        geo_dict = Room._split_face_geometry(
+            [(f.identifier, f.geometry) for f in self.faces], self.geometry,
+            geometry, tolerance, ang_tol)
+        return self._replace_split_faces(geo_dict, tolerance, ang_tol)
+
+    @staticmethod
+    def _split_face_geometry(face_geos, room_geo, geometry, tolerance, ang_tol):
+        """Split the Face3D of a Room with coplanar geometry.
+
+        This only uses ladybug_geometry objects such that it can be run in
+        other processes.
+
+        Args:
+            face_geos: A list of tuples with the identifier and the Face3D of
+                each Face of the Room.
+            room_geo: The Polyface3D of the Room.
+            geometry: A list of coplanar geometry (either Polyface3D or Face3D)
+                that will be used to split the Faces of the Room.
+            tolerance: The minimum difference between the coordinate values of two
+                faces at which they can be considered adjacent.
+            ang_tol: The max angle in radians that the plane normals can differ
+                from one another in order for them to be considered coplanar.
+
+        Returns:
+            A dictionary with the Face identifiers as keys and a list of the
+            split Face3D for each Face as values.
+        """
         # make a dictionary of all face geometry to be intersected
-        geo_dict = {f.identifier: [f.geometry] for f in self.faces}
+        geo_dict = {f_id: [f_geo] for f_id, f_geo in face_geos}
 
         # loop through the polyface geometries and intersect this room's geometry
-        ang_tol = math.radians(angle_tolerance)
         for s_geo in geometry:
             if isinstance(s_geo, Polyface3D) and not \
-                    Polyface3D.overlapping_bounding_boxes(
-                        self.geometry, s_geo, tolerance):
+                    Polyface3D.overlapping_bounding_boxes(room_geo, s_geo, tolerance):
                 continue  # no overlap in bounding box; intersection impossible
             s_geos = s_geo.faces if isinstance(s_geo, Polyface3D) else [s_geo]
-            for face_1 in self.faces:
+            for face_id, face_geo in face_geos:
                 for face_2 in s_geos:
-                    if not face_1.geometry.plane.is_coplanar_tolerance(
+                    if not face_geo.plane.is_coplanar_tolerance(
                             face_2.plane, tolerance, ang_tol):
                         continue  # not coplanar; intersection impossible
-                    if face_1.geometry.is_centered_adjacent(face_2, tolerance):
-                        tol_area = math.sqrt(face_1.geometry.area) * tolerance
-                        if abs(face_1.geometry.area - face_2.area) < tol_area:
+                    if face_geo.is_centered_adjacent(face_2, tolerance):
+                        tol_area = math.sqrt(face_geo.area) * tolerance
+                        if abs(face_geo.area - face_2.area) < tol_area:
                             continue  # already intersected; no need to re-do
+                    # faces that do not overlap are not split but they are cleaned
+                    overlap = overlapping_bounding_boxes(face_geo, face_2, 2 * tolerance)
                     new_geo = []
-                    for f_geo in geo_dict[face_1.identifier]:
-                        f_split, _ = Face3D.coplanar_split(
-                            f_geo, face_2, tolerance, ang_tol)
+                    for f_geo in geo_dict[face_id]:
+                        if overlap:
+                            f_split, _ = Face3D.coplanar_split(
+                                f_geo, face_2, tolerance, ang_tol)
+                        else:
+                            f_split = (f_geo,)
                         for sp_g in f_split:
                             try:
                                 sp_g = sp_g.remove_colinear_vertices(tolerance)
                                 new_geo.append(sp_g)
                             except AssertionError:  # degenerate geometry to ignore
                                 pass
-                    geo_dict[face_1.identifier] = new_geo
+                    geo_dict[face_id] = new_geo
+        return geo_dict
+
+    def _replace_split_faces(self, geo_dict, tolerance, ang_tol):
+        """Replace the Faces of this Room with those split by _split_face_geometry.
+
+        Args:
+            geo_dict: A dictionary with the Face identifiers as keys and a list
+                of the split Face3D for each Face as values.
+            tolerance: The minimum difference between the coordinate values of two
+                faces at which they can be considered adjacent.
+            ang_tol: The max angle in radians that the plane normals can differ
+                from one another in order for them to be considered coplanar.
 
+        Returns:
+            A list containing only the new Faces that were created as part of the
+            splitting process.
+        """
         # use the intersected geometry to remake this room's faces
         all_faces, new_faces = [], []
         for face in self.faces:
@@ -2181,6 +2216,7 @@ class Room(_BaseWithShade):
                             dr._geometry = dr._geometry.flip()
         # reset the faces and geometry of the room with the new faces
         self._faces = tuple(all_faces)
+        self._structure_changed()
         self._geometry = room_polyface
         return new_faces
 
@@ -2259,7 +2295,7 @@ class Room(_BaseWithShade):
         return joined_rooms
 
     @staticmethod
-    def intersect_adjacency(rooms, tolerance=0.01, angle_tolerance=1):
+    def intersect_adjacency(rooms, tolerance=0.01, angle_tolerance=1, workers=None):
         """Intersect the Faces of an array of Rooms to ensure matching adjacencies.
 
         Note that this method may remove Apertures and Doors if they align with
@@ -2279,20 +2315,73 @@ class Room(_BaseWithShade):
             angle_tolerance: The max angle in degrees that the plane normals can
                 differ from one another in order for them to be considered
                 coplanar. (Default: 1 degree).
+            workers: An optional integer for the number of worker processes over
+                which the intersection of the Rooms will be run. Zero or a negative
+                number will use all available CPUs. None will intersect all Rooms
+                in the current process. (Default: None).
 
         Returns:
             An array of Rooms that have been intersected with one another.
         """
-        # get all of the room polyfaces
+        # get all of the room polyfaces and the other rooms that each could touch
         room_geos = [r.geometry for r in rooms]
+        candidates = Room._overlapping_rooms(room_geos, tolerance)
+
         # intersect all adjacencies between rooms
-        for i, room in enumerate(rooms):
-            other_rooms = room_geos[:i] + room_geos[i + 1:]
-            room.coplanar_split(other_rooms, tolerance, angle_tolerance)
-            room.remove_duplicate_faces(tolerance)
+        ang_tol = math.radians(angle_tolerance)
+        w_count = worker_count(workers)
+        if w_count > 1 and len(rooms) > 1:
+            # each Room is only split by the original geometry of the other Rooms
+            tasks = []
+            for room_ids in chunk_list(list(range(len(rooms))), w_count * 4):
+                room_inputs = [
+                    ([(f.identifier, f.geometry) for f in rooms[i].faces],
+                     room_geos[i], [room_geos[j] for j in candidates[i]])
+                    for i in room_ids]
+                tasks.append((room_ids, room_inputs, tolerance, ang_tol))
+            geo_dicts = [None] * len(rooms)
+            for task, results in zip(tasks, parallel_map(
+                    _split_rooms_face_geometry, tasks, workers)):
+                for i, geo_dict in zip(task[0], results):
+                    geo_dicts[i] = geo_dict
+            for room, geo_dict in zip(rooms, geo_dicts):
+                room._replace_split_faces(geo_dict, tolerance, ang_tol)
+                room.remove_duplicate_faces(tolerance)
+        else:
+            for room, room_cands in zip(rooms, candidates):
+                other_rooms = [room_geos[j] for j in room_cands]
+                room.coplanar_split(other_rooms, tolerance, angle_tolerance)
+                room.remove_duplicate_faces(tolerance)
+
+    @staticmethod
+    def _overlapping_rooms(room_geos, tolerance):
+        """Get a list with the indices of the other Rooms that each Room could touch.
+
+        Args:
+            room_geos: A list of the Polyface3D of each Room.
+            tolerance: The minimum difference between the coordinate values of two
+                faces at which they can be considered adjacent.
+
+        Returns:
+            A list with a sorted list of indices for each Room. The indices are
+            for the Rooms with bounding boxes that overlap the Room's bounding
+            box within the tolerance.
+        """
+        boxes = [(geo.min.x, geo.min.y, geo.min.z, geo.max.x, geo.max.y, geo.max.z)
+                 for geo in room_geos]
+        candidates = [[] for _ in room_geos]
+        # the doubled tolerance ensures that no pairs are missed from floating
+        # point error, which are then checked again with the exact test
+        for i, j in overlapping_box_pairs(boxes, 2 * tolerance):
+            candidates[i].append(j)
+            candidates[j].append(i)
+        for cands in candidates:
+            cands.sort()
+        return candidates
 
     @staticmethod
-    def solve_adjacency(rooms, tolerance=0.01, remove_mismatched_sub_faces=False):
+    def solve_adjacency(rooms, tolerance=0.01, remove_mismatched_sub_faces=False,
+                        spatial_hash=True):
         """Solve for adjacencies between a list of rooms.
 
         Note that this method will mutate the input rooms by setting Surface
@@ -2309,6 +2398,12 @@ class Room(_BaseWithShade):
                 in sub-faces between adjacent rooms should simply result in
                 the sub-faces being removed rather than raising an
                 exception. (Default: False).
+            spatial_hash: Boolean to note whether a hash grid of Face centers
+                should be used to find candidate adjacent Faces rather than
+                checking all Faces of all pairs of Rooms with overlapping bounding
+                boxes. The result is the same in both cases but the hash grid
+                scales linearly with the number of Faces, making it much
+                faster for models with many Rooms. (Default: True).
 
         Returns:
             A dictionary of information about the objects that had their adjacency set.
@@ -2331,38 +2426,31 @@ class Room(_BaseWithShade):
                     'adjacent_doors': []}
 
         # solve all adjacencies between rooms
-        for i, room_1 in enumerate(rooms):
-            try:
-                for room_2 in rooms[i + 1:]:
-                    if not Polyface3D.overlapping_bounding_boxes(
-                            room_1.geometry, room_2.geometry, tolerance):
-                        continue  # no overlap in bounding box; adjacency impossible
-                    for face_1 in room_1._faces:
-                        for face_2 in room_2._faces:
-                            if not isinstance(face_2.boundary_condition, Surface):
-                                if face_1.geometry.is_centered_adjacent(
-                                        face_2.geometry, tolerance):
-                                    if not remove_mismatched_sub_faces:
-                                        face_info = face_1.set_adjacency(face_2)
-                                    else:
-                                        try:
-                                            face_info = face_1.set_adjacency(face_2)
-                                        except AssertionError:
-                                            face_1[0].remove_sub_faces()
-                                            face_2.remove_sub_faces()
-                                            face_info = face_1.set_adjacency(face_2)
-                                    adj_info['adjacent_faces'].append((face_1, face_2))
-                                    adj_info['adjacent_apertures'].extend(
-                                        face_info['adjacent_apertures'])
-                                    adj_info['adjacent_doors'].extend(
-                                        face_info['adjacent_doors'])
-                                    break
-            except IndexError:
-                pass  # we have reached the end of the list of rooms
+        matched = None
+        for pair_key, face_1, face_2 in \
+                Room._adjacent_face_candidates(rooms, tolerance, spatial_hash):
+            if pair_key == matched:
+                continue  # face_1 was already matched to a face in this room
+            if not isinstance(face_2.boundary_condition, Surface):
+                if face_1.geometry.is_centered_adjacent(face_2.geometry, tolerance):
+                    if not remove_mismatched_sub_faces:
+                        face_info = face_1.set_adjacency(face_2)
+                    else:
+                        try:
+                            face_info = face_1.set_adjacency(face_2)
+                        except AssertionError:
+                            face_1.remove_sub_faces()
+                            face_2.remove_sub_faces()
+                            face_info = face_1.set_adjacency(face_2)
+                    adj_info['adjacent_faces'].append((face_1, face_2))
+                    adj_info['adjacent_apertures'].extend(
+                        face_info['adjacent_apertures'])
+                    adj_info['adjacent_doors'].extend(face_info['adjacent_doors'])
+                    matched = pair_key
         return adj_info
 
     @staticmethod
-    def find_adjacency(rooms, tolerance=0.01):
+    def find_adjacency(rooms, tolerance=0.01, spatial_hash=True):
         """Get a list with all adjacent pairs of Faces between input rooms.
 
         Note that this method does not change any boundary conditions of the input
@@ -2374,26 +2462,24 @@ class Room(_BaseWithShade):
             tolerance: The minimum difference between the coordinate values of two
                 faces at which they can be considered centered adjacent. Default: 0.01,
                 suitable for objects in meters.
+            spatial_hash: Boolean to note whether a hash grid of Face centers
+                should be used to find candidate adjacent Faces rather than
+                checking all Faces of all pairs of Rooms with overlapping bounding
+                boxes. The result is the same in both cases. (Default: True).
 
         Returns:
             A list of tuples with each tuple containing 2 objects for Faces that
             are adjacent to one another.
         """
         adj_faces = []  # lists of adjacencies to track
-        for i, room_1 in enumerate(rooms):
-            try:
-                for room_2 in rooms[i + 1:]:
-                    if not Polyface3D.overlapping_bounding_boxes(
-                            room_1.geometry, room_2.geometry, tolerance):
-                        continue  # no overlap in bounding box; adjacency impossible
-                    for face_1 in room_1._faces:
-                        for face_2 in room_2._faces:
-                            if face_1.geometry.is_centered_adjacent(
-                                    face_2.geometry, tolerance):
-                                adj_faces.append((face_1, face_2))
-                                break
-            except IndexError:
-                pass  # we have reached the end of the list of zones
+        matched = None
+        for pair_key, face_1, face_2 in \
+                Room._adjacent_face_candidates(rooms, tolerance, spatial_hash):
+            if pair_key == matched:
+                continue  # face_1 was already matched to a face in this room
+            if face_1.geometry.is_centered_adjacent(face_2.geometry, tolerance):
+                adj_faces.append((face_1, face_2))
+                matched = pair_key
         return adj_faces
 
     @staticmethod
@@ -2729,8 +2815,8 @@ class Room(_BaseWithShade):
             A string with the message or a list with a dictionary if detailed is True.
         """
         # create Polygon2Ds from the floors of the rooms
-        b_polys, h_polys = [], []
-        for room in rooms:
+        b_polys, h_polys, rects, rect_ids = [], [], [], []
+        for i, room in enumerate(rooms):
             rb_polys, rh_polys = [], []
             for flr in room.floors:
                 flr_geo = flr.geometry
@@ -2745,6 +2831,20 @@ class Room(_BaseWithShade):
                         rh_polys.append(None)
             b_polys.append(rb_polys)
             h_polys.append(rh_polys)
+            if len(rb_polys) != 0:
+                rect_ids.append(i)
+                rects.append((
+                    min(ply.min.x for ply, _ in rb_polys),
+                    min(ply.min.y for ply, _ in rb_polys),
+                    max(ply.max.x for ply, _ in rb_polys),
+                    max(ply.max.y for ply, _ in rb_polys)))
+
+        # find the pairs of rooms with overlapping floor bounding rectangles
+        # the doubled tolerance ensures that no pairs with overlapping polygons
+        # are missed from floating point error in the bounding rectangle check
+        candidates = [[] for _ in rooms]
+        for i, j in overlapping_rectangle_pairs(rects, 2 * tolerance):
+            candidates[rect_ids[i]].append(rect_ids[j])
 
         # find the number of overlaps across the Rooms
         msgs = []
@@ -2753,7 +2853,7 @@ class Room(_BaseWithShade):
             if len(polys_1) == 0:
                 continue
             try:
-                zip_obj = zip(rooms[i + 1:], b_polys[i + 1:], h_polys[i + 1:])
+                zip_obj = ((rooms[c], b_polys[c], h_polys[c]) for c in candidates[i])
                 for room_2, polys_2, hp2 in zip_obj:
                     collision_found = False
                     for j, (ply_1, z1) in enumerate(polys_1):
@@ -3110,7 +3210,8 @@ class Room(_BaseWithShade):
         # assign readable names for the display_name (without the UUID)
         for room in rooms:
             room.display_name = room.identifier[:-9]
-        # assign adiabatic boundary conditions if requested
+        # assign adiabatic boundary conditions if requested (and honeybee_energy exists)
+        ad_bc = getattr(boundary_conditions, 'adiabatic', None)
         if not outdoor_roof and ad_bc:
             for room in rooms[-len(first_floor):]:
                 room[-1].boundary_condition = ad_bc  # make the roof adiabatic
@@ -3219,6 +3320,8 @@ class Room(_BaseWithShade):
         ext_room = Room.from_polyface3d(
             self.identifier, ext_p_face, ground_depth=float('-inf'))
 
+        # adiabatic is None if honeybee_energy is not installed
+        ad_bc = getattr(boundary_conditions, 'adiabatic', None)
         # assign BCs and replace any Surface conditions to be set on the story level
         for i, bc in enumerate(wall_bcs):
             if not isinstance(bc, Surface):
@@ -3338,6 +3441,33 @@ class Room(_BaseWithShade):
             base['user_data'] = self.user_data
         return base
 
+    def _solve_geometry(self, tolerance):
+        """Set the Room Polyface3D using a tolerance and orient Faces outward if solid.
+
+        Args:
+            tolerance: The maximum difference between x, y, and z values
+                at which vertices of adjacent faces are considered equivalent.
+        """
+        faces = self._faces
+        # try to get a closed volume between the faces
+        room_polyface = Polyface3D.from_faces(
+            tuple(face.geometry for face in faces), tolerance)
+        if not room_polyface.is_solid:
+            room_polyface = room_polyface.merge_overlapping_edges(tolerance)
+        # replace honeybee face geometry with versions that are facing outwards
+        if room_polyface.is_solid:
+            for i, correct_face3d in enumerate(room_polyface.faces):
+                face = faces[i]
+                norm_init = face._geometry.normal
+                face._geometry = correct_face3d
+                if face.has_sub_faces:  # flip sub-faces to align with parent Face
+                    if norm_init.angle(face._geometry.normal) > (math.pi / 2):
+                        for ap in face._apertures:
+                            ap._geometry = ap._geometry.flip()
+                        for dr in face._doors:
+                            dr._geometry = dr._geometry.flip()
+        self._geometry = room_polyface
+
     def _base_horiz_boundary(self, tolerance=0.01):
         """Get a starting horizontal boundary for the Room.
 
@@ -3446,10 +3576,62 @@ class Room(_BaseWithShade):
             wall_faces.append(Face3D(pts_3d[0], holes=pts_3d[1:]))
         return wall_faces
 
+    @staticmethod
+    def _adjacent_face_candidates(rooms, tolerance, spatial_hash=True):
+        """Yield candidate pairs of Faces between Rooms that may be centered adjacent.
+
+        Candidates are yielded in the order of a loop over all pairs of rooms
+        followed by a loop over all pairs of Faces between the two rooms. Each
+        candidate is a tuple with three items. The first is a key for the
+        (room_1, room_2, face_1) combination, which can be used to skip the
+        remaining candidates of face_1 in room_2 once a match has been found.
+        The second and third are the two Faces.
+
+        Args:
+            rooms: A list of rooms for which candidate Face pairs will be yielded.
+            tolerance: The minimum difference between the coordinate values of two
+                faces at which they can be considered centered adjacent.
+            spatial_hash: Boolean to note whether a hash grid of Face centers
+                should be used to find the candidates. If False, all Faces
+                of all pairs of rooms with overlapping bounding boxes will
+                be yielded. (Default: True).
+        """
+        if spatial_hash:
+            # centered adjacent faces must have equivalent centers
+            face_ids, centers = [], []
+            for i, room in enumerate(rooms):
+                for j, face in enumerate(room._faces):
+                    face_ids.append((i, j))
+                    centers.append(face.geometry.center)
+            candidates = []
+            for a, b in equivalent_point_pairs(centers, tolerance):
+                (r_1, f_1), (r_2, f_2) = face_ids[a], face_ids[b]
+                if r_1 != r_2:  # faces of the same room cannot be adjacent
+                    candidates.append((r_1, r_2, f_1, f_2))
+            candidates.sort()
+            for r_1, r_2, f_1, f_2 in candidates:
+                yield (r_1, r_2, f_1), rooms[r_1]._faces[f_1], rooms[r_2]._faces[f_2]
+        else:
+            for i, room_1 in enumerate(rooms):
+                for j in range(i + 1, len(rooms)):
+                    room_2 = rooms[j]
+                    if not Polyface3D.overlapping_bounding_boxes(
+                            room_1.geometry, room_2.geometry, tolerance):
+                        continue  # no overlap in bounding box; adjacency impossible
+                    for k, face_1 in enumerate(room_1._faces):
+                        for face_2 in room_2._faces:
+                            yield (i, j, k), face_1, face_2
+
     @staticmethod
     def _adjacency_grouping(rooms, adj_finding_function):
         """Group Rooms together according to an adjacency finding function.
 
+        The groups are found with a disjoint-set of the room identifiers such that
+        the time to group the rooms is linear in the number of faces. The groups
+        are in the order of their first room in the input rooms and the rooms of
+        each group are in the order that they are reached by following the
+        adjacencies out from this first room.
+
         Args:
             rooms: A list of rooms to be grouped by their adjacency.
             adj_finding_function: A function that denotes which rooms are adjacent
@@ -3458,48 +3640,53 @@ class Room(_BaseWithShade):
         Returns:
             A list of list with each sub-list containing rooms that share adjacencies.
         """
-        # create a room lookup table and duplicate the list of rooms
+        # get the adjacent rooms of each room with a single pass over their faces
         room_lookup = {rm.identifier: rm for rm in rooms}
-        all_rooms = list(rooms)
+        adj_dict = {}
+        for room in rooms:
+            adj_dict[room.identifier] = [rm_id for rm_id in adj_finding_function(room)
+                                         if rm_id in room_lookup]
+
+        # join the adjacent rooms into sets
+        parents = {rm_id: rm_id for rm_id in room_lookup}
+
+        def find_root(rm_id):
+            while parents[rm_id] != rm_id:
+                parents[rm_id] = parents[parents[rm_id]]  # halve the path
+                rm_id = parents[rm_id]
+            return rm_id
+
+        for rm_id, adj_ids in adj_dict.items():
+            if len(adj_ids) != 0:
+                root_1 = find_root(rm_id)
+                for adj_id in adj_ids:
+                    root_2 = find_root(adj_id)
+                    if root_1 != root_2:
+                        parents[root_2] = root_1
+        roots = [find_root(room.identifier) for room in rooms]
+        members = {}
+        for room, root in zip(rooms, roots):
+            members.setdefault(root, []).append(room)
+
+        # order the rooms of each set by following the adjacencies from the first room
         adj_network = []
-
-        # loop through the rooms and find air boundary adjacencies
-        for room in all_rooms:
-            adj_ids = adj_finding_function(room)
-            if len(adj_ids) == 0:  # a room with no adjacencies
-                adj_network.append([room])
-            else:  # there are other adjacent rooms to find
-                local_network = [room]
-                local_ids, first_id = set(adj_ids), room.identifier
-                while len(adj_ids) != 0:
-                    # add the current rooms to the local network
-                    adj_objs = []
-                    for rm_id in adj_ids:
-                        try:
-                            adj_objs.append(room_lookup[rm_id])
-                        except KeyError:  # missing adjacency among the room groups
-                            pass
-                    local_network.extend(adj_objs)
-                    adj_ids = []  # reset the list of new adjacencies
-                    # find any rooms that are adjacent to the adjacent rooms
-                    for obj in adj_objs:
-                        all_new_ids = adj_finding_function(obj)
-                        new_ids = [rid for rid in all_new_ids
-                                   if rid not in local_ids and rid != first_id]
-                        for rm_id in new_ids:
-                            local_ids.add(rm_id)
-                        adj_ids.extend(new_ids)
-                # after the local network is understood, clean up duplicated rooms
-                clean_local_network, exist_ids = [], set()
-                for room in local_network:
-                    if room.identifier not in exist_ids:
-                        clean_local_network.append(room)
-                        exist_ids.add(room.identifier)
-                adj_network.append(clean_local_network)
-                i_to_remove = [i for i, room_obj in enumerate(all_rooms)
-                               if room_obj.identifier in local_ids]
-                for i in reversed(i_to_remove):
-                    all_rooms.pop(i)
+        for room, root in zip(rooms, roots):
+            group = members.pop(root, None)
+            if group is None:  # room is in a group that has already been added
+                continue
+            if len(group) == 1:  # a room with no adjacencies
+                adj_network.append(group)
+                continue
+            ordered, found, i = [room], set([room.identifier]), 0
+            while i < len(ordered):
+                for rm_id in adj_dict[ordered[i].identifier]:
+                    if rm_id not in found:
+                        found.add(rm_id)
+                        ordered.append(room_lookup[rm_id])
+                i += 1
+            if len(ordered) != len(group):  # adjacencies that only go one way
+                ordered.extend(rm for rm in group if rm.identifier not in found)
+            adj_network.append(ordered)
         return adj_network
 
     @staticmethod
@@ -3545,3 +3732,25 @@ class Room(_BaseWithShade):
 
     def __repr__(self):
         return 'Room: %s' % self.display_name
+
+
+def _split_rooms_face_geometry(inputs):
+    """Split the Face3D of several Rooms with the geometry of other Rooms.
+
+    This function is at the module level so that it can be used by process pools.
+
+    Args:
+        inputs: A tuple with four items. The first is a list of Room indices,
+            which is not used here. The second is a list with a tuple for each
+            Room that contains the identifiers and Face3D of the Room Faces, the
+            Room Polyface3D and a list of the Polyface3D to split it with. The
+            third and fourth are the tolerance and the angle tolerance in radians.
+
+    Returns:
+        A list with a dictionary of the split Face3D for each Room, which can be
+        used with the Room._replace_split_faces method.
+    """
+    _, room_inputs, tolerance, ang_tol = inputs
+    return [Room._split_face_geometry(face_geos, room_geo, other_geos, tolerance,
+                                      ang_tol)
+            for face_geos, room_geo, other_geos in room_inputs]
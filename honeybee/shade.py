@@ -8,13 +8,14 @@ from ladybug_geometry.geometry3d.pointvector import Point3D
 from ladybug_geometry.geometry3d.face import Face3D
 from ladybug.color import Color
 
-from ._base import _Base
+from ._base import _Base, _track_geometry
 from .typing import clean_string
 from .search import get_attr_nested
 from .properties import ShadeProperties
 import honeybee.writer.shade as writer
 
 
+@_track_geometry
 class Shade(_Base):
     """A single planar shade.
 
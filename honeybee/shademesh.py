@@ -6,12 +6,13 @@ import math
 from ladybug_geometry.geometry3d import Mesh3D, Face3D
 from ladybug.color import Color
 
-from ._base import _Base
+from ._base import _Base, _track_geometry
 from .typing import clean_string
 from .properties import ShadeMeshProperties
 import honeybee.writer.shademesh as writer
 
 
+@_track_geometry
 class ShadeMesh(_Base):
     """A single planar shade.
 
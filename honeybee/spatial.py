@@ -0,0 +1,545 @@
+# coding=utf-8
+"""Utilities for accelerating spatial queries between honeybee geometry objects.
+
+The methods here bucket geometry into a uniform hash grid so that only objects
+in neighboring cells need to be compared with one another. This turns
+all-to-all searches that would otherwise scale with the square of the number
+of objects into searches that scale roughly linearly. The BoundingBoxTree
+serves repeated queries against the same set of objects (eg. all of the
+objects near a given point or segment) and the PlaneHashGrid finds the planes
+that may be coplanar with a given plane.
+"""
+from __future__ import division
+
+import math
+
+from ladybug_geometry.geometry3d import Point3D
+
+
+def grid_cell_size(tolerance):
+    """Get a hash grid cell size that is safe to use with a given tolerance.
+
+    The cell size is twice the tolerance such that any two points within the
+    tolerance of one another are guaranteed to fall in the same cell or in
+    directly neighboring cells (even after floating point error).
+
+    Args:
+        tolerance: The maximum difference between coordinate values of two
+            points at which they can be considered equivalent.
+    """
+    return 2 * tolerance if tolerance > 0 else 1e-9
+
+
+def grid_key(point, cell_size):
+    """Get a tuple of integers for the hash grid cell that contains a point.
+
+    Args:
+        point: A Point3D (or any object with x, y, z attributes).
+        cell_size: A number for the size of the cells in the hash grid.
+    """
+    return (int(math.floor(point.x / cell_size)),
+            int(math.floor(point.y / cell_size)),
+            int(math.floor(point.z / cell_size)))
+
+
+def neighbor_keys(key):
+    """Get a list of the 27 hash grid keys surrounding (and including) a key.
+
+    Args:
+        key: A tuple of three integers for a hash grid cell.
+    """
+    x, y, z = key
+    return [(x + i, y + j, z + k)
+            for i in (-1, 0, 1) for j in (-1, 0, 1) for k in (-1, 0, 1)]
+
+
+def point_hash_grid(points, cell_size):
+    """Get a dictionary that buckets the indices of points by their hash grid cell.
+
+    Args:
+        points: A list of Point3D to be bucketed.
+        cell_size: A number for the size of the cells in the hash grid.
+
+    Returns:
+        A dictionary with grid_key tuples as keys and lists of indices into
+        the input points as values.
+    """
+    grid = {}
+    for i, pt in enumerate(points):
+        key = grid_key(pt, cell_size)
+        try:
+            grid[key].append(i)
+        except KeyError:  # first point in this cell
+            grid[key] = [i]
+    return grid
+
+
+def equivalent_point_pairs(points, tolerance):
+    """Get all pairs of points that are equivalent to one another within a tolerance.
+
+    This gives the same result as testing every pair of points with the
+    Point3D.is_equivalent method but it only compares points that share the
+    same hash grid cell or a neighboring cell.
+
+    Args:
+        points: A list of Point3D to be compared to one another.
+        tolerance: The maximum difference between x, y, and z values at which
+            points are considered equivalent.
+
+    Returns:
+        A sorted list of tuples with two integers (i, j) where i < j for
+        the indices of points that are equivalent to one another.
+    """
+    cell_size = grid_cell_size(tolerance)
+    grid = point_hash_grid(points, cell_size)
+    pairs = []
+    for key, pt_ids in grid.items():
+        near_ids = []
+        for n_key in neighbor_keys(key):
+            try:
+                near_ids.extend(grid[n_key])
+            except KeyError:  # no points in the neighboring cell
+                pass
+        for i in pt_ids:
+            pt = points[i]
+            for j in near_ids:
+                if j > i and pt.is_equivalent(points[j], tolerance):
+                    pairs.append((i, j))
+    pairs.sort()
+    return pairs
+
+
+def overlapping_rectangle_pairs(rectangles, tolerance):
+    """Get all pairs of axis-aligned rectangles that overlap within a tolerance.
+
+    This uses a sweep-and-prune over the X axis such that rectangles are only
+    compared to others that overlap them in X. The pairs returned are a
+    superset of those for which the Polygon2D.overlapping_bounding_rect method
+    returns True for polygons with these bounding rectangles.
+
+    Args:
+        rectangles: A list of tuples with four numbers for the minimum X,
+            minimum Y, maximum X and maximum Y of each rectangle.
+        tolerance: The maximum gap between rectangles at which they are
+            considered to overlap.
+
+    Returns:
+        A sorted list of tuples with two integers (i, j) where i < j for
+        the indices of rectangles that overlap one another.
+    """
+    order = sorted(range(len(rectangles)), key=lambda i: rectangles[i][0])
+    pairs, active = [], []
+    for i in order:
+        min_x, min_y, max_x, max_y = rectangles[i]
+        # remove rectangles that end before this one (and all later ones) start
+        active = [j for j in active if rectangles[j][2] + tolerance >= min_x]
+        for j in active:
+            if rectangles[j][1] - tolerance <= max_y and \
+                    rectangles[j][3] + tolerance >= min_y:
+                pairs.append((i, j) if i < j else (j, i))
+        active.append(i)
+    pairs.sort()
+    return pairs
+
+
+def overlapping_box_pairs(boxes, tolerance):
+    """Get all pairs of axis-aligned bounding boxes that overlap within a tolerance.
+
+    This uses a sweep-and-prune over the X axis such that boxes are only
+    compared to others that overlap them in X. The pairs returned are a
+    superset of those for which the Polyface3D.overlapping_bounding_boxes
+    method returns True for geometry with these bounding boxes.
+
+    Args:
+        boxes: A list of tuples with six numbers for the minimum X, minimum Y,
+            minimum Z, maximum X, maximum Y and maximum Z of each box.
+        tolerance: The maximum gap between boxes at which they are
+            considered to overlap.
+
+    Returns:
+        A sorted list of tuples with two integers (i, j) where i < j for
+        the indices of boxes that overlap one another.
+    """
+    order = sorted(range(len(boxes)), key=lambda i: boxes[i][0])
+    pairs, active = [], []
+    for i in order:
+        min_x, min_y, min_z, max_x, max_y, max_z = boxes[i]
+        # remove boxes that end before this one (and all later ones) start
+        active = [j for j in active if boxes[j][3] + tolerance >= min_x]
+        for j in active:
+            box = boxes[j]
+            if box[1] - tolerance <= max_y and box[4] + tolerance >= min_y and \
+                    box[2] - tolerance <= max_z and box[5] + tolerance >= min_z:
+                pairs.append((i, j) if i < j else (j, i))
+        active.append(i)
+    pairs.sort()
+    return pairs
+
+
+def geometry_box(geometry):
+    """Get a tuple of six numbers for the axis-aligned bounding box of geometry.
+
+    Args:
+        geometry: A ladybug_geometry object with min and max properties
+            (eg. Face3D, Polyface3D, Mesh3D, LineSegment3D, Polyline3D).
+
+    Returns:
+        A tuple with the minimum X, minimum Y, minimum Z, maximum X, maximum Y
+        and maximum Z of the geometry.
+    """
+    g_min, g_max = geometry.min, geometry.max
+    return (g_min.x, g_min.y, g_min.z, g_max.x, g_max.y, g_max.z)
+
+
+class BoundingBoxTree(object):
+    """A bounding volume hierarchy over a list of axis-aligned bounding boxes.
+
+    The tree is built once by splitting the boxes at the median of their
+    centers along the longest axis until each leaf holds only a few boxes.
+    Queries then only test the boxes in the branches of the tree that could
+    contain a result, which takes logarithmic rather than linear time for
+    a typical query.
+
+    Args:
+        boxes: A list of tuples with six numbers for the minimum X, minimum Y,
+            minimum Z, maximum X, maximum Y and maximum Z of each box. The
+            geometry_box function can be used to get these from geometry.
+        objects: An optional list of objects with one object for each box,
+            which will be returned from the queries instead of the indices
+            of the boxes. (Default: None).
+        leaf_size: An integer for the maximum number of boxes in each leaf
+            of the tree. (Default: 8).
+
+    Properties:
+        * boxes
+        * objects
+    """
+    __slots__ = ('_boxes', '_objects', '_order', '_nodes')
+
+    def __init__(self, boxes, objects=None, leaf_size=8):
+        self._boxes = tuple(boxes)
+        if objects is not None:
+            objects = tuple(objects)
+            assert len(objects) == len(self._boxes), 'Number of BoundingBoxTree ' \
+                'objects ({}) does not match the number of boxes ({}).'.format(
+                    len(objects), len(self._boxes))
+        self._objects = objects
+        self._order = list(range(len(self._boxes)))
+        # each node is a list with the bounding box of the node, the index of the
+        # first child node (or None for leaves) and the start and end of its slice
+        # of the order list; the second child always follows the first one
+        self._nodes = []
+        if len(self._boxes) != 0:
+            self._build(max(int(leaf_size), 1))
+
+    @property
+    def boxes(self):
+        """Get a tuple of the bounding boxes in the tree."""
+        return self._boxes
+
+    @property
+    def objects(self):
+        """Get a tuple of the objects associated with the boxes (or None)."""
+        return self._objects
+
+    def query_box(self, box, tolerance=0):
+        """Get the boxes in the tree that overlap a given box within a tolerance.
+
+        Args:
+            box: A tuple with six numbers for the minimum X, minimum Y, minimum Z,
+                maximum X, maximum Y and maximum Z of the box to be queried.
+            tolerance: The maximum gap between boxes at which they are
+                considered to overlap. (Default: 0).
+
+        Returns:
+            A list of the indices of the overlapping boxes in ascending order (or
+            the objects of the boxes if objects were specified for the tree).
+        """
+        q_box = (box[0] - tolerance, box[1] - tolerance, box[2] - tolerance,
+                 box[3] + tolerance, box[4] + tolerance, box[5] + tolerance)
+        return self._query(lambda b: _boxes_overlap(b, q_box))
+
+    def query_point(self, point, distance):
+        """Get the boxes in the tree that are within a distance of a point.
+
+        Args:
+            point: A Point3D to be queried.
+            distance: The maximum distance between the point and the boxes.
+
+        Returns:
+            A list of the indices of the boxes in ascending order (or the objects
+            of the boxes if objects were specified for the tree).
+        """
+        pt, sq_dist = (point.x, point.y, point.z), distance ** 2
+        return self._query(lambda b: _box_point_sq_distance(b, pt) <= sq_dist)
+
+    def query_segment(self, segment, distance):
+        """Get the boxes in the tree that are within a distance of a line segment.
+
+        The boxes are tested against the segment after they have been expanded
+        by the distance such that the result may include some boxes where the
+        corners of the box are slightly farther than the distance from the segment.
+
+        Args:
+            segment: A LineSegment3D to be queried.
+            distance: The maximum distance between the segment and the boxes.
+
+        Returns:
+            A list of the indices of the boxes in ascending order (or the objects
+            of the boxes if objects were specified for the tree).
+        """
+        p1, p2 = segment.p1, segment.p2
+        start, end = (p1.x, p1.y, p1.z), (p2.x, p2.y, p2.z)
+        return self._query(lambda b: _segment_hits_box(start, end, b, distance))
+
+    def overlapping_pairs(self, tolerance=0):
+        """Get all pairs of boxes in the tree that overlap within a tolerance.
+
+        Args:
+            tolerance: The maximum gap between boxes at which they are
+                considered to overlap. (Default: 0).
+
+        Returns:
+            A sorted list of tuples with two integers (i, j) where i < j for
+            the indices of boxes that overlap one another.
+        """
+        pairs, boxes = [], self._boxes
+        for i, box in enumerate(boxes):
+            q_box = (box[0] - tolerance, box[1] - tolerance, box[2] - tolerance,
+                     box[3] + tolerance, box[4] + tolerance, box[5] + tolerance)
+            for j in self._query_indices(lambda b: _boxes_overlap(b, q_box)):
+                if j > i:
+                    pairs.append((i, j))
+        return pairs
+
+    def _build(self, leaf_size):
+        """Build the nodes of the tree from the boxes."""
+        boxes, order = self._boxes, self._order
+        centers = [((b[0] + b[3]) / 2, (b[1] + b[4]) / 2, (b[2] + b[5]) / 2)
+                   for b in boxes]
+        nodes = self._nodes
+        nodes.append([None, None, 0, len(order)])
+        to_build = [0]
+        while to_build:
+            node = nodes[to_build.pop()]
+            start, end = node[2], node[3]
+            node_ids = order[start:end]
+            node[0] = _union_box([boxes[i] for i in node_ids])
+            if end - start <= leaf_size:
+                continue  # leaf node
+            # split the boxes at the median center along the longest axis
+            c_min = [min(centers[i][d] for i in node_ids) for d in range(3)]
+            c_max = [max(centers[i][d] for i in node_ids) for d in range(3)]
+            axis = max(range(3), key=lambda d: c_max[d] - c_min[d])
+            if c_max[axis] - c_min[axis] == 0:
+                continue  # all boxes share a center; keep them in one leaf
+            node_ids.sort(key=lambda i: centers[i][axis])
+            order[start:end] = node_ids
+            mid = (start + end) // 2
+            node[1] = len(nodes)
+            nodes.append([None, None, start, mid])
+            nodes.append([None, None, mid, end])
+            to_build.extend((node[1], node[1] + 1))
+
+    def _query_indices(self, box_test):
+        """Get a sorted list of box indices that pass a test of their box."""
+        if len(self._nodes) == 0:
+            return []
+        boxes, order, nodes = self._boxes, self._order, self._nodes
+        result, to_check = [], [0]
+        while to_check:
+            box, child, start, end = nodes[to_check.pop()]
+            if not box_test(box):
+                continue
+            if child is None:  # leaf node; test all of the boxes
+                result.extend(i for i in order[start:end] if box_test(boxes[i]))
+            else:
+                to_check.extend((child, child + 1))
+        result.sort()
+        return result
+
+    def _query(self, box_test):
+        """Get the boxes that pass a test as indices or objects."""
+        result = self._query_indices(box_test)
+        if self._objects is not None:
+            return [self._objects[i] for i in result]
+        return result
+
+    def __len__(self):
+        return len(self._boxes)
+
+    def __repr__(self):
+        return 'BoundingBoxTree: [{} boxes]'.format(len(self._boxes))
+
+
+def _union_box(boxes):
+    """Get the box that contains a list of boxes."""
+    return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+            min(b[2] for b in boxes), max(b[3] for b in boxes),
+            max(b[4] for b in boxes), max(b[5] for b in boxes))
+
+
+def _boxes_overlap(box_1, box_2):
+    """Check whether two boxes overlap one another."""
+    return box_1[0] <= box_2[3] and box_2[0] <= box_1[3] and \
+        box_1[1] <= box_2[4] and box_2[1] <= box_1[4] and \
+        box_1[2] <= box_2[5] and box_2[2] <= box_1[5]
+
+
+def _box_point_sq_distance(box, point):
+    """Get the squared distance between a box and a point (zero if inside)."""
+    sq_dist = 0
+    for d in range(3):
+        if point[d] < box[d]:
+            sq_dist += (box[d] - point[d]) ** 2
+        elif point[d] > box[d + 3]:
+            sq_dist += (point[d] - box[d + 3]) ** 2
+    return sq_dist
+
+
+def _segment_hits_box(start, end, box, distance):
+    """Check whether a segment intersects a box that is expanded by a distance."""
+    t_min, t_max = 0.0, 1.0
+    for d in range(3):
+        b_min, b_max = box[d] - distance, box[d + 3] + distance
+        delta = end[d] - start[d]
+        if delta == 0:  # segment is parallel to this pair of box sides
+            if start[d] < b_min or start[d] > b_max:
+                return False
+            continue
+        t_1, t_2 = (b_min - start[d]) / delta, (b_max - start[d]) / delta
+        if t_1 > t_2:
+            t_1, t_2 = t_2, t_1
+        t_min, t_max = max(t_min, t_1), min(t_max, t_2)
+        if t_min > t_max:
+            return False
+    return True
+
+
+class PlaneHashGrid(object):
+    """A hash grid of planes for finding the planes that may be coplanar with another.
+
+    Each plane is bucketed by its normal vector and by its signed distance from
+    a reference point along the normal. The sizes of the grid cells are set
+    such that any planes that pass a coplanarity test with the input tolerances
+    are guaranteed to lie in the same cell or in directly neighboring cells.
+    Planes are stored with both orientations of their normal since the
+    coplanarity tests accept planes that face opposite directions.
+
+    Args:
+        tolerance: The maximum distance between a point of one plane and
+            another plane at which the planes can be considered coplanar.
+        angle_tolerance: The maximum angle in radians between the normals
+            of two planes at which they can be considered coplanar.
+        origin: A Point3D to be used as the reference point for the distances
+            of the planes. This should be near the points of the planes that
+            will be added to the grid (eg. the center of their bounding box).
+        max_distance: The maximum distance between the origin and the points
+            of the planes that will be added to the grid.
+
+    Properties:
+        * normal_cell_size
+        * distance_cell_size
+    """
+    __slots__ = ('_normal_cell_size', '_distance_cell_size', '_origin', '_grid')
+
+    def __init__(self, tolerance, angle_tolerance, origin, max_distance):
+        # chord length between unit normals is never longer than the angle (with
+        # a small allowance for floating point error in the angle calculation)
+        self._normal_cell_size = min(angle_tolerance, math.pi) + 1e-6
+        # the distance from the origin can differ by the tolerance plus the
+        # difference in normal direction multiplied by the distance to the point
+        self._distance_cell_size = \
+            tolerance + self._normal_cell_size * max_distance + 1e-9
+        self._origin = (origin.x, origin.y, origin.z)
+        self._grid = {}
+
+    @classmethod
+    def from_points(cls, points, tolerance, angle_tolerance):
+        """Create a PlaneHashGrid sized for planes through a list of points.
+
+        Args:
+            points: A list of Point3D for all of the points of the planes that
+                will be added to the grid.
+            tolerance: The maximum distance between a point of one plane and
+                another plane at which the planes can be considered coplanar.
+            angle_tolerance: The maximum angle in radians between the normals
+                of two planes at which they can be considered coplanar.
+        """
+        if len(points) == 0:
+            return cls(tolerance, angle_tolerance, Point3D(0, 0, 0), 0)
+        min_pt = Point3D(min(pt.x for pt in points), min(pt.y for pt in points),
+                         min(pt.z for pt in points))
+        max_pt = Point3D(max(pt.x for pt in points), max(pt.y for pt in points),
+                         max(pt.z for pt in points))
+        center = Point3D((min_pt.x + max_pt.x) / 2, (min_pt.y + max_pt.y) / 2,
+                         (min_pt.z + max_pt.z) / 2)
+        return cls(tolerance, angle_tolerance, center, center.distance_to_point(max_pt))
+
+    @property
+    def normal_cell_size(self):
+        """Get the size of the grid cells for the components of plane normals."""
+        return self._normal_cell_size
+
+    @property
+    def distance_cell_size(self):
+        """Get the size of the grid cells for the distances of planes from the origin.
+        """
+        return self._distance_cell_size
+
+    def add(self, normal, point, item):
+        """Add an item to the grid under the plane of a given normal and point.
+
+        Args:
+            normal: A unit Vector3D for the normal of the plane.
+            point: A Point3D on the plane.
+            item: An object to be returned from the candidates method for
+                planes near this one. Items must be sortable (eg. integers).
+        """
+        for key in self._plane_keys(normal, point):
+            try:
+                self._grid[key].append(item)
+            except KeyError:  # first item in this cell
+                self._grid[key] = [item]
+
+    def candidates(self, normal, point):
+        """Get the items of the planes that may be coplanar with a given plane.
+
+        Args:
+            normal: A unit Vector3D for the normal of the plane.
+            point: A Point3D on the plane.
+
+        Returns:
+            A sorted list of the unique items in the same cell as the plane
+            or in directly neighboring cells.
+        """
+        key = self._plane_keys(normal, point)[0]
+        items = set()
+        x, y, z, w = key
+        grid = self._grid
+        for i in (x - 1, x, x + 1):
+            for j in (y - 1, y, y + 1):
+                for k in (z - 1, z, z + 1):
+                    for m in (w - 1, w, w + 1):
+                        try:
+                            items.update(grid[(i, j, k, m)])
+                        except KeyError:  # no planes in this cell
+                            pass
+        return sorted(items)
+
+    def _plane_keys(self, normal, point):
+        """Get the grid keys for both orientations of a plane."""
+        o = self._origin
+        dist = normal.x * (point.x - o[0]) + normal.y * (point.y - o[1]) + \
+            normal.z * (point.z - o[2])
+        n_cell, d_cell = self._normal_cell_size, self._distance_cell_size
+        keys = []
+        for sign in (1, -1):
+            keys.append((int(math.floor(sign * normal.x / n_cell)),
+                         int(math.floor(sign * normal.y / n_cell)),
+                         int(math.floor(sign * normal.z / n_cell)),
+                         int(math.floor(sign * dist / d_cell))))
+        return keys
+
+    def __repr__(self):
+        return 'PlaneHashGrid: [{} cells]'.format(len(self._grid))
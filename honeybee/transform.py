@@ -0,0 +1,264 @@
+# coding=utf-8
+"""Utilities for applying one transform to all of the geometry of a Model at once.
+
+Transforming each Face3D, Mesh3D and Polyface3D of a Model one point at a time
+in pure Python can be slow for large models. The BatchTransform class here
+gathers the vertices of many geometry objects into a single array, applies a
+4x4 affine matrix to all of them with NumPy and then re-builds the geometry
+objects with the transformed vertices.
+
+NumPy is an optional dependency. When it is not available (eg. in IronPython),
+the is_available function will return False and the geometry should be
+transformed with the methods of each object. The same is true if the installed
+ladybug_geometry does not have the attributes that are used to transfer holes
+and faces to the re-built geometry.
+"""
+from __future__ import division
+
+import math
+
+from ladybug_geometry.geometry3d import Point3D, Vector3D, Plane, Face3D, Mesh3D, \
+    Polyface3D
+
+try:
+    import numpy
+except ImportError:  # numpy is not available (eg. IronPython)
+    numpy = None
+
+# attributes of ladybug_geometry objects that are set on the re-built geometry
+_GEOMETRY_ATTRIBUTES = (
+    (Face3D, ('_boundary', '_holes')),
+    (Polyface3D, ('_faces', '_volume'))
+)
+
+
+def is_available():
+    """Get a boolean for whether batched transforms can be used.
+
+    This requires NumPy to be installed along with a ladybug_geometry that has
+    the attributes used to re-build Face3D with holes and Polyface3D.
+    """
+    return numpy is not None and all(
+        hasattr(geo_class, attr)
+        for geo_class, attrs in _GEOMETRY_ATTRIBUTES for attr in attrs)
+
+
+def move_matrix(moving_vec):
+    """Get a 4x4 affine matrix as nested lists for a move along a vector.
+
+    Args:
+        moving_vec: A ladybug_geometry Vector3D with the direction and distance
+            of the move.
+    """
+    return [[1, 0, 0, moving_vec.x], [0, 1, 0, moving_vec.y],
+            [0, 0, 1, moving_vec.z], [0, 0, 0, 1]]
+
+
+def rotate_matrix(axis, angle, origin):
+    """Get a 4x4 affine matrix as nested lists for a rotation around an axis.
+
+    The rotation follows the same right hand rule as ladybug_geometry.
+
+    Args:
+        axis: A ladybug_geometry Vector3D for the axis of rotation.
+        angle: An angle for rotation in radians.
+        origin: A ladybug_geometry Point3D for the origin of the rotation.
+    """
+    axis = axis.normalize()
+    x, y, z = axis.x, axis.y, axis.z
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    t = 1 - cos_a
+    rot = [[t * x * x + cos_a, t * x * y - sin_a * z, t * x * z + sin_a * y],
+           [t * x * y + sin_a * z, t * y * y + cos_a, t * y * z - sin_a * x],
+           [t * x * z - sin_a * y, t * y * z + sin_a * x, t * z * z + cos_a]]
+    return _linear_about_origin(rot, origin)
+
+
+def rotate_xy_matrix(angle, origin):
+    """Get a 4x4 affine matrix as nested lists for a rotation in the XY plane.
+
+    Args:
+        angle: An angle for counterclockwise rotation in radians.
+        origin: A ladybug_geometry Point3D for the origin of the rotation.
+    """
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    rot = [[cos_a, -sin_a, 0], [sin_a, cos_a, 0], [0, 0, 1]]
+    return _linear_about_origin(rot, origin)
+
+
+def reflect_matrix(normal, origin):
+    """Get a 4x4 affine matrix as nested lists for a reflection across a plane.
+
+    Args:
+        normal: A normalized ladybug_geometry Vector3D for the normal of the
+            plane across which geometry is reflected.
+        origin: A ladybug_geometry Point3D for the origin of the plane.
+    """
+    n = (normal.x, normal.y, normal.z)
+    ref = [[(1 if i == j else 0) - 2 * n[i] * n[j] for j in range(3)]
+           for i in range(3)]
+    return _linear_about_origin(ref, origin)
+
+
+def scale_matrix(factor, origin=None):
+    """Get a 4x4 affine matrix as nested lists for a scale from an origin.
+
+    Args:
+        factor: A number for how much the geometry should be scaled.
+        origin: A ladybug_geometry Point3D for the origin from which to scale.
+            If None, it will be scaled from the World origin (0, 0, 0).
+    """
+    scl = [[factor, 0, 0], [0, factor, 0], [0, 0, factor]]
+    return _linear_about_origin(scl, origin)
+
+
+class BatchTransform(object):
+    """Apply one affine transform to many ladybug_geometry objects at once.
+
+    Args:
+        matrix: A 4x4 affine matrix as nested lists, which can be obtained from
+            the functions of this module (eg. move_matrix).
+        kind: Text for the type of transform, which sets how the transformed
+            geometry is re-built such that it matches the result of the
+            corresponding ladybug_geometry method. Choose from: move, rotate,
+            rotate_xy, reflect, scale.
+        factor: A number for the scale factor, which is only used when the
+            kind is scale. (Default: 1).
+
+    Usage:
+
+    .. code-block:: python
+
+        transform = BatchTransform(move_matrix(Vector3D(0, 0, 3)), 'move')
+        for face in faces:
+            transform.add(face.geometry)
+        transform.run()
+        new_geos = [transform.result(face.geometry) for face in faces]
+    """
+    __slots__ = ('_matrix', '_kind', '_factor', '_geometries', '_results')
+    KINDS = ('move', 'rotate', 'rotate_xy', 'reflect', 'scale')
+
+    def __init__(self, matrix, kind, factor=1):
+        assert is_available(), 'NumPy must be installed to use BatchTransform.'
+        assert kind in self.KINDS, \
+            'Transform kind "{}" is not one of {}.'.format(kind, self.KINDS)
+        self._matrix = numpy.array(matrix, dtype=float)
+        self._kind = kind
+        self._factor = factor
+        self._geometries = {}
+        self._results = None
+
+    def add(self, geometry):
+        """Add a Face3D, Mesh3D or Polyface3D to be transformed.
+
+        Geometry objects that are added more than once are only transformed once.
+        For a Polyface3D, any faces that have been computed for it will also
+        be transformed.
+        """
+        assert isinstance(geometry, (Face3D, Mesh3D, Polyface3D)), 'Expected ' \
+            'Face3D, Mesh3D or Polyface3D. Got {}.'.format(type(geometry))
+        self._geometries[id(geometry)] = geometry
+        if isinstance(geometry, Polyface3D) and geometry._faces is not None:
+            for face in geometry._faces:
+                self._geometries[id(face)] = face
+
+    def run(self):
+        """Transform the vertices of all added geometry in one array operation."""
+        # gather all of the points and vectors into flat lists of coordinates
+        geos, points, vectors = list(self._geometries.values()), [], []
+        for geo in geos:
+            for loop in _point_loops(geo):
+                for pt in loop:
+                    points.extend((pt.x, pt.y, pt.z))
+            if isinstance(geo, Face3D):
+                pln = geo.plane
+                points.extend((pln.o.x, pln.o.y, pln.o.z))
+                vectors.extend((pln.n.x, pln.n.y, pln.n.z, pln.x.x, pln.x.y, pln.x.z))
+
+        # apply the matrix to the points and the linear part of it to the vectors
+        lin, trans = self._matrix[:3, :3], self._matrix[:3, 3]
+        pt_arr = numpy.array(points, dtype=float).reshape(-1, 3)
+        pt_list = (pt_arr.dot(lin.T) + trans).tolist()
+        vec_arr = numpy.array(vectors, dtype=float).reshape(-1, 3)
+        vec_list = vec_arr.dot(lin.T).tolist()
+
+        # re-build the geometry objects from the transformed points
+        results, poly_verts, p_i, v_i = {}, {}, 0, 0
+        for geo in geos:
+            loops = []
+            for loop in _point_loops(geo):
+                loops.append(tuple(Point3D(*c) for c in pt_list[p_i:p_i + len(loop)]))
+                p_i += len(loop)
+            if isinstance(geo, Face3D):
+                plane_o = Point3D(*pt_list[p_i])
+                plane_vecs = vec_list[v_i:v_i + 2]
+                p_i, v_i = p_i + 1, v_i + 2
+                results[id(geo)] = self._face_result(geo, loops, plane_o, plane_vecs)
+            elif isinstance(geo, Mesh3D):
+                results[id(geo)] = Mesh3D(loops[0], geo.faces)
+            else:  # polyfaces must be built after their faces
+                poly_verts[id(geo)] = loops[0]
+        for geo in geos:
+            if isinstance(geo, Polyface3D):
+                results[id(geo)] = \
+                    self._polyface_result(geo, poly_verts[id(geo)], results)
+        self._results = results
+
+    def result(self, geometry):
+        """Get the transformed version of a geometry object that was added."""
+        assert self._results is not None, \
+            'BatchTransform.run must be called before getting results.'
+        return self._results[id(geometry)]
+
+    def _face_result(self, geo, loops, plane_o, plane_vecs):
+        """Re-build a Face3D in the same manner as the ladybug_geometry methods."""
+        kind = self._kind
+        if kind == 'reflect':
+            loops = [tuple(reversed(loop)) for loop in loops]
+        if kind == 'scale':
+            plane = None  # computed from the vertices like Face3D.scale
+        elif kind == 'move':
+            plane = Plane(geo.plane.n, plane_o, geo.plane.x)
+        else:
+            plane = Plane(Vector3D(*plane_vecs[0]), plane_o, Vector3D(*plane_vecs[1]))
+        new_geo = Face3D(loops[0], plane, enforce_right_hand=False)
+        if geo._holes is not None:
+            new_geo._boundary = loops[1]
+            new_geo._holes = tuple(loops[2:])
+        return new_geo
+
+    def _polyface_result(self, geo, vertices, results):
+        """Re-build a Polyface3D in the same manner as the ladybug_geometry methods."""
+        new_geo = Polyface3D(vertices, geo.face_indices, geo.edge_information)
+        if geo._faces is not None:
+            new_geo._faces = tuple(results[id(face)] for face in geo._faces)
+        if self._kind != 'scale':
+            new_geo._volume = geo._volume
+        elif geo._volume is not None:
+            new_geo._volume = geo._volume * self._factor ** 3
+        return new_geo
+
+    def __repr__(self):
+        return 'BatchTransform: {} [{} geometries]'.format(
+            self._kind, len(self._geometries))
+
+
+def _point_loops(geo):
+    """Get a list of the loops of points of a geometry that should be transformed."""
+    if isinstance(geo, Face3D):
+        if geo._holes is None:
+            return (geo.vertices,)
+        return (geo.vertices, geo.boundary) + geo.holes
+    return (geo.vertices,)
+
+
+def _linear_about_origin(linear, origin):
+    """Get a 4x4 matrix for a 3x3 linear transform applied about an origin point."""
+    o = (0, 0, 0) if origin is None else (origin.x, origin.y, origin.z)
+    matrix = []
+    for i in range(3):
+        row = list(linear[i])
+        row.append(o[i] - sum(linear[i][j] * o[j] for j in range(3)))
+        matrix.append(row)
+    matrix.append([0, 0, 0, 1])
+    return matrix
@@ -0,0 +1,236 @@
+# coding=utf-8
+"""Cache for the results of Model validation checks that are run Room by Room.
+
+The results of the geometry checks for each Room (eg. planarity, self-intersection,
+solidity) only depend on the Room itself and the tolerances used. So these
+results can be stored under a fingerprint of the Room and re-used the next time
+a Model is validated, such that only Rooms that have changed are checked again.
+"""
+import io
+import os
+import json
+import hashlib
+
+from .config import folders
+
+
+class ValidationCache(object):
+    """Cache for the results of Model validation checks that are run Room by Room.
+
+    Args:
+        results: An optional dictionary with Room fingerprints from the room_key
+            method as keys and JSON strings of check results as values.
+            (Default: None).
+
+    Properties:
+        * fingerprints
+
+    Usage:
+
+    .. code-block:: python
+
+        model_file = 'C:/models/my_model.hbjson'
+        cache_file = ValidationCache.cache_file_path(model_file)
+        cache = ValidationCache.from_file(cache_file)
+        model = Model.from_file(model_file)
+        report = model.check_all(raise_exception=False, validation_cache=cache)
+        cache.prune()  # remove results for Rooms that are no longer in the model
+        cache.to_file(cache_file)
+    """
+    __slots__ = ('_results', '_used')
+    FILE_EXTENSION = '.hbvc'
+    # names of the checks with results stored in the cache, used in the fingerprints
+    CHECKS = (
+        'check_planar', 'check_self_intersecting', 'check_degenerate_rooms',
+        'check_sub_faces_valid', 'check_sub_faces_overlapping',
+        'check_upside_down_faces', 'check_rooms_solid'
+    )
+
+    def __init__(self, results=None):
+        self._results = {} if results is None else dict(results)
+        self._used = set()
+
+    @classmethod
+    def from_dict(cls, data):
+        """Initialize a ValidationCache from a dictionary.
+
+        If the dictionary was written with a different version of honeybee-core,
+        an empty cache will be returned since the check results may have changed.
+
+        Args:
+            data: A dictionary representation of a ValidationCache object.
+        """
+        assert data['type'] == 'ValidationCache', 'Expected ValidationCache ' \
+            'dictionary. Got {}.'.format(data['type'])
+        if data.get('version') != folders.honeybee_core_version_str:
+            return cls()
+        return cls(data['results'])
+
+    @classmethod
+    def from_file(cls, file_path):
+        """Initialize a ValidationCache from a file.
+
+        An empty cache will be returned if the file does not exist or it is not
+        a valid ValidationCache JSON (eg. because it is corrupt) since a missing
+        cache should only mean that all Rooms are checked again.
+
+        Args:
+            file_path: Path to a ValidationCache file written with the to_file method.
+        """
+        if not os.path.isfile(file_path):
+            return cls()
+        try:
+            with io.open(file_path, encoding='utf-8') as inf:
+                data = json.load(inf)
+            return cls.from_dict(data)
+        except (ValueError, KeyError, TypeError, AttributeError, AssertionError):
+            return cls()  # not a valid cache file
+
+    @staticmethod
+    def cache_file_path(model_file):
+        """Get the path of a cache file that sits next to a Model file.
+
+        Args:
+            model_file: Path to a Model file (eg. an HBJSON file).
+        """
+        return model_file + ValidationCache.FILE_EXTENSION
+
+    @staticmethod
+    def room_key(room, tolerance, angle_tolerance, degenerate_tolerance, detailed):
+        """Get a text string fingerprint for the check results of a Room.
+
+        The fingerprint accounts for the geometry, identifiers, display names and
+        types of the Room and all of its children along with the parents of the
+        Room since all of these can appear in the check results.
+
+        Args:
+            room: A Room object for which the fingerprint will be computed.
+            tolerance: The tolerance used to run the checks.
+            angle_tolerance: The angle tolerance used to run the checks.
+            degenerate_tolerance: The tolerance used to check for degenerate Rooms.
+            detailed: Boolean for whether the check results are detailed.
+        """
+        parents, rel_obj = [], room
+        while getattr(rel_obj, '_parent', None) is not None:
+            rel_obj = rel_obj._parent
+            parents.append(
+                (rel_obj.__class__.__name__, rel_obj.identifier, rel_obj.display_name))
+        key_data = [
+            ValidationCache.CHECKS, tolerance, angle_tolerance,
+            degenerate_tolerance, detailed, parents,
+            room.to_dict(included_prop=[])
+        ]
+        key_str = json.dumps(key_data, sort_keys=True)
+        return hashlib.sha256(key_str.encode('utf-8')).hexdigest()
+
+    @property
+    def fingerprints(self):
+        """Get a tuple of the Room fingerprints with results in this cache."""
+        return tuple(self._results.keys())
+
+    def get(self, key):
+        """Get the check results for a Room fingerprint.
+
+        Args:
+            key: Text for the Room fingerprint from the room_key method.
+
+        Returns:
+            A list with the results of each of the Room checks. None if there
+            are no results in the cache for the fingerprint.
+        """
+        try:
+            results = self._results[key]
+        except KeyError:  # room has not been checked yet
+            return None
+        self._used.add(key)
+        return json.loads(results, object_hook=_decode_tuples)
+
+    def set(self, key, results):
+        """Set the check results for a Room fingerprint.
+
+        Args:
+            key: Text for the Room fingerprint from the room_key method.
+            results: A list with the results of each of the Room checks.
+        """
+        self._results[key] = json.dumps(_encode_tuples(results))
+        self._used.add(key)
+
+    def prune(self):
+        """Remove all results that have not been used since the cache was loaded.
+
+        This is useful for keeping the cache file from growing after each edit
+        to the Model. The results that were used will be reset such that the
+        next call of this method will only keep results used after this call.
+        """
+        self._results = {k: v for k, v in self._results.items() if k in self._used}
+        self._used = set()
+
+    def to_dict(self):
+        """Get ValidationCache as a dictionary."""
+        return {
+            'type': 'ValidationCache',
+            'version': folders.honeybee_core_version_str,
+            'results': self._results
+        }
+
+    def to_file(self, file_path):
+        """Write this ValidationCache to a JSON file.
+
+        The cache is written to a temporary file that then replaces the file
+        such that the file is never left partially written.
+
+        Args:
+            file_path: Path to the file to be written.
+
+        Returns:
+            The path to the file that was written.
+        """
+        temp_path = '{}.{}.tmp'.format(file_path, os.getpid())
+        try:
+            with open(temp_path, 'w') as outf:
+                json.dump(self.to_dict(), outf)
+            try:
+                os.replace(temp_path, file_path)
+            except AttributeError:  # Python 2 without os.replace
+                if os.path.isfile(file_path):
+                    os.remove(file_path)
+                os.rename(temp_path, file_path)
+        finally:
+            if os.path.isfile(temp_path):
+                os.remove(temp_path)
+        return file_path
+
+    def __contains__(self, key):
+        return key in self._results
+
+    def __len__(self):
+        return len(self._results)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        return 'ValidationCache: [{} Rooms]'.format(len(self._results))
+
+
+def _encode_tuples(value):
+    """Replace the tuples in check results with dictionaries that can be decoded.
+
+    This ensures that results loaded from the cache are equal to the original
+    results since JSON would otherwise convert all tuples to lists.
+    """
+    if isinstance(value, tuple):
+        return {'__tuple__': [_encode_tuples(v) for v in value]}
+    if isinstance(value, list):
+        return [_encode_tuples(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _encode_tuples(v) for k, v in value.items()}
+    return value
+
+
+def _decode_tuples(obj_dict):
+    """Convert a dictionary from _encode_tuples back into a tuple."""
+    if len(obj_dict) == 1 and '__tuple__' in obj_dict:
+        return tuple(obj_dict['__tuple__'])
+    return obj_dict
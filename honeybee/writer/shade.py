@@ -4,3 +4,8 @@ Note to developers:
 Use this module to extend honeybee's Shade writer for new extensions.
 (eg. adding `idf` to this module adds the method `Shade.to.idf`)
 """
+
+from honeybee import extension_getattr as _extension_getattr
+
+# import the extensions the first time that a writer of an extension is requested
+__getattr__ = _extension_getattr(__name__)
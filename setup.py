@@ -20,7 +20,10 @@ setuptools.setup(
     include_package_data=True,
     install_requires=requirements,
     entry_points={
-        "console_scripts": ["honeybee = honeybee.cli:main"]
+        "console_scripts": [
+            "honeybee = honeybee.cli:main",
+            "honeybee-client = honeybee.client:main"
+        ]
     },
     classifiers=[
         "Programming Language :: Python :: 2.7",
@@ -0,0 +1,66 @@
+"""Test the batch command of the CLI."""
+import os
+import json
+import shutil
+
+from click.testing import CliRunner
+from honeybee.cli.batch import batch_cli, batch_model_files
+
+
+def test_batch_validate_model():
+    """Test running the validate model command over a glob of model files."""
+    output_folder = './tests/json/batch_validate'
+    runner = CliRunner()
+    result = runner.invoke(
+        batch_cli, ['validate model', './tests/json/compare_model_*.hbjson',
+                    '-w', '2', '-o', output_folder, '--', '--json'])
+    assert result.exit_code == 0
+
+    with open(os.path.join(output_folder, 'batch_summary.json')) as inf:
+        summary = json.load(inf)
+    assert summary['succeeded'] == 2
+    assert summary['failed'] == 0
+    for file_result in summary['files']:
+        assert file_result['success']
+        assert file_result['time'] >= 0
+        with open(file_result['output_file']) as inf:
+            report = json.load(inf)
+        assert report['valid']
+    shutil.rmtree(output_folder)
+
+
+def test_batch_manifest_failures():
+    """Test running an edit command from a manifest with a missing model file."""
+    output_folder = './tests/json/batch_edit'
+    os.makedirs(output_folder)
+    manifest = os.path.join(output_folder, 'manifest.txt')
+    with open(manifest, 'w') as outf:
+        outf.write('../single_family_home.hbjson\nmissing_model.hbjson\n')
+    assert batch_model_files(manifest) == [
+        os.path.abspath('./tests/json/single_family_home.hbjson'),
+        os.path.abspath(os.path.join(output_folder, 'missing_model.hbjson'))
+    ]
+
+    runner = CliRunner()
+    result = runner.invoke(
+        batch_cli, ['edit windows-by-ratio', manifest, '0.4', '-o', output_folder])
+    assert result.exit_code == 1
+
+    with open(os.path.join(output_folder, 'batch_summary.json')) as inf:
+        summary = json.load(inf)
+    assert summary['succeeded'] == 1
+    assert summary['failed'] == 1
+    success, failure = summary['files']
+    assert success['success'] and os.path.isfile(success['output_file'])
+    assert success['output_file'].endswith('single_family_home.hbjson')
+    assert not failure['success'] and 'does not exist' in failure['error']
+    shutil.rmtree(output_folder)
+
+
+def test_batch_invalid_command():
+    """Test that an invalid command fails before any model is processed."""
+    runner = CliRunner()
+    result = runner.invoke(batch_cli, ['edit not-a-command', './tests/json/*.hbjson'])
+    assert result.exit_code == 1
+    result = runner.invoke(batch_cli, ['edit', './tests/json/*.hbjson'])
+    assert result.exit_code == 1
@@ -1,4 +1,5 @@
 """Test basic CLI commands that create Honeybee Models."""
+import os
 import json
 import pytest
 from click.testing import CliRunner
@@ -22,6 +23,21 @@ def test_convert_units():
     assert new_model.units == 'Feet'
 
 
+def test_convert_units_compressed():
+    model = Model.from_file('./tests/json/single_family_home.hbjson')
+    input_model = model.to_hbjson('compressed_model', './tests/json', compression='gzip')
+    runner = CliRunner()
+    result = runner.invoke(convert_units, [input_model, 'Feet'])
+    assert result.exit_code == 0
+    result = runner.invoke(reset_resource_ids, [input_model])
+    assert result.exit_code == 0
+    os.remove(input_model)
+
+    model_dict = json.loads(result.output)
+    new_model = Model.from_dict(model_dict)
+    assert len(new_model.rooms) == len(model.rooms)
+
+
 def test_solve_adjacency():
     input_model = './tests/json/single_family_home.hbjson'
     runner = CliRunner()
@@ -37,6 +53,17 @@ def test_solve_adjacency():
     assert ab_count > 10
 
 
+def test_solve_adjacency_workers():
+    input_model = './tests/json/single_family_home.hbjson'
+    runner = CliRunner()
+    result = runner.invoke(solve_adjacency, [input_model, '-ow', '--workers', '2'])
+    assert result.exit_code == 0
+
+    model_dict = json.loads(result.output)
+    new_model = Model.from_dict(model_dict)
+    assert len(new_model.rooms) > 0
+
+
 def test_solve_adjacency_intersect():
     input_model = './tests/json/model_without_adjacency.hbjson'
     runner = CliRunner()
@@ -0,0 +1,82 @@
+"""Test the serve command of the CLI and the client that sends it commands."""
+import os
+import stat
+import json
+import socket
+import tempfile
+import threading
+
+import pytest
+
+from honeybee.cli import main
+from honeybee.cli.serve import serve, run_cli_command
+from honeybee.client import run_command
+
+
+def test_run_cli_command():
+    """Test running CLI commands in the current process and capturing the result."""
+    input_model = os.path.abspath('./tests/json/single_family_home.hbjson')
+    result = run_cli_command(main, ['validate', 'model', input_model, '--json'])
+    assert result['exit_code'] == 0
+    assert json.loads(result['output'])['valid']
+
+    result = run_cli_command(main, ['serve'])
+    assert result['exit_code'] == 1
+    assert 'cannot be run' in result['error']
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX') or not hasattr(os, 'fork'),
+                    reason='requires Unix sockets and process forking')
+def test_serve_and_client():
+    """Test sending commands from the client to a running server."""
+    socket_path = os.path.join(tempfile.mkdtemp(), 'honeybee.sock')
+    servers, ready = [], threading.Event()
+
+    def _ready(server):
+        servers.append(server)
+        ready.set()
+
+    thread = threading.Thread(target=serve, args=(socket_path, _ready))
+    thread.daemon = True
+    thread.start()
+    assert ready.wait(30)
+    try:
+        assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+        folder = os.path.abspath('./tests/json')
+        args = ['validate', 'model', 'single_family_home.hbjson', '--json']
+        cwd = os.getcwd()
+        os.chdir(folder)  # check that relative paths are resolved on the server
+        try:
+            result = run_command(args, socket_path, timeout=60)
+        finally:
+            os.chdir(cwd)
+        assert result['exit_code'] == 0
+        assert json.loads(result['output'])['valid']
+
+        result = run_command(['validate', 'model', 'not_a_model.hbjson'], socket_path)
+        assert result['exit_code'] != 0
+    finally:
+        servers[0].shutdown()
+        thread.join(30)
+    assert not os.path.exists(socket_path)
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX') or not hasattr(os, 'getuid'),
+                    reason='requires Unix sockets and user ids')
+def test_serve_refuses_foreign_path(monkeypatch):
+    """Test that the server and client do not use paths that they should not."""
+    not_socket = os.path.join(tempfile.mkdtemp(), 'honeybee.sock')
+    with open(not_socket, 'w') as outf:
+        outf.write('not a socket')
+    with pytest.raises(ValueError):
+        serve(not_socket)
+    assert os.path.isfile(not_socket)
+
+    uid = os.getuid()
+    monkeypatch.setattr(os, 'getuid', lambda: uid + 1)
+    with pytest.raises(OSError):
+        serve(not_socket)
+    with pytest.raises(OSError):
+        run_command(['validate', 'model', 'model.hbjson'], not_socket)
+    assert os.path.isfile(not_socket)
+    os.remove(not_socket)
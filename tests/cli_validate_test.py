@@ -1,6 +1,8 @@
 """Test basic CLI commands and the validate group"""
+import os
 import sys
 import json
+import shutil
 
 from click.testing import CliRunner
 from honeybee.cli import viz, config
@@ -55,6 +57,41 @@ def test_validate_model_json():
         assert len(valid_report['errors']) != 0
 
 
+def test_validate_model_workers():
+    incorrect_input_model = './tests/json/bad_geometry_model.hbjson'
+    if (sys.version_info >= (3, 7)):
+        runner = CliRunner()
+        result = runner.invoke(validate_model_cli, [incorrect_input_model, '--json'])
+        serial_report = json.loads(result.output)
+        result = runner.invoke(
+            validate_model_cli, [incorrect_input_model, '--json', '--workers', '2'])
+        parallel_report = json.loads(result.output)
+        assert not parallel_report['valid']
+        assert parallel_report['errors'] == serial_report['errors']
+
+def test_validate_model_cache():
+    incorrect_input_model = './tests/json/bad_geometry_model_cli_cache.hbjson'
+    shutil.copy('./tests/json/bad_geometry_model.hbjson', incorrect_input_model)
+    cache_file = incorrect_input_model + '.hbvc'
+    if (sys.version_info >= (3, 7)):
+        runner = CliRunner()
+        result = runner.invoke(validate_model_cli, [incorrect_input_model, '--json'])
+        base_report = json.loads(result.output)
+        for _ in range(2):
+            result = runner.invoke(
+                validate_model_cli, [incorrect_input_model, '--json', '--cache'])
+            cached_report = json.loads(result.output)
+            assert cached_report['errors'] == base_report['errors']
+            assert os.path.isfile(cache_file)
+        with open(cache_file, 'w') as outf:  # a partially written cache file
+            outf.write('{"type": "ValidationCache", "results": {"ab')
+        result = runner.invoke(
+            validate_model_cli, [incorrect_input_model, '--json', '--cache'])
+        assert result.exit_code == 0
+        assert json.loads(result.output)['errors'] == base_report['errors']
+        os.remove(cache_file)
+    os.remove(incorrect_input_model)
+
 def test_validate_mismatched_adjacency():
     incorrect_input_model = './tests/json/mismatched_area_adj.hbjson'
     if (sys.version_info >= (3, 7)):
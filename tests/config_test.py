@@ -1,5 +1,8 @@
 # coding=utf-8
-from honeybee.config import folders
+import json
+import platform
+
+from honeybee.config import folders, Folders
 
 import pytest
 
@@ -15,4 +18,24 @@ def test_config_init():
 
     assert hasattr(folders, 'python_exe_path')
     assert isinstance(folders.python_exe_path, str)
-    
\ No newline at end of file
+    
+
+def test_config_lazy_and_cached(tmpdir, monkeypatch):
+    """Test that config properties are computed when requested and versions cached."""
+    monkeypatch.setenv('HOME', str(tmpdir))
+    sim_folder = str(tmpdir.mkdir('sim'))
+    config_file = tmpdir.join('config.json')
+    config_file.write(json.dumps({'default_simulation_folder': sim_folder}))
+
+    config = Folders(str(config_file))
+    assert not config._config_loaded and config._versions is None
+    assert config.default_simulation_folder == sim_folder
+    assert config.honeybee_core_version == folders.honeybee_core_version
+    assert config.python_version_str == platform.python_version()
+    assert tmpdir.join('.honeybee', 'config_cache.json').check()
+
+    def no_search(self, package_name):
+        raise AssertionError('Package version was not taken from the cache.')
+    monkeypatch.setattr(Folders, '_find_package_version', no_search)
+    new_config = Folders(str(config_file))
+    assert new_config.honeybee_schema_version == config.honeybee_schema_version
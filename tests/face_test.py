@@ -10,6 +10,7 @@ from ladybug_geometry.geometry3d.face import Face3D
 from ladybug_geometry.geometry3d.pointvector import Point3D, Vector3D
 from ladybug_geometry.geometry3d.plane import Plane
 
+import math
 import uuid as py_uuid
 import json
 import pytest
@@ -748,3 +749,39 @@ def test_group_by_coplanarity():
     grouped_faces, planes = Face.group_by_coplanarity([face1], 0.01)
     assert len(grouped_faces) == 1
     assert len(grouped_faces[0]) == 1
+
+
+def test_group_by_coplanarity_many_planes():
+    """Test that group_by_coplanarity matches a comparison of all Faces."""
+    faces = []
+    for i in range(40):
+        angle = math.radians((i % 4) * 90 + (0.3 if i % 7 == 0 else 0))
+        base = Face3D.from_rectangle(2, 3, Plane(Vector3D(0, 1, 0), Point3D(i, 0, 0)))
+        geo = base.move(Vector3D(0, (i % 3) * 0.006 + (i // 20) * 5, 0))
+        geo = geo.rotate_xy(angle, Point3D(10, -10, 0))
+        if i % 5 == 0:
+            geo = geo.flip()
+        faces.append(Face('Face{}'.format(i), geo))
+
+    def brute_force_groups(faces, tolerance, angle_tolerance):
+        groups = [[faces[0]]]
+        for face in faces[1:]:
+            for group in groups:
+                if angle_tolerance is None:
+                    match = any(face.geometry.is_coplanar(f.geometry, tolerance)
+                                for f in group)
+                else:
+                    match = any(face.geometry.plane.is_coplanar_tolerance(
+                        f.geometry.plane, tolerance, math.radians(angle_tolerance))
+                        for f in group)
+                if match:
+                    group.append(face)
+                    break
+            else:
+                groups.append([face])
+        return groups
+
+    for tol, ang_tol in ((0.01, None), (0.01, 1), (0.001, 1), (0.02, 0.1)):
+        grouped_faces, planes = Face.group_by_coplanarity(faces, tol, ang_tol)
+        assert grouped_faces == brute_force_groups(faces, tol, ang_tol)
+        assert len(planes) == len(grouped_faces)
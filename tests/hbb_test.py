@@ -0,0 +1,31 @@
+"""Test the HBB reading and writing utilities."""
+import io
+import json
+
+from honeybee.hbb import MAGIC, is_hbb, dump_hbb, load_hbb
+
+
+def test_dump_load_hbb():
+    """Test that load_hbb gives the same dictionary that was given to dump_hbb."""
+    model_json = './tests/json/model_with_holes.hbjson'
+    with io.open(model_json, encoding='utf-8') as inf:
+        data = json.load(inf)
+    with io.open(model_json, encoding='utf-8') as inf:
+        original = json.load(inf)
+
+    hbb_file = io.BytesIO()
+    dump_hbb(data, hbb_file)
+    assert is_hbb(hbb_file.getvalue())
+    hbb_file.seek(0)
+    new_data, room_polyfaces = load_hbb(hbb_file)
+    assert room_polyfaces == [None] * len(original['rooms'])
+    # round trip through JSON to compare tuples of coordinates with lists
+    assert json.loads(json.dumps(new_data)) == original
+
+
+def test_is_hbb():
+    """Test the is_hbb function with other file types."""
+    assert is_hbb(MAGIC + b'\x00\x00')
+    assert not is_hbb(b'{"type": "Model"}')
+    assert not is_hbb(b'\x80\x02}q\x00')
+    assert not is_hbb(b'')
@@ -0,0 +1,157 @@
+"""Test the HBJSON reading and writing utilities."""
+import io
+import os
+import json
+
+from honeybee.room import Room
+from honeybee.jsonutil import available_backends, set_json_backend
+from honeybee.hbjson import JSONStreamReader, dump_json_members, strip_geometry, \
+    compression_type, open_hbjson
+
+
+def test_json_stream_reader():
+    """Test that the JSONStreamReader gives the same values as json.load."""
+    model_json = './tests/json/single_family_home.hbjson'
+    with io.open(model_json, encoding='utf-8') as inf:
+        data = json.load(inf)
+    for chunk_size in (1, 7, 4096):
+        streamed, item_count = {}, 0
+        with io.open(model_json, encoding='utf-8') as inf:
+            reader = JSONStreamReader(inf, chunk_size)
+            for key, value in reader.members(('rooms', 'orphaned_shades')):
+                if key in ('rooms', 'orphaned_shades'):
+                    streamed[key] = []
+                    for item in value:
+                        streamed[key].append(item)
+                        item_count += 1
+                else:
+                    streamed[key] = value
+        assert streamed == data
+        assert item_count == len(data['rooms']) + len(data['orphaned_shades'])
+
+
+def test_json_stream_reader_values():
+    """Test the JSONStreamReader with un-consumed arrays and non-array values."""
+    json_str = u'{"a": [1, 2.5e3, {"b": null}], "c": null, "d": [], "e": -0.25}'
+    reader = JSONStreamReader(io.StringIO(json_str), 2)
+    members = list(reader.members(('a', 'c', 'd')))
+    assert [key for key, _ in members] == ['a', 'c', 'd', 'e']
+    assert members[1][1] is None
+    assert members[3][1] == -0.25
+
+    reader = JSONStreamReader(io.StringIO(u' {} '))
+    assert list(reader.members()) == []
+
+
+def test_dump_json_members():
+    """Test that dump_json_members writes the same text as json.dump."""
+    model_json = './tests/json/single_family_home.hbjson'
+    with io.open(model_json, encoding='utf-8') as inf:
+        data = json.load(inf)
+    data['orphaned_faces'] = []
+    stream_keys = ('rooms', 'orphaned_shades', 'orphaned_faces')
+    for indent in (None, 0, 4, '\t'):
+        out_file = io.StringIO()
+        members = ((key, iter(value) if key in stream_keys else value)
+                   for key, value in data.items())
+        dump_json_members(members, out_file, stream_keys, indent)
+        assert out_file.getvalue() == json.dumps(data, indent=indent)
+    out_file = io.StringIO()
+    dump_json_members([], out_file, indent=2)
+    assert out_file.getvalue() == '{}'
+
+
+def test_strip_geometry():
+    """Test the strip_geometry function."""
+    model_json = './tests/json/single_family_home.hbjson'
+    with io.open(model_json, encoding='utf-8') as inf:
+        data = json.load(inf)
+    room_dict = strip_geometry(data['rooms'][0])
+    assert 'properties' in room_dict
+    for face_dict in room_dict['faces']:
+        assert 'geometry' not in face_dict
+        assert 'boundary_condition' in face_dict
+
+
+def test_open_hbjson_compressed():
+    """Test that open_hbjson writes and reads compressed HBJSON files."""
+    json_str = u'{"type": "Model", "display_name": "Façade", "rooms": []}'
+    compressions = ['gzip']
+    try:
+        import zstandard  # noqa: F401
+        compressions.append('zstd')
+    except ImportError:  # zstandard is not installed
+        pass
+    for compression in [None] + compressions:
+        hb_file = './tests/json/compressed_test.hbjson'
+        with open_hbjson(hb_file, 'w', compression) as outf:
+            outf.write(json_str)
+        with open(hb_file, 'rb') as inf:
+            assert compression_type(inf.read(4)) == compression
+        with open_hbjson(hb_file) as inf:
+            assert inf.read() == json_str
+        with open_hbjson(hb_file) as inf:
+            reader = JSONStreamReader(inf, 8)
+            assert dict(reader.members()) == json.loads(json_str)
+        os.remove(hb_file)
+    assert compression_type(b'HBB\x01') is None
+
+
+def test_json_stream_reader_backends():
+    """Test that the JSONStreamReader gives the same values with all JSON backends."""
+    items = [
+        {'type': 'Room', 'identifier': 'Brace_{', 'faces': [{'a': '}, {"type": "Room"'}]},
+        {'type': 'Room', 'identifier': 'NaN', 'value': float('nan')},
+        {'type': 'Room', 'identifier': 'Quote_"}', 'nested': {'b': [{}, {'c': None}]}},
+        {'type': 'Room', 'identifier': 'Plain', 'value': -1e-05},
+        {}
+    ]
+    data = {'type': 'Model', 'rooms': items, 'properties': {'type': 'Props'}}
+    json_str = json.dumps(data)
+    model_json = './tests/json/single_family_home.hbjson'
+    with io.open(model_json, encoding='utf-8') as inf:
+        model_str = inf.read()
+    try:
+        for name in available_backends():
+            set_json_backend(name)
+            for chunk_size in (1, 7, 4096):
+                reader = JSONStreamReader(io.StringIO(json_str), chunk_size)
+                streamed = {key: list(value) if key == 'rooms' else value
+                            for key, value in reader.members(('rooms',))}
+                assert json.dumps(streamed) == json_str
+                reader = JSONStreamReader(io.StringIO(model_str), chunk_size)
+                streamed = {key: list(value) if key == 'rooms' else value
+                            for key, value in reader.members(('rooms',))}
+                assert streamed == json.loads(model_str)
+    finally:
+        set_json_backend()
+
+
+def test_json_stream_reader_unbalanced_braces():
+    """Test that braces in strings do not make the JSONStreamReader read ahead."""
+    room_dict = Room.from_box('Room', 3, 3, 3).to_dict()
+    room_dict['display_name'] = 'Room {A'
+    rooms = []
+    for i in range(500):
+        room_dict = dict(room_dict)
+        room_dict['identifier'] = 'Room_{}'.format(i)
+        rooms.append(room_dict)
+    json_str = json.dumps({'type': 'Model', 'rooms': rooms})
+    rooms = json.loads(json_str)['rooms']
+    chunk_size = 4096
+    read_ahead = 4 * max(chunk_size, len(json.dumps(rooms[0])))
+    try:
+        for name in available_backends():
+            set_json_backend(name)
+            inf = io.StringIO(json_str)
+            reader = JSONStreamReader(inf, chunk_size)
+            room_start = 0
+            for key, value in reader.members(('rooms',)):
+                if key == 'rooms':
+                    for i, room in enumerate(value):
+                        assert room == rooms[i]
+                        # only the text near the current room should have been read
+                        room_start = json_str.index(room['identifier'], room_start)
+                        assert inf.tell() < room_start + read_ahead
+    finally:
+        set_json_backend()
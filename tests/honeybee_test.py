@@ -0,0 +1,82 @@
+# coding=utf-8
+import os
+import sys
+import subprocess
+
+EXTENSION = '''
+from honeybee.properties import RoomProperties
+import honeybee.writer.room as room_writer
+RoomProperties.dummy = property(lambda self: 'dummy properties')
+room_writer.dummy = lambda room: 'dummy writer'
+'''
+
+SCRIPT = '''
+import sys
+import pkgutil
+import ladybug  # ladybug has its own scan for plugins
+if sys.argv[1] == 'cached':  # the cached index should be used without scanning
+    pkgutil.iter_modules = None
+import honeybee
+from honeybee.room import Room
+room = Room.from_box('Dummy_Room', 3, 3, 3)
+assert 'honeybee_dummy' not in sys.modules
+print(room.properties.dummy)
+print(room.to.dummy(room))
+print(list(honeybee.extensions))
+'''
+
+CLI_EXTENSION = '''
+import click
+from honeybee.cli import main
+
+
+@click.command('fakeext')
+def fakeext():
+    click.echo('fake extension command')
+
+
+main.add_command(fakeext)
+'''
+
+
+def _run_script(folder, home_folder, mode):
+    """Run the test script in a new interpreter with the dummy extension."""
+    env = dict(os.environ)
+    package_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env['PYTHONPATH'] = os.pathsep.join((str(folder), package_folder))
+    env['HOME'] = str(home_folder)
+    return subprocess.check_output(
+        [sys.executable, '-c', SCRIPT, mode], cwd=str(folder), env=env,
+        universal_newlines=True).splitlines()
+
+
+def test_lazy_extensions(tmpdir):
+    """Test that extensions are found and imported when their attributes are used."""
+    ext_folder = tmpdir.mkdir('extensions')
+    home_folder = tmpdir.mkdir('home')
+    ext_folder.join('honeybee_dummy.py').write(EXTENSION)
+
+    output = _run_script(ext_folder, home_folder, 'scan')
+    assert output[:2] == ['dummy properties', 'dummy writer']
+    assert 'honeybee_dummy' in output[2]
+    assert home_folder.join('.honeybee', 'extension_index.json').check()
+
+    output = _run_script(ext_folder, home_folder, 'cached')
+    assert output[:2] == ['dummy properties', 'dummy writer']
+
+
+def test_extension_cli_commands(tmpdir):
+    """Test that extensions add their commands to the honeybee CLI."""
+    ext_folder = tmpdir.mkdir('extensions')
+    home_folder = tmpdir.mkdir('home')
+    ext_folder.join('honeybee_fakeext.py').write(CLI_EXTENSION)
+    env = dict(os.environ)
+    package_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env['PYTHONPATH'] = os.pathsep.join((str(ext_folder), package_folder))
+    env['HOME'] = str(home_folder)
+    for args, expected in ((['--help'], 'fakeext'),
+                           (['fakeext'], 'fake extension command')):
+        output = subprocess.check_output(
+            [sys.executable, '-m', 'honeybee'] + args, cwd=str(ext_folder),
+            env=env, universal_newlines=True)
+        assert expected in output
@@ -0,0 +1,91 @@
+# coding=utf-8
+"""Test the pluggable JSON backend."""
+import io
+import json
+import pytest
+
+from ladybug_geometry.geometry3d import Point3D, Face3D, Mesh3D
+
+from honeybee.jsonutil import BACKENDS, available_backends, json_backend, \
+    set_json_backend, loads, load, dumps
+from honeybee.model import Model
+from honeybee.room import Room
+from honeybee.face import Face
+from honeybee.aperture import Aperture
+from honeybee.door import Door
+from honeybee.shade import Shade
+from honeybee.shademesh import ShadeMesh
+
+
+def _objects_to_test():
+    """Get a list of each type of honeybee object to be serialized."""
+    room = Room.from_box('Tiny_House_Zone', 5, 10, 3)
+    room.faces[1].apertures_by_ratio(0.4, 0.01)
+    room.faces[3].add_door(Door.from_vertices(
+        'Front_Door', [(0, 0, 0), (1, 0, 0), (1, 0, 2), (0, 0, 2)]))
+    room.faces[1].apertures[0].extruded_border(0.1)
+    face = Face('Face_1e-05', Face3D(
+        [Point3D(0, 0, 0), Point3D(1e-05, 0, 0), Point3D(1e-05, 1e16, 0)]))
+    face.display_name = u'Façade ☃'
+    aperture = Aperture.from_vertices(
+        'Window', [(0, 0, 0.1), (1.5, 0, 0.1), (1.5, 0, 2.1234567891234), (0, 0, 2)])
+    door = Door.from_vertices(
+        'Door', [(0, 0, 0), (1, 0, 0), (1, 0, 2), (0, 0, 2)], is_glass=True)
+    shade = Shade.from_vertices(
+        'Awning', [(0, 0, 3), (2, 0, 3), (2, -1.0 / 3, 3), (0, -1.0 / 3, 3)])
+    mesh = Mesh3D([Point3D(0, 0, 4), Point3D(0, 2, 4), Point3D(2, 2, 4),
+                   Point3D(2, 0, 4)], [(0, 1, 2, 3)])
+    shade_mesh = ShadeMesh('Canopy', mesh)
+    model = Model('Tiny_House', [room], [face], [shade], [aperture], [door],
+                  shade_meshes=[shade_mesh])
+    return [room, face, aperture, door, shade, shade_mesh, model]
+
+
+def test_backends():
+    """Test the selection of JSON backends."""
+    assert 'json' in available_backends()
+    assert json_backend() == available_backends()[0]
+    assert all(name in BACKENDS for name in available_backends())
+    try:
+        assert set_json_backend('json') == 'json'
+        assert json_backend() == 'json'
+        with pytest.raises(AssertionError):
+            set_json_backend('not_a_backend')
+    finally:
+        set_json_backend()
+
+
+def test_round_trip_all_backends():
+    """Test that all object types round trip through each available backend."""
+    objs = _objects_to_test()
+    try:
+        for name in available_backends():
+            set_json_backend(name)
+            for obj in objs:
+                obj_dict = obj.to_dict()
+                obj_str = dumps(obj_dict)
+                new_dict = loads(obj_str)
+                assert new_dict == json.loads(obj_str)
+                assert dumps(new_dict) == obj_str  # floats parsed without rounding
+                new_obj = obj.__class__.from_dict(new_dict)
+                assert dumps(new_obj.to_dict()) == obj_str
+                assert loads(obj_str.encode('utf-8')) == new_dict
+                assert load(io.StringIO(obj_str)) == new_dict
+    finally:
+        set_json_backend()
+
+
+def test_loads_fallback():
+    """Test that JSON text only supported by the json module is still parsed."""
+    json_str = json.dumps({'a': float('inf'), 'b': -1e-05, 'c': [1, 2.5]})
+    try:
+        for name in available_backends():
+            set_json_backend(name)
+            data = loads(json_str)
+            assert data['a'] == float('inf')
+            assert data['b'] == -1e-05
+            assert data['c'] == [1, 2.5]
+            with pytest.raises(ValueError):
+                loads('{"a": }')
+    finally:
+        set_json_backend()
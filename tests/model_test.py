@@ -10,10 +10,12 @@ from honeybee.boundarycondition import Surface
 from honeybee.facetype import face_types
 from honeybee.units import conversion_factor_to_meters
 
-from ladybug_geometry.geometry3d import Point3D, Vector3D, Plane, Face3D, Mesh3D
+from ladybug_geometry.geometry3d import Point3D, Vector3D, Plane, Face3D, Mesh3D, \
+    LineSegment3D, Polyline3D
 
 import math
 import pytest
+import io
 import os
 import json
 
@@ -195,6 +197,49 @@ def test_adjacent_zone_model():
     assert len(model.zone_dict) == 1
 
 
+def test_incremental_adjacency():
+    """Test the solve_adjacency option of add_rooms and the reset of remove_rooms."""
+    rooms = [Room.from_box('Room{}'.format(i), 5, 5, 3, origin=Point3D(5 * i, 0, 0))
+             for i in range(3)]
+    rooms[1][2].apertures_by_ratio(0.4, 0.01)
+    rooms[2][4].apertures_by_ratio(0.4, 0.01)
+    model = Model('Row', rooms[:2], tolerance=0.01)
+    model.solve_adjacency()
+    full_solve = model.duplicate()
+    full_solve.add_room(rooms[2].duplicate())
+    full_solve.solve_adjacency()
+
+    model.add_rooms([rooms[2]], solve_adjacency=True)
+    surface_faces = [f.identifier for f in model.faces
+                     if isinstance(f.boundary_condition, Surface)]
+    assert len(surface_faces) == 4
+    assert surface_faces == [f.identifier for f in full_solve.faces
+                             if isinstance(f.boundary_condition, Surface)]
+    assert rooms[1][2].boundary_condition.boundary_condition_object == \
+        rooms[2][4].identifier
+    assert isinstance(rooms[2][4].apertures[0].boundary_condition, Surface)
+
+    # replace the last room with a moved copy that is no longer adjacent
+    new_room = Room.from_box('NewRoom', 5, 5, 3, origin=Point3D(10, 0, 10))
+    new_room[4].apertures_by_ratio(0.4, 0.01)
+    model.remove_rooms([rooms[2].identifier], reset_adjacency=True)
+    assert not isinstance(rooms[1][2].boundary_condition, Surface)
+    assert not isinstance(rooms[1][2].apertures[0].boundary_condition, Surface)
+    assert isinstance(rooms[1][4].boundary_condition, Surface)
+    model.add_room(new_room, solve_adjacency=True)
+    assert not isinstance(rooms[1][2].boundary_condition, Surface)
+
+    # moving the new room back into place should be caught by the face index
+    new_room.move(Vector3D(0, 0, -10))
+    adj_info = model.solve_room_adjacency([new_room])
+    assert len(adj_info['adjacent_faces']) == 1
+    assert len(adj_info['adjacent_apertures']) == 1
+    assert adj_info['adjacent_faces'][0] == (rooms[1][2], new_room[4])
+
+    with pytest.raises(ValueError):
+        model.solve_room_adjacency([rooms[2]])
+
+
 def test_model_init_from_objects():
     """Test the initialization of the Model from_objects."""
     pts_1 = [Point3D(0, 0, 0), Point3D(0, 10, 0), Point3D(10, 10, 0), Point3D(10, 0, 0)]
@@ -279,6 +324,72 @@ def test_classified_envelope_edges():
     assert len(underground) == 0
 
 
+def test_spatial_index():
+    """Test the spatial_index method and its invalidation."""
+    rooms = [Room.from_box('Room{}'.format(i), 5, 5, 3, origin=Point3D(5 * i, 0, 0))
+             for i in range(4)]
+    rooms[0][3].apertures_by_ratio(0.4, 0.01)
+    model = Model('Row', rooms, tolerance=0.01)
+
+    room_tree = model.spatial_index()
+    assert room_tree is model.spatial_index('Room')
+    assert room_tree.objects == model.rooms
+    assert room_tree.query_point(Point3D(7, 2, 1), 0) == [rooms[1]]
+    assert room_tree.query_box((9.99, 0, 0, 10.01, 1, 1)) == [rooms[1], rooms[2]]
+    assert room_tree.overlapping_pairs(0.01) == [(0, 1), (1, 2), (2, 3)]
+    assert model.spatial_index('SubFace').objects == tuple(model.apertures)
+    assert len(model.spatial_index('Face')) == 24
+    edge = LineSegment3D.from_end_points(Point3D(10, 0, 0), Point3D(10, 5, 0))
+    assert model.rooms_relevant_to_edge(edge) == [rooms[1], rooms[2]]
+    assert model.spatial_index() is room_tree  # queries do not rebuild the tree
+
+    # building unrelated objects does not rebuild the tree
+    Shade('Awning', Face3D([Point3D(0, 0, 3), Point3D(1, 0, 3), Point3D(1, 1, 3)]))
+    Room.from_box('Other_Room', 5, 5, 3).geometry
+    model.duplicate()
+    assert model.spatial_index() is room_tree
+
+    sub_face_tree = model.spatial_index('SubFace')
+    model.apertures[0].move(Vector3D(0, -1, 0))
+    assert model.spatial_index('SubFace') is not sub_face_tree
+    assert model.spatial_index('SubFace').query_point(Point3D(2.5, -1, 1.5), 0.01) \
+        == [model.apertures[0]]
+
+    rooms[3].move(Vector3D(0, 0, 10))
+    new_tree = model.spatial_index()
+    assert new_tree is not room_tree
+    assert new_tree.overlapping_pairs(0.01) == [(0, 1), (1, 2)]
+    model.remove_rooms([rooms[0].identifier])
+    assert model.spatial_index().objects == tuple(rooms[1:])
+
+    with pytest.raises(ValueError):
+        model.spatial_index('Building')
+
+
+def test_rooms_relevant_to_edges():
+    """Test that rooms_relevant_to_edges matches rooms_relevant_to_edge."""
+    rooms = [Room.from_box('Room{}{}'.format(i, j), 5, 5, 3,
+                           origin=Point3D(5 * i, 5 * j, 0))
+             for i in range(3) for j in range(2)]
+    for room in rooms:
+        room[3].apertures_by_ratio(0.4, 0.01)
+    model = Model('Grid', rooms, tolerance=0.01)
+    model.solve_adjacency()
+    edges = []
+    for edge_group in model.classified_envelope_edges():
+        edges.extend(edge_group)
+    for edge_group in model.classified_sub_face_edges():
+        edges.extend(edge_group)
+    edges.append(Polyline3D((Point3D(5, 0, 0), Point3D(5, 10, 0), Point3D(5, 10, 3))))
+    assert len(edges) > 20
+
+    for mul_thick in (None, 0.01):
+        single = [model.rooms_relevant_to_edge(edge, mul_thick) for edge in edges]
+        assert model.rooms_relevant_to_edges(edges, mul_thick) == single
+        assert model.rooms_relevant_to_edges(edges, mul_thick, workers=2) == single
+    assert model.rooms_relevant_to_edges([]) == []
+
+
 def test_rooms_by_identifier():
     """Test the rooms_by_identifier method."""
     room = Room.from_box('TinyHouseZone', 5, 10, 3)
@@ -322,6 +433,81 @@ def test_shades_by_identifier():
         model.shades_by_identifier(['TinyHouseZone_Back_Glz0_OutOverhang0'])
 
 
+def test_by_identifier_after_edits():
+    """Test that identifier lookups reflect edits made after a previous lookup."""
+    room = Room.from_box('TinyHouseZone', 5, 10, 3)
+    model = Model('TinyHouse', [room])
+    assert model.rooms_by_identifier(['TinyHouseZone']) == [room]
+    assert len(model.apertures_by_identifier([])) == 0
+
+    # changes to the top-level objects
+    room_2 = Room.from_box('TinyHouseZone2', 5, 10, 3, origin=Point3D(5, 0, 0))
+    model.add_room(room_2)
+    assert model.rooms_by_identifier(['TinyHouseZone2']) == [room_2]
+    assert model.faces_by_identifier(['TinyHouseZone2_Front'])[0].parent is room_2
+    model.remove_rooms(['TinyHouseZone2'])
+    with pytest.raises(ValueError):
+        model.rooms_by_identifier(['TinyHouseZone2'])
+    with pytest.raises(ValueError):
+        model.faces_by_identifier(['TinyHouseZone2_Front'])
+
+    # changes to the child objects of the top-level objects
+    south_face = room[3]
+    south_face.apertures_by_ratio(0.4, 0.01)
+    ap_id = south_face.apertures[0].identifier
+    assert model.apertures_by_identifier([ap_id]) == [south_face.apertures[0]]
+    south_face.remove_apertures()
+    with pytest.raises(ValueError):
+        model.apertures_by_identifier([ap_id])
+
+    # changes to the identifiers of objects
+    model.add_prefix('New')
+    assert len(model.rooms_by_identifier(['New_TinyHouseZone'])) == 1
+    with pytest.raises(ValueError):
+        model.rooms_by_identifier(['TinyHouseZone'])
+    assert 'New_TinyHouseZone' in model.top_level_dict
+    assert 'TinyHouseZone' not in model.top_level_dict
+
+def test_cached_object_lists():
+    """Test that the lists of child objects are updated after edits to the model."""
+    room = Room.from_box('TinyHouseZone', 5, 10, 3)
+    model = Model('TinyHouse', [room])
+    assert len(model.faces) == 6
+    assert len(model.apertures) == 0
+    assert len(model.shades) == 0
+    model.faces.pop(0)  # editing the returned list should not affect the model
+    assert len(model.faces) == 6
+
+    south_face = room[3]
+    south_face.apertures_by_ratio(0.4, 0.01)
+    assert len(model.apertures) == 1
+    south_face.apertures[0].overhang(0.5, indoor=False)
+    south_face.apertures[0].overhang(0.5, indoor=True)
+    assert len(model.shades) == 2
+    assert len(model.indoor_shades) == 1
+    assert len(model.outdoor_shades) == 1
+    south_face.apertures[0].remove_indoor_shades()
+    assert len(model.shades) == 1
+    assert len(model.indoor_shades) == 0
+
+    door = Door('FrontDoor', Face3D([Point3D(2, 10, 0.1), Point3D(1, 10, 0.1),
+                                    Point3D(1, 10, 2.5), Point3D(2, 10, 2.5)]))
+    room[1].add_door(door)
+    assert model.doors == [door]
+    south_face.remove_sub_faces()
+    assert len(model.apertures) == 0
+    assert len(model.shades) == 0
+    assert len(model.doors) == 1
+
+    model.add_shade(Shade('Tree', Face3D([Point3D(0, -2, 0), Point3D(1, -2, 0),
+                                          Point3D(1, -2, 3)])))
+    assert len(model.shades) == 1
+    room_2 = Room.from_box('TinyHouseZone2', 5, 10, 3, origin=Point3D(5, 0, 0))
+    model.add_room(room_2)
+    assert len(model.faces) == 12
+    model.remove_rooms(['TinyHouseZone2'])
+    assert len(model.faces) == 6
+
 def test_apertures_by_identifier():
     """Test the apertures_by_identifier method."""
     room = Room.from_box('TinyHouseZone', 5, 10, 3)
@@ -954,6 +1140,22 @@ def test_check_missing_adjacencies():
     assert model_1.check_missing_adjacencies() == ''
 
 
+def test_check_all_workers():
+    """Test that running check_all over several workers gives the same report."""
+    for model_file in ('bad_geometry_model.hbjson', 'single_family_home.hbjson'):
+        model = Model.from_file(os.path.join('./tests/json', model_file))
+        for detailed in (False, True):
+            serial_report = model.check_all(False, detailed)
+            parallel_report = model.check_all(False, detailed, workers=2)
+            assert parallel_report == serial_report
+            ext_report = model.check_for_extension('Generic', False, detailed, 2)
+            assert ext_report == serial_report
+    assert model._check_results is None
+
+    model = Model.from_file('./tests/json/bad_geometry_model.hbjson')
+    with pytest.raises(ValueError):
+        model.check_all(workers=2)
+
 def test_check_all_air_boundaries_adjacent():
     """Test the check_all_air_boundaries_adjacent method."""
     room_south = Room.from_box('SouthZone', 5, 5, 3, origin=Point3D(0, 0, 0))
@@ -1108,6 +1310,38 @@ def test_triangulated_doors():
         assert len(dr.geometry) == 3
 
 
+def test_to_dict_triangulate_sub_faces():
+    """Test the Model to_dict method with triangulated sub-faces."""
+    room_south = Room.from_box('SouthZone', 5, 5, 3, origin=Point3D(0, 0, 0))
+    room_north = Room.from_box('NorthZone', 5, 5, 3, origin=Point3D(0, 5, 0))
+    for x in (0.5, 2.5):
+        ap_verts = [Point3D(x + 1.5, 5, 1), Point3D(x, 5, 1), Point3D(x, 5, 2),
+                    Point3D(x + 0.75, 5, 2.5), Point3D(x + 1.5, 5, 2)]
+        room_south[1].add_aperture(Aperture('Int{}'.format(x), Face3D(ap_verts)))
+        room_north[3].add_aperture(
+            Aperture('IntAdj{}'.format(x), Face3D(ap_verts).flip()))
+    room_north[1].apertures_by_ratio(0.4, 0.01)
+    door_verts = [Point3D(2, 10, 0.1), Point3D(1, 10, 0.1), Point3D(1, 10, 2.5),
+                  Point3D(1.5, 10, 2.8), Point3D(2, 10, 2.5)]
+    room_north[1].add_door(Door('FrontDoor', Face3D(door_verts)))
+    model = Model('TwoRoomHouse', [room_south, room_north], tolerance=0.01)
+    model.solve_adjacency()
+
+    model_dict = model.to_dict(triangulate_sub_faces=True)
+    south_aps = model_dict['rooms'][0]['faces'][1]['apertures']
+    north_aps = model_dict['rooms'][1]['faces'][3]['apertures']
+    assert len(south_aps) == len(north_aps) == 6
+    for ap_dict in south_aps + north_aps:
+        assert len(ap_dict['geometry']['boundary']) == 3
+        adj_id = ap_dict['boundary_condition']['boundary_condition_objects'][0]
+        assert adj_id in [a['identifier'] for a in south_aps + north_aps]
+    front_face = model_dict['rooms'][1]['faces'][1]
+    assert len(front_face['apertures']) == 1
+    assert len(front_face['doors']) == 3
+    assert all(d['identifier'].startswith('FrontDoor..') for d in front_face['doors'])
+    assert len(Model.from_dict(model_dict).apertures) == 13
+
+
 def test_to_dict():
     """Test the Model to_dict method."""
     room = Room.from_box('TinyHouseZone', 5, 10, 3)
@@ -1325,6 +1559,50 @@ def test_from_hbjson():
     assert isinstance(parsed_model, Model)
 
 
+def test_from_hbjson_matches_from_dict():
+    """Test that streaming from_hbjson gives the same Model as from_dict."""
+    for model_json in ('./tests/json/single_family_home.hbjson',
+                       './tests/json/model_with_holes.hbjson',
+                       './tests/json/bad_geometry_model.hbjson'):
+        with open(model_json) as json_file:
+            data = json.load(json_file)
+        dict_model = Model.from_dict(data, cleanup_irrational=True)
+        stream_model = Model.from_hbjson(model_json, cleanup_irrational=True)
+        assert stream_model.to_dict() == dict_model.to_dict()
+
+
+def test_from_dict_workers():
+    """Test that serializing a Model over several workers gives the same result."""
+    model_json = './tests/json/single_family_home.hbjson'
+    with open(model_json) as json_file:
+        data = json.load(json_file)
+    serial_model = Model.from_dict(data)
+    parallel_model = Model.from_dict(data, workers=2)
+    assert parallel_model.to_dict() == serial_model.to_dict()
+    for room in parallel_model.rooms:
+        for face in room.faces:
+            assert face.parent is room
+    stream_model = Model.from_hbjson(model_json, workers=2)
+    assert stream_model.to_dict() == serial_model.to_dict()
+
+
+def test_dump_hbjson():
+    """Test that the Model dump_hbjson method writes the same text as to_dict."""
+    model_json = './tests/json/single_family_home.hbjson'
+    model = Model.from_hbjson(model_json)
+    model.add_shade(Shade('Tree', Face3D([Point3D(0, 0, 0), Point3D(1, 0, 0),
+                                          Point3D(1, 0, 1)])))
+    model.add_face(Face('Canopy', Face3D([Point3D(0, 0, 5), Point3D(1, 0, 5),
+                                          Point3D(1, 1, 5)])))
+    model.user_data = {'note': 'streamed'}
+    for indent, triangulate in ((None, False), (2, False), (None, True)):
+        out_file = io.StringIO()
+        model.dump_hbjson(out_file, indent, triangulate_sub_faces=triangulate)
+        expected = json.dumps(
+            model.to_dict(triangulate_sub_faces=triangulate), indent=indent)
+        assert out_file.getvalue() == expected
+
+
 def test_to_hbjson():
     """Test the Model to_hbjson method."""
     room = Room.from_box('TinyHouseZone', 5, 10, 3)
@@ -1397,6 +1675,62 @@ def test_to_hbpkl():
     os.remove(model_hbpkl)
 
 
+def test_to_hbjson_compressed():
+    """Test the Model to_hbjson and from_file methods with compressed HBJSON."""
+    model_json = './tests/json/single_family_home.hbjson'
+    model = Model.from_hbjson(model_json)
+    path = './tests/json'
+    plain_hbjson = model.to_hbjson('test', path)
+    model_dict = Model.from_hbjson(plain_hbjson).to_dict()
+    os.remove(plain_hbjson)
+
+    compressions = ['gzip']
+    try:
+        import zstandard  # noqa: F401
+        compressions.append('zstd')
+    except ImportError:  # zstandard is not installed
+        pass
+    for compression, ext in zip(compressions, ('.gz', '.zst')):
+        model_hbjson = model.to_hbjson('test', path, compression=compression)
+        assert model_hbjson.endswith('test.hbjson' + ext)
+        assert os.path.getsize(model_hbjson) < os.path.getsize(model_json)
+        assert Model.from_hbjson(model_hbjson).to_dict() == model_dict
+        # check that the compression is sensed without the file extension
+        renamed_file = os.path.join(path, 'test_compressed.hbjson')
+        os.rename(model_hbjson, renamed_file)
+        assert Model.from_file(renamed_file).to_dict() == model_dict
+        assert Model.from_file(renamed_file, workers=2).to_dict() == model_dict
+        os.remove(renamed_file)
+
+    with pytest.raises(AssertionError):
+        model.to_hbjson('test', path, compression='bz2')
+
+
+def test_to_hbb():
+    """Test the Model to_hbb and from_hbb methods against HBJSON."""
+    model_json = './tests/json/single_family_home.hbjson'
+    model = Model.from_hbjson(model_json)
+
+    path = './tests/json'
+    model_hbb = model.to_hbb('test', path)
+    model_hbjson = model.to_hbjson('test', path)
+    assert os.path.isfile(model_hbb)
+    assert os.path.getsize(model_hbb) < os.path.getsize(model_hbjson)
+    new_model = Model.from_hbb(model_hbb)
+    json_model = Model.from_hbjson(model_hbjson)
+    assert new_model.to_dict() == json_model.to_dict()
+    for room, json_room in zip(new_model.rooms, json_model.rooms):
+        assert room.geometry.is_solid == json_room.geometry.is_solid
+        assert room.volume == pytest.approx(json_room.volume, rel=1e-9)
+
+    file_model = Model.from_file(model_hbb)  # sense the file type
+    assert file_model.to_dict() == json_model.to_dict()
+    worker_model = Model.from_hbb(model_hbb, workers=2)
+    assert worker_model.to_dict() == json_model.to_dict()
+    os.remove(model_hbb)
+    os.remove(model_hbjson)
+
+
 def test_to_stl():
     """Test the Model to_stl method."""
     room = Room.from_box('TinyHouseZone', 5, 10, 3)
@@ -0,0 +1,32 @@
+"""Test the utilities for running operations over a pool of processes."""
+from honeybee.parallel import worker_count, chunk_list, parallel_map
+
+
+def _square(value):
+    return value * value
+
+
+def test_worker_count():
+    """Test the worker_count function."""
+    assert worker_count(None) == 1
+    assert worker_count(3) == 3
+    assert worker_count(0) >= 1
+
+
+def test_chunk_list():
+    """Test the chunk_list function."""
+    items = list(range(10))
+    chunks = chunk_list(items, 3)
+    assert len(chunks) == 3
+    assert [len(c) for c in chunks] == [4, 3, 3]
+    assert [i for c in chunks for i in c] == items
+    assert len(chunk_list(items, 20)) == 10
+    assert chunk_list([], 4) == [[]]
+
+
+def test_parallel_map():
+    """Test the parallel_map function."""
+    inputs = list(range(20))
+    expected = [i * i for i in inputs]
+    assert parallel_map(_square, inputs) == expected
+    assert parallel_map(_square, inputs, 2) == expected
@@ -0,0 +1,38 @@
+"""Test the extension attribute discovery of the Properties classes."""
+from ladybug_geometry.geometry3d import Vector3D
+
+from honeybee.room import Room
+from honeybee.model import Model
+from honeybee.properties import RoomProperties
+
+_moved = []
+
+
+class _DummyRoomProperties(object):
+    """Stand-in for the Room properties of an extension."""
+
+    def __init__(self, host):
+        self.host = host
+
+    def move(self, moving_vec):
+        _moved.append(self.host.identifier)
+
+
+def test_extension_attributes_registered():
+    """Test that the extension attributes are updated when extensions register."""
+    room = Room.from_box('ShoeBox', 5, 10, 3)
+    initial_attrs = room.properties._extension_attributes
+    assert room.properties._extension_attributes is initial_attrs  # cached
+    assert 'dummy' not in initial_attrs
+
+    RoomProperties.dummy = property(lambda self: _DummyRoomProperties(self.host))
+    try:
+        assert 'dummy' in room.properties._extension_attributes
+        assert 'dummy' not in room[0].properties._extension_attributes
+        room.move(Vector3D(0, 0, 1))
+        assert _moved == ['ShoeBox']
+        Model('ShoeBoxModel', [room]).move(Vector3D(0, 0, 1))
+        assert _moved == ['ShoeBox', 'ShoeBox']
+    finally:
+        del RoomProperties.dummy
+    assert room.properties._extension_attributes == initial_attrs
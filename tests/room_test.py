@@ -683,6 +683,21 @@ def test_group_by_adjacency():
     assert len(grouped_rooms[1]) == 5
     for encl in grouped_rooms[2:]:
         assert len(encl) == 1
+    assert [rm.identifier for rm in grouped_rooms[0]] == \
+        ['Zone1', 'Zone2', 'Zone5', 'Zone4', 'Zone3']
+    assert grouped_rooms[2][0].identifier == 'Basement_Zone1'
+
+
+def test_group_by_adjacency_one_way():
+    """Test the group_by_adjacency method with adjacencies that only go one way."""
+    room_1 = Room.from_box('Zone1', 5, 5, 3)
+    room_2 = Room.from_box('Zone2', 5, 5, 3, origin=Point3D(5, 0, 0))
+    room_3 = Room.from_box('Zone3', 5, 5, 3, origin=Point3D(20, 0, 0))
+    room_2[4].boundary_condition = boundary_conditions.surface(room_1[2])
+
+    grouped_rooms = Room.group_by_adjacency([room_1, room_2, room_3])
+    assert [[rm.identifier for rm in grp] for grp in grouped_rooms] == \
+        [['Zone1', 'Zone2'], ['Zone3']]
 
 
 def test_group_by_air_boundary_adjacency():
@@ -861,3 +876,76 @@ def test_writer():
     writers = [mod for mod in dir(room.to) if not mod.startswith('_')]
     for writer in writers:
         assert callable(getattr(room.to, writer))
+
+
+def test_solve_adjacency_spatial_hash():
+    """Test that the spatial hash gives the same result as the brute force method."""
+    def make_rooms():
+        rooms = []
+        for i in range(4):
+            for j in range(4):
+                for k in range(2):
+                    rooms.append(Room.from_box(
+                        'Room_{}_{}_{}'.format(i, j, k), 5, 5, 3,
+                        origin=Point3D(i * 5, j * 5, k * 3)))
+        return rooms
+
+    rooms_hash, rooms_brute = make_rooms(), make_rooms()
+    adj_hash = Room.find_adjacency(rooms_hash, 0.01)
+    adj_brute = Room.find_adjacency(rooms_brute, 0.01, spatial_hash=False)
+    assert len(adj_hash) == 64
+    assert [(f1.identifier, f2.identifier) for f1, f2 in adj_hash] == \
+        [(f1.identifier, f2.identifier) for f1, f2 in adj_brute]
+
+    info_hash = Room.solve_adjacency(rooms_hash, 0.01)
+    info_brute = Room.solve_adjacency(rooms_brute, 0.01, spatial_hash=False)
+    assert len(info_hash['adjacent_faces']) == 64
+    assert [(f1.identifier, f2.identifier) for f1, f2 in info_hash['adjacent_faces']] \
+        == [(f1.identifier, f2.identifier) for f1, f2 in info_brute['adjacent_faces']]
+    for rm_h, rm_b in zip(rooms_hash, rooms_brute):
+        for f_h, f_b in zip(rm_h.faces, rm_b.faces):
+            assert f_h.boundary_condition == f_b.boundary_condition
+
+
+def test_intersect_adjacency_workers():
+    """Test that intersecting adjacencies with workers matches the serial result."""
+    def make_rooms():
+        rooms = [Room.from_box('Big_Room', 10, 10, 3)]
+        for i in range(2):
+            for j in range(2):
+                rooms.append(Room.from_box(
+                    'Room_{}_{}'.format(i, j), 5, 5, 3,
+                    origin=Point3D(i * 5, 10 + j * 5, 0)))
+        rooms.append(Room.from_box('Upper', 7, 7, 3, origin=Point3D(1, 1, 3)))
+        return rooms
+
+    rooms_serial, rooms_workers = make_rooms(), make_rooms()
+    Room.intersect_adjacency(rooms_serial, 0.01, 1)
+    Room.intersect_adjacency(rooms_workers, 0.01, 1, workers=2)
+    assert len(rooms_serial[0].faces) > 6
+    for rm_s, rm_w in zip(rooms_serial, rooms_workers):
+        assert [f.identifier for f in rm_s.faces] == [f.identifier for f in rm_w.faces]
+        assert [f.geometry.vertices for f in rm_s.faces] == \
+            [f.geometry.vertices for f in rm_w.faces]
+    adj_info = Room.solve_adjacency(rooms_workers, 0.01)
+    assert len(adj_info['adjacent_faces']) == 7
+
+
+def test_check_room_volume_collisions():
+    """Test the check_room_volume_collisions method with many Rooms."""
+    rooms = []
+    for i in range(6):
+        for j in range(6):
+            rooms.append(Room.from_box(
+                'Room_{}_{}'.format(i, j), 5, 5, 3, origin=Point3D(i * 5, j * 5, 0)))
+    assert Room.check_room_volume_collisions(rooms, 0.01) == ''
+    rooms.insert(10, Room.from_box('Collide_1', 4, 4, 3, origin=Point3D(7, 7, 0)))
+    rooms.append(Room.from_box('Collide_2', 2, 2, 3, origin=Point3D(14, 29, 0)))
+    rooms.append(Room.from_box('Upper', 30, 30, 3, origin=Point3D(0, 0, 3)))
+    msgs = Room.check_room_volume_collisions(rooms, 0.01, detailed=True)
+    collisions = [tuple(msg['element_id']) for msg in msgs]
+    assert collisions == [
+        ('Room_1_1', 'Collide_1'), ('Room_1_2', 'Collide_1'),
+        ('Collide_1', 'Room_2_1'), ('Collide_1', 'Room_2_2'),
+        ('Room_2_5', 'Collide_2'), ('Room_3_5', 'Collide_2')
+    ]
@@ -0,0 +1,135 @@
+"""Test the spatial hashing utilities."""
+from ladybug_geometry.geometry3d import Point3D, Vector3D, LineSegment3D, Plane
+
+from honeybee.spatial import grid_cell_size, grid_key, neighbor_keys, \
+    point_hash_grid, equivalent_point_pairs, overlapping_rectangle_pairs, \
+    overlapping_box_pairs, BoundingBoxTree, PlaneHashGrid
+
+import math
+
+
+def test_grid_key():
+    """Test the grid_key and neighbor_keys functions."""
+    cell = grid_cell_size(0.01)
+    assert cell == 0.02
+    assert grid_key(Point3D(0.01, -0.01, 0.05), cell) == (0, -1, 2)
+    n_keys = neighbor_keys((0, 0, 0))
+    assert len(n_keys) == 27
+    assert (0, 0, 0) in n_keys
+    assert (-1, 1, -1) in n_keys
+
+
+def test_point_hash_grid():
+    """Test the point_hash_grid function."""
+    pts = [Point3D(0, 0, 0), Point3D(0.001, 0, 0), Point3D(5, 5, 5)]
+    grid = point_hash_grid(pts, 0.02)
+    assert len(grid) == 2
+    assert grid[(0, 0, 0)] == [0, 1]
+
+
+def test_equivalent_point_pairs():
+    """Test that equivalent_point_pairs matches a brute force comparison."""
+    pts = []
+    for i in range(10):
+        for j in range(10):
+            pts.append(Point3D(i * 0.5, j * 0.5, 0))
+            pts.append(Point3D(i * 0.5 + 0.009, j * 0.5 - 0.009, 0.01))
+    brute = []
+    for i, pt in enumerate(pts):
+        for j in range(i + 1, len(pts)):
+            if pt.is_equivalent(pts[j], 0.01):
+                brute.append((i, j))
+    assert equivalent_point_pairs(pts, 0.01) == brute
+    assert len(brute) == 100
+
+
+def test_overlapping_rectangle_pairs():
+    """Test that overlapping_rectangle_pairs matches a brute force comparison."""
+    rects = []
+    for i in range(8):
+        for j in range(8):
+            size = 1 + (i + j) % 3 * 0.5
+            rects.append((i, j, i + size, j + size))
+    rects.append((0, 0, 10, 0.5))
+    tol = 0.01
+    brute_pairs = []
+    for i, r1 in enumerate(rects):
+        for j in range(i + 1, len(rects)):
+            r2 = rects[j]
+            if r1[0] - tol <= r2[2] and r2[0] - tol <= r1[2] and \
+                    r1[1] - tol <= r2[3] and r2[1] - tol <= r1[3]:
+                brute_pairs.append((i, j))
+    assert overlapping_rectangle_pairs(rects, tol) == brute_pairs
+    assert overlapping_rectangle_pairs([], tol) == []
+
+
+def test_overlapping_box_pairs():
+    """Test that overlapping_box_pairs matches a brute force comparison."""
+    boxes = []
+    for i in range(5):
+        for j in range(5):
+            for k in range(3):
+                size = 1 + (i + j + k) % 3 * 0.5
+                boxes.append((i, j, k * 2, i + size, j + size, k * 2 + size))
+    boxes.append((0, 0, 0, 10, 0.5, 10))
+    tol = 0.01
+    brute_pairs = []
+    for i, b1 in enumerate(boxes):
+        for j in range(i + 1, len(boxes)):
+            b2 = boxes[j]
+            if all(b1[d] - tol <= b2[d + 3] and b2[d] - tol <= b1[d + 3]
+                   for d in range(3)):
+                brute_pairs.append((i, j))
+    assert overlapping_box_pairs(boxes, tol) == brute_pairs
+    assert overlapping_box_pairs([], tol) == []
+
+
+def test_bounding_box_tree():
+    """Test that the BoundingBoxTree queries match brute force comparisons."""
+    boxes = []
+    for i in range(6):
+        for j in range(6):
+            for k in range(3):
+                size = 1 + (i + j + k) % 3 * 0.5
+                boxes.append((i * 2, j * 2, k * 2, i * 2 + size, j * 2 + size,
+                              k * 2 + size))
+    tree = BoundingBoxTree(boxes, leaf_size=4)
+    assert len(tree) == len(boxes)
+    assert tree.objects is None
+
+    tol = 0.01
+    assert tree.overlapping_pairs(tol) == overlapping_box_pairs(boxes, tol)
+    assert tree.query_box((3, 3, 3, 3, 3, 3), tol) == \
+        [i for i, b in enumerate(boxes)
+         if b[0] - tol <= 3 <= b[3] + tol and b[1] - tol <= 3 <= b[4] + tol
+         and b[2] - tol <= 3 <= b[5] + tol]
+    assert tree.query_point(Point3D(-1, -1, 0), 0.5) == []
+    assert tree.query_point(Point3D(-1, 0.5, 0.5), 1) == [0]
+    seg = LineSegment3D.from_end_points(Point3D(-1, 0.5, 0.5), Point3D(13, 0.5, 0.5))
+    assert tree.query_segment(seg, tol) == \
+        [i for i, b in enumerate(boxes) if b[1] == 0 and b[2] == 0]
+
+    obj_tree = BoundingBoxTree(boxes[:3], ['a', 'b', 'c'])
+    assert obj_tree.query_point(Point3D(0, 0, 0), 0.1) == ['a']
+    assert BoundingBoxTree([]).query_point(Point3D(0, 0, 0), 1) == []
+
+
+def test_plane_hash_grid():
+    """Test that PlaneHashGrid candidates include all coplanar planes."""
+    planes = []
+    for i in range(30):
+        normal = Vector3D(1, (i % 6) * 0.2, (i % 5) * 0.003).normalize()
+        if i % 3 == 0:
+            normal = normal.reverse()
+        planes.append(Plane(normal, Point3D(i * 0.002, 50 + i, 3)))
+    tol, ang_tol = 0.01, math.radians(1)
+    grid = PlaneHashGrid.from_points([pl.o for pl in planes], tol, ang_tol)
+    for i, pl in enumerate(planes):
+        grid.add(pl.n, pl.o, i)
+    for pl in planes:
+        candidates = grid.candidates(pl.n, pl.o)
+        assert candidates == sorted(set(candidates))
+        for i, oth_pl in enumerate(planes):
+            if pl.is_coplanar_tolerance(oth_pl, tol, ang_tol):
+                assert i in candidates
+    assert len(grid.candidates(Vector3D(0, 0, 1), Point3D(0, 0, 0))) == 0
@@ -0,0 +1,82 @@
+"""Test the batched transforms of Model geometry."""
+import pytest
+from ladybug_geometry.geometry3d import Vector3D, Point3D, Plane, Face3D
+
+import honeybee.model as model_module
+import honeybee.transform as transform_module
+from honeybee.model import Model
+from honeybee.transform import is_available, move_matrix, rotate_matrix, \
+    reflect_matrix, scale_matrix
+
+numpy = pytest.importorskip('numpy')
+
+
+def _assert_close(value_1, value_2):
+    """Assert that two nested structures are equal within floating point error."""
+    if isinstance(value_1, dict):
+        assert set(value_1) == set(value_2)
+        for key in value_1:
+            _assert_close(value_1[key], value_2[key])
+    elif isinstance(value_1, (list, tuple)):
+        assert len(value_1) == len(value_2)
+        for val_1, val_2 in zip(value_1, value_2):
+            _assert_close(val_1, val_2)
+    elif isinstance(value_1, float):
+        assert value_1 == pytest.approx(value_2, abs=1e-9)
+    else:
+        assert value_1 == value_2
+
+
+def test_transform_matrices():
+    """Test that the matrices match the transforms of ladybug_geometry."""
+    pt, origin = Point3D(1.3, 2.7, -0.4), Point3D(0.5, -1, 2)
+    axis = Vector3D(0.3, -0.2, 0.9)
+    cases = (
+        (move_matrix(Vector3D(1, 2, 3)), pt.move(Vector3D(1, 2, 3))),
+        (rotate_matrix(axis, 0.7, origin), pt.rotate(axis, 0.7, origin)),
+        (reflect_matrix(axis.normalize(), origin), pt.reflect(axis.normalize(), origin)),
+        (scale_matrix(2.5, origin), pt.scale(2.5, origin)),
+    )
+    for matrix, expected in cases:
+        result = numpy.array(matrix).dot((pt.x, pt.y, pt.z, 1))
+        assert tuple(result[:3]) == pytest.approx(expected.to_array(), abs=1e-9)
+
+
+@pytest.mark.parametrize('method,args', [
+    ('move', (Vector3D(3, -2, 1.5),)),
+    ('rotate', (Vector3D(0.2, 0.3, 1), 37, Point3D(1, 2, 3))),
+    ('rotate_xy', (33, Point3D(4, 1, 0))),
+    ('reflect', (Plane(Vector3D(1, 0.4, 0.1), Point3D(2, 2, 2)),)),
+    ('scale', (1.7, Point3D(1, 1, 1))),
+    ('convert_to_units', ('Feet',)),
+])
+def test_batch_transform_matches(method, args, monkeypatch):
+    """Test that batched Model transforms match the transforms of each object."""
+    model_json = './tests/json/model_with_holes.hbjson'
+    batch_model = Model.from_hbjson(model_json)
+    object_model = Model.from_hbjson(model_json)
+    getattr(batch_model, method)(*args)
+    monkeypatch.setattr(model_module, 'batch_transform_available', lambda: False)
+    getattr(object_model, method)(*args)
+
+    _assert_close(batch_model.to_dict(), object_model.to_dict())
+    for room_1, room_2 in zip(batch_model.rooms, object_model.rooms):
+        assert room_1.geometry.is_solid == room_2.geometry.is_solid
+        assert room_1.volume == pytest.approx(room_2.volume, rel=1e-9)
+        _assert_close([f.to_dict() for f in room_1.geometry.faces],
+                      [f.to_dict() for f in room_2.geometry.faces])
+
+
+def test_batch_transform_unavailable(monkeypatch):
+    """Test that Models are transformed by object if ladybug_geometry has changed."""
+    model_json = './tests/json/model_with_holes.hbjson'
+    batch_model = Model.from_hbjson(model_json)
+    batch_model.move(Vector3D(3, -2, 1.5))
+    assert is_available()
+    monkeypatch.setattr(transform_module, '_GEOMETRY_ATTRIBUTES',
+                        transform_module._GEOMETRY_ATTRIBUTES +
+                        ((Face3D, ('_not_an_attribute',)),))
+    assert not is_available()
+    object_model = Model.from_hbjson(model_json)
+    object_model.move(Vector3D(3, -2, 1.5))
+    _assert_close(batch_model.to_dict(), object_model.to_dict())
@@ -0,0 +1,96 @@
+"""Test the ValidationCache class."""
+import os
+import json
+import shutil
+
+from honeybee.model import Model
+from honeybee.validationcache import ValidationCache
+
+from ladybug_geometry.geometry3d import Vector3D
+
+
+def test_validation_cache_check_all():
+    """Test that the results of a cached check_all match those without a cache."""
+    model = Model.from_file('./tests/json/bad_geometry_model.hbjson')
+    for detailed in (False, True):
+        cache = ValidationCache()
+        base_report = model.check_all(False, detailed)
+        assert model.check_all(False, detailed, validation_cache=cache) == base_report
+        assert len(cache) == len(model.rooms)
+        assert model.check_all(False, detailed, validation_cache=cache) == base_report
+        assert len(cache) == len(model.rooms)
+
+
+def test_validation_cache_changed_rooms():
+    """Test that only the Rooms that have changed are re-checked."""
+    model = Model.from_file('./tests/json/single_family_home.hbjson')
+    cache = ValidationCache()
+    model.check_all(False, validation_cache=cache)
+    init_count = len(cache)
+    assert init_count == len(model.rooms)
+
+    model.rooms[0].move(Vector3D(0, 0, 1))
+    model.rooms[1].display_name = 'New Room Name'
+    model.check_all(False, validation_cache=cache)
+    assert len(cache) == init_count + 2
+    cache.prune()
+    model.check_all(False, validation_cache=cache)
+    cache.prune()
+    assert len(cache) == init_count
+
+
+def test_validation_cache_to_from_file():
+    """Test the writing and reading of a ValidationCache next to a model file."""
+    model_file = './tests/json/bad_geometry_model_cache.hbjson'
+    shutil.copy('./tests/json/bad_geometry_model.hbjson', model_file)
+    cache_file = ValidationCache.cache_file_path(model_file)
+    assert cache_file == model_file + '.hbvc'
+    cache = ValidationCache.from_file(cache_file)
+    assert len(cache) == 0
+
+    model = Model.from_file(model_file)
+    base_report = model.check_all(False, True)
+    model.check_all(False, True, validation_cache=cache)
+    cache.to_file(cache_file)
+    assert os.path.isfile(cache_file)
+
+    new_cache = ValidationCache.from_file(cache_file)
+    assert len(new_cache) == len(cache)
+    assert new_cache.fingerprints == cache.fingerprints
+    assert model.check_all(False, True, validation_cache=new_cache) == base_report
+    os.remove(model_file)
+    os.remove(cache_file)
+
+
+def test_validation_cache_json_file():
+    """Test that the ValidationCache file is plain JSON and invalid files are ignored."""
+    model = Model.from_file('./tests/json/bad_geometry_model.hbjson')
+    cache = ValidationCache()
+    model.check_all(False, True, validation_cache=cache)
+    cache_file = './tests/json/test_cache.hbvc'
+    cache.to_file(cache_file)
+    with open(cache_file) as inf:
+        data = json.load(inf)
+    assert data['type'] == 'ValidationCache'
+    assert len(data['results']) == len(model.rooms)
+
+    with open(cache_file) as inf:
+        cache_str = inf.read()
+    invalid_contents = (
+        cache_str[:len(cache_str) // 2],  # a partially written file
+        '{"type": "ValidationCache"}',
+        '[]',
+        '{"type": "Model", "results": {}}'
+    )
+    for content in invalid_contents:
+        with open(cache_file, 'w') as outf:
+            outf.write(content)
+        assert len(ValidationCache.from_file(cache_file)) == 0
+    with open(cache_file, 'wb') as outf:
+        outf.write(b'\x80\x02}q\x00.')  # a pickle instead of JSON
+    assert len(ValidationCache.from_file(cache_file)) == 0
+
+    cache.to_file(cache_file)  # replace the invalid file
+    assert len(ValidationCache.from_file(cache_file)) == len(model.rooms)
+    assert not any(f.endswith('.tmp') for f in os.listdir('./tests/json'))
+    os.remove(cache_file)